@@ -1,3 +1,4 @@
 # coding: utf-8
 
+from .compare import compare, compare_many
 from .core import PytestDjangoModel
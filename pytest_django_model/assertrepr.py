@@ -0,0 +1,149 @@
+# coding: utf-8
+
+import sys
+
+from _pytest import skipping
+
+from .objects import AttributeObject, get_lazy_cls
+from .schema import get_schema_lines
+from .utils import a_or_an
+
+try:
+    from _pytest._io.saferepr import saferepr
+except ImportError:  # pragma: no cover
+    from py.io import saferepr
+
+# Maximum size of the repr of each compared value, multiplied by 4 with -v and
+# unlimited with -vv.
+REPR_MAXSIZE = 240
+
+
+def get_repr_maxsize(verbosity):
+    if verbosity >= 2:
+        return sys.maxsize
+
+    return REPR_MAXSIZE * 4 ** max(verbosity, 0)
+
+
+def get_value_repr(value, maxsize):
+    """Return the repr of value, cut in its middle to maxsize characters. Up to the
+    default size, the repr of large containers isn't built beyond what is shown.
+    """
+    if maxsize <= REPR_MAXSIZE:
+        return saferepr(value, maxsize)
+
+    try:
+        value_repr = repr(value)
+    except Exception:
+        return saferepr(value, maxsize)
+
+    if len(value_repr) > maxsize:
+        start = (maxsize - 3) // 2
+        end = maxsize - 3 - start
+        return f"{value_repr[:start]}...{value_repr[len(value_repr) - end:]}"
+
+    return value_repr
+
+
+def get_cls(attribute_object):
+    """Return the class of an AttributeObject, lazy strings being str if they're
+    compared as such.
+    """
+    if attribute_object.lazy_strings:
+        return get_lazy_cls(attribute_object.cls)
+    else:
+        return attribute_object.cls
+
+
+def get_mismatch_lines(left, right, maxsize=sys.maxsize):
+    """Return the lines explaining why the AttributeObject left and right differ,
+    with their values cut to maxsize characters, or an empty list if they don't.
+    """
+    value_repr = lambda x: get_value_repr(x.value, maxsize)
+
+    if left.value is NotImplemented:
+        return [
+            f"{left.breadcrumb} doesn't exist, the expected value is:",
+            f"  - {right.cls.__name__}: {value_repr(right)}",
+        ]
+    elif right.value is NotImplemented:
+        return [
+            f"The '{right.parents}' class shouldn't have a '{right.name}' attribute."
+        ]
+    elif get_cls(left) != get_cls(right):
+        return [
+            f"{left.breadcrumb} and {right.breadcrumb} are not the same type:",
+            f"  - {left.breadcrumb} is {a_or_an(left.cls.__name__)} {left.cls}",
+            f"  - {right.breadcrumb} is {a_or_an(right.cls.__name__)} {right.cls}",
+        ]
+    elif left.value != right.value:
+        return [
+            f"{left.breadcrumb} and {right.breadcrumb} don't have the same value.",
+            f"  - {left.breadcrumb} value is: {value_repr(left)}",
+            f"  - {right.breadcrumb} value is: {value_repr(right)}",
+        ]
+
+    return []
+
+
+def get_xfail_raises(item):
+    """Return the exceptions expected by the xfail mark of item, as evaluated by
+    pytest, or None if item isn't expected to fail.
+    """
+    store = item.stash if hasattr(item, "stash") else getattr(item, "_store", None)
+    if store is None:
+        return None
+
+    # pytest >= 6.0
+    if hasattr(skipping, "xfailed_key"):
+        xfailed = store.get(skipping.xfailed_key, None)
+        if xfailed is None:
+            return None
+        raises = xfailed.raises
+    # pytest 5.4
+    elif hasattr(skipping, "evalxfail_key"):
+        evalxfail = store.get(skipping.evalxfail_key, None)
+        if evalxfail is None or not evalxfail.istrue():
+            return None
+        raises = evalxfail.get("raises")
+    else:
+        return None
+
+    return raises or BaseException
+
+
+class AssertRepr:
+    """Render failed comparisons of AttributeObject for pytest assertion reports.
+    """
+
+    def __init__(self):
+        self.item = None
+
+    def is_xfail(self):
+        """Check if the running test is expected to fail with an AssertionError, so
+        its failures aren't rendered.
+        """
+        if self.item is None or self.item.config.getoption("runxfail", False):
+            return False
+
+        raises = get_xfail_raises(self.item)
+        return raises is not None and issubclass(AssertionError, raises)
+
+    def __call__(self, left, right, verbosity=0):
+        """Return the explanation of a failed comparison as a list of lines, or None
+        if it isn't a comparison of AttributeObject.
+        """
+        if not isinstance(left, AttributeObject) or not isinstance(
+            right, AttributeObject
+        ):
+            return None
+
+        summary = f"{left.breadcrumb} == {right.breadcrumb}"
+        if self.is_xfail():
+            return [summary]
+
+        lines = get_mismatch_lines(left, right, get_repr_maxsize(verbosity))
+        return [summary, *lines, *get_schema_lines(left, right)]
+
+
+assert_repr = AssertRepr()
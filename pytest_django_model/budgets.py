@@ -0,0 +1,97 @@
+# coding: utf-8
+
+from time import perf_counter
+
+from django.core.exceptions import ValidationError
+from django.db import connections, router
+from django.test.utils import CaptureQueriesContext
+
+# Meta Options of Test Classes declaring budgets on the behaviour of the Model.
+BUDGET_OPTIONS = ("max_init_time", "max_full_clean_queries", "max_save_queries")
+
+# Number of instances created to measure the time of one.
+INIT_REPEAT = 100
+
+
+def get_instance_kwargs(instance_kwargs):
+    """Return the kwargs of the instances, instance_kwargs being a dict or a
+    callable returning it, called inside the test to create related objects.
+    """
+    if callable(instance_kwargs):
+        return instance_kwargs()
+
+    return dict(instance_kwargs or {})
+
+
+def measure_init_time(model, kwargs, repeat=INIT_REPEAT):
+    """Return the mean time in seconds to create an instance of model.
+    """
+    start = perf_counter()
+    for _ in range(repeat):
+        model(**kwargs)
+
+    return (perf_counter() - start) / repeat
+
+
+def capture_queries(model, func):
+    """Call func and return the SQL of the queries it runs on the database of model.
+    """
+    connection = connections[router.db_for_write(model)]
+    with CaptureQueriesContext(connection) as context:
+        func()
+
+    return [query["sql"] for query in context.captured_queries]
+
+
+def get_queries_msg(name, method, queries, budget):
+    lines = "\n".join(f"  - {sql}" for sql in queries)
+    return (
+        f"{name}.{method}() runs {len(queries)} queries, over the budget of "
+        f"{budget}:\n{lines}"
+    )
+
+
+def check_budgets(
+    model,
+    model_object,
+    max_init_time=None,
+    max_full_clean_queries=None,
+    max_save_queries=None,
+    instance_kwargs=None,
+):
+    """Fail if creating, cleaning or saving an instance of model exceeds the given
+    budgets.
+    """
+    name = model.__name__
+    kwargs = get_instance_kwargs(instance_kwargs)
+
+    msgs = list()
+    if max_init_time is not None:
+        init_time = measure_init_time(model, kwargs)
+        if init_time > max_init_time:
+            msgs.append(
+                f"{name}() takes {init_time * 1e6:.1f}us per instance, over the "
+                f"budget of {max_init_time * 1e6:.1f}us."
+            )
+
+    instance = model(**kwargs)
+    if max_full_clean_queries is not None:
+        try:
+            queries = capture_queries(model, instance.full_clean)
+        except ValidationError as e:
+            msgs.append(
+                f"{name}.full_clean() can't be measured, the instance created from "
+                f"instance_kwargs isn't valid: {'; '.join(e.messages)}"
+            )
+        else:
+            if len(queries) > max_full_clean_queries:
+                msgs.append(
+                    get_queries_msg(name, "full_clean", queries, max_full_clean_queries)
+                )
+
+    if max_save_queries is not None:
+        queries = capture_queries(model, instance.save)
+        if len(queries) > max_save_queries:
+            msgs.append(get_queries_msg(name, "save", queries, max_save_queries))
+
+    assert not msgs, "\n".join(msgs)
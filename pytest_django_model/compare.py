@@ -0,0 +1,157 @@
+# coding: utf-8
+
+from collections import namedtuple
+
+from django.db.models import Field
+from django.db.models.base import ModelBase
+
+from .assertrepr import get_cls, get_mismatch_lines
+from .core import (
+    SPEC_OPTIONS,
+    InvalidModelError,
+    PytestDjangoModel,
+    get_invalid_model_msg,
+)
+from .objects import compare_model_objects, get_declared_model_object, get_model_object
+from .utils import is_dunder, isolate_django_models
+
+# Meta attributes of a spec which aren't Meta Options.
+SPEC_META_ATTRS = ("model", "models", "parents", "abstract_spec", *SPEC_OPTIONS)
+
+
+class Mismatch(namedtuple("Mismatch", ["original", "tester"])):
+    """An attribute of a spec which differs from the attribute of the model, as a
+    pair of AttributeObject.
+    """
+
+    @property
+    def breadcrumb(self):
+        return self.tester.breadcrumb
+
+    @property
+    def kind(self):
+        if self.original.value is NotImplemented:
+            return "missing"
+        elif get_cls(self.original) != get_cls(self.tester):
+            return "type"
+        else:
+            return "value"
+
+    @property
+    def message(self):
+        return "\n".join(get_mismatch_lines(self.original, self.tester))
+
+
+class Comparison(namedtuple("Comparison", ["model", "spec", "mismatches"])):
+    """Result of the comparison of a model with a spec.
+    """
+
+    def __bool__(self):
+        return not self.mismatches
+
+
+class ModelComparator:
+    """Compare models with spec declarations without a pytest session.
+
+    Data of models and of spec classes is cached, so comparing them again only
+    costs the comparison of their attributes.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.model_objects = dict()
+        self.spec_objects = dict()
+
+    def get_model_object(self, model):
+        if not isinstance(model, ModelBase):
+            raise InvalidModelError(get_invalid_model_msg(model))
+
+        if model not in self.model_objects:
+            self.model_objects[model] = get_model_object(model)
+
+        return self.model_objects[model]
+
+    def get_spec_dct(self, spec):
+        """Return the declarations of spec, a class or a dict, as a dict with a
+        Meta inner class only holding Meta Options.
+        """
+        dct = dict(spec) if isinstance(spec, dict) else dict(vars(spec))
+        meta = dct.get("Meta", None)
+
+        meta_options = {
+            option: value
+            for option, value in (vars(meta).items() if meta else ())
+            if not is_dunder(option) and option not in SPEC_META_ATTRS
+        }
+        dct["Meta"] = type("Meta", (), meta_options)
+
+        return dct, getattr(meta, "parents", None)
+
+    @staticmethod
+    def get_parents(parents):
+        """Return parents, a model or a list of models, as a tuple or None.
+        """
+        if isinstance(parents, ModelBase):
+            return (parents,)
+
+        return tuple(parents) if parents else None
+
+    def get_spec_object(self, model, spec, parents=None):
+        """Retrieve Tester data from spec, from its declarations if possible, else
+        from a Django Model built and removed right away. Spec isn't validated.
+        """
+        parents = self.get_parents(parents)
+        key = (model, spec, parents) if isinstance(spec, type) else None
+        if key in self.spec_objects:
+            return self.spec_objects[key]
+
+        dct, meta_parents = self.get_spec_dct(spec)
+        parents = parents or self.get_parents(meta_parents)
+
+        name = getattr(spec, "__name__", f"{model.__name__}Spec")
+        has_id = isinstance(dct.get("id", None), Field)
+        cleaned_dct = PytestDjangoModel.get_cleaned_tester(PytestDjangoModel, dct)
+
+        spec_object = get_declared_model_object(
+            name,
+            cleaned_dct,
+            app_label=model._meta.app_label,
+            parents=parents,
+            has_id=has_id,
+        )
+        if spec_object is None:
+            # Fields of spec are copied, they can't be contributed to a Model twice.
+            fields = [attr for attr, value in dct.items() if isinstance(value, Field)]
+            with isolate_django_models(model._meta.app_label):
+                tester = PytestDjangoModel.get_tester(
+                    PytestDjangoModel, name, dct, model, parents, fields
+                )
+                spec_object = get_model_object(tester, has_id=has_id)
+
+        if key is not None:
+            self.spec_objects[key] = spec_object
+
+        return spec_object
+
+    def __call__(self, model, spec, parents=None):
+        """Compare model with spec, a plain class or a dict declared like a Test
+        Class, and return a Comparison.
+        """
+        mismatches = compare_model_objects(
+            self.get_model_object(model), self.get_spec_object(model, spec, parents)
+        )
+
+        return Comparison(
+            model, spec, [Mismatch(original, tester) for original, tester in mismatches]
+        )
+
+
+compare = ModelComparator()
+
+
+def compare_many(pairs):
+    """Compare each (model, spec) pair and return the list of Comparison.
+    """
+    return [compare(model, spec) for model, spec in pairs]
@@ -1,13 +1,45 @@
 # coding: utf-8
 import re
+from copy import deepcopy
+from fnmatch import fnmatchcase
+from functools import partial
 from inspect import isclass, isfunction
+from time import perf_counter
 
+import pytest
+from django.apps import apps
 from django.db.models import Field, Model
 from django.db.models.base import ModelBase
 
+from .budgets import BUDGET_OPTIONS, check_budgets
 from .file import FileGenerator
-from .objects import get_model_object
-from .utils import a_or_an, delete_django_model, is_dunder, pytest_exit
+from .fingerprints import get_fingerprint
+from .impact import get_spec_path, impact_index
+from .lint import check_indexes
+from .plans import check_query_plans
+from .report import model_report
+from .schema import LARGE_TABLE_ROWS, check_schema_changes
+from .objects import (
+    compare_model_objects,
+    get_declared_model_object,
+    get_model_object,
+)
+from .shard import get_spec_id, model_sharder
+from .storage import check_storage
+from .utils import a_or_an, is_dunder, isolate_django_models, pytest_exit
+
+
+# Options of a Test Class Meta which aren't Meta Options of the Tester Model.
+SPEC_OPTIONS = (
+    "instance_kwargs",
+    "lint_indexes",
+    "max_indexes",
+    "max_row_width",
+    "query_plans",
+    "storage_vendor",
+    "table_rows",
+    *BUDGET_OPTIONS,
+)
 
 
 class InvalidModelError(AttributeError, NameError):
@@ -28,6 +60,17 @@ def get_invalid_model_msg(obj):
     return msg
 
 
+def get_meta_options(meta):
+    """Return the options declared in a Meta inner class as a dict.
+    """
+    if meta is None:
+        return dict()
+
+    return {
+        option: value for option, value in vars(meta).items() if not is_dunder(option)
+    }
+
+
 def is_django_model_attr(attr, value):
     """Check if the given attribute is a Django Model attr or a Test Class attr.
     """
@@ -38,31 +81,54 @@ def is_django_model_attr(attr, value):
 
 
 class PytestDjangoModel(type):
+    # Build and check a Django Model from the declarations of each Test Class.
+    validation = True
+    # Check that default ordering, get_latest_by and ForeignKeys are indexed.
+    lint_indexes = False
+    # Rows from which the migrations of a table declaring table_rows are checked.
+    large_table_rows = LARGE_TABLE_ROWS
+    # Validated Tester data of Test Classes inheriting abstract specs, shared by
+    # those with the same declarations.
+    tester_data = dict()
+
     def __new__(cls, name, bases, dct):
+        start = perf_counter()
+
+        # Inherit Declarations
+        ######################
+        declarations = cls.get_inherited_declarations(cls, bases)
+        if cls.is_abstract(cls, dct):
+            return cls.get_abstract_class(cls, name, bases, dct, declarations)
+        elif declarations:
+            dct = cls.inherit_declarations(cls, dct, declarations)
+
         # Retrieve Data
         ###############
         meta = cls.get_meta(cls, name, dct)
+        if cls.is_template(cls, meta):
+            return cls.get_template_class(cls, name, bases, dct, declarations, start)
 
         original = cls.get_original(cls, meta)
-        original_name = original._meta.object_name
 
         parents = cls.get_parents(cls, meta)
 
+        spec_options = cls.get_spec_options(cls, meta)
+
+        # Select Test Class
+        ###################
+        spec_id = get_spec_id(name, dct)
+        if not cls.is_selected(cls, spec_id, dct, original, parents, declarations):
+            return cls.get_deselected_class(cls, name, bases, dct)
+
         tester_name = name
         tester_has_id = isinstance(dct.get("id", None), Field)
-        tester = cls.get_tester(cls, tester_name, dct, original, parents)
-
-        # Validate Data
-        ###############
-        cls.validate_data(cls, name, tester, tester_name, original_name)
 
         # Create Data
         #############
         OriginalObject = get_model_object(original)
-        TesterObject = get_model_object(tester, has_id=tester_has_id)
-        # Remove tester from django cache
-        delete_django_model(original._meta.app_label, tester_name)
-
+        TesterObject = cls.get_tester_object(
+            cls, tester_name, dct, original, parents, tester_has_id, declarations
+        )
         # Get Test Functions
         generated_file = FileGenerator(OriginalObject, TesterObject)
         test_functions = generated_file.get_functions()
@@ -79,11 +145,329 @@ class PytestDjangoModel(type):
         # Add OriginalObject to dct.
         new_dct["_meta"].model = OriginalObject
 
+        # Records of the report, written when the first test of the class runs.
+        if model_report.enabled:
+            new_dct["_report"] = (spec_id, original, OriginalObject, TesterObject)
+
         # Inject test_functions to new_dct.
         new_dct.update(test_functions)
+        new_dct.update(
+            cls.get_spec_tests(
+                cls, spec_options, (original,), OriginalObject, TesterObject
+            )
+        )
+
+        model_sharder.record(spec_id, perf_counter() - start)
 
         return super().__new__(cls, name, bases, new_dct)
 
+    def is_abstract(cls, dct):
+        """Check if the Test Class only declares attributes for other Test Classes.
+        """
+        meta = dct.get("Meta", None)
+
+        return bool(getattr(meta, "abstract_spec", False))
+
+    def get_declarations(cls, dct):
+        """Retrieve Constants, Fields and Meta Options declared in dct, and
+        deconstruct the Fields once for all the Test Classes inheriting them. The
+        source file of dct is kept for the impact index.
+        """
+        meta_options = get_meta_options(dct.get("Meta", None))
+        meta_options.pop("abstract_spec", None)
+
+        attrs = cls.get_cleaned_tester(cls, dct)
+        attrs.pop("Meta", None)
+
+        fields = {
+            attr: value.deconstruct()[3]
+            for attr, value in attrs.items()
+            if isinstance(value, Field)
+        }
+        # Fingerprint of the declarations, or None if a part of them can't be
+        # fingerprinted.
+        fingerprint = get_fingerprint(
+            (
+                {
+                    attr: (value.__class__, fields.get(attr, value))
+                    for attr, value in attrs.items()
+                },
+                meta_options,
+            )
+        )
+
+        return {
+            "attrs": attrs,
+            "meta": meta_options,
+            "fields": fields,
+            "fingerprint": fingerprint,
+            "paths": frozenset(filter(None, [get_spec_path(dct)])),
+        }
+
+    def merge_declarations(cls, declarations, other):
+        """Merge two declarations, the other one taking precedence.
+        """
+        if not declarations:
+            return other
+
+        fields = {
+            attr: value
+            for attr, value in declarations["fields"].items()
+            if attr not in other["attrs"]
+        }
+
+        return {
+            "attrs": {**declarations["attrs"], **other["attrs"]},
+            "meta": {**declarations["meta"], **other["meta"]},
+            "fields": {**fields, **other["fields"]},
+            "fingerprint": (
+                (declarations["fingerprint"], other["fingerprint"])
+                if declarations["fingerprint"] and other["fingerprint"]
+                else None
+            ),
+            "paths": declarations["paths"] | other["paths"],
+        }
+
+    def get_inherited_declarations(cls, bases):
+        """Retrieve declarations of abstract Test Classes in bases, the first ones
+        taking precedence.
+        """
+        declarations = None
+        for base in reversed(bases):
+            base_declarations = getattr(base, "_declarations", None)
+            if base_declarations:
+                declarations = cls.merge_declarations(
+                    cls, declarations, base_declarations
+                )
+
+        return declarations
+
+    def get_abstract_class(cls, name, bases, dct, declarations):
+        """Return a Test Class without tests, holding its declarations for the Test
+        Classes inheriting it.
+        """
+        new_dct = cls.get_cleaned_dct(cls, dct)
+        new_dct["__test__"] = False
+        new_dct["_declarations"] = cls.merge_declarations(
+            cls, declarations, cls.get_declarations(cls, dct)
+        )
+
+        return type.__new__(cls, name, bases, new_dct)
+
+    def inherit_declarations(cls, dct, declarations):
+        """Return a copy of dct with inherited Constants, Fields and Meta Options.
+        """
+        meta_options = get_meta_options(dct.get("Meta", None))
+
+        # Test Classes inheriting an abstract spec are collected, unlike it.
+        dct = {"__test__": True, **declarations["attrs"], **dct}
+        if "Meta" in dct or declarations["meta"]:
+            dct["Meta"] = type("Meta", (), {**declarations["meta"], **meta_options})
+
+        return dct
+
+    def is_template(cls, meta):
+        """Check if the Test Class is a Template applied to several Models.
+        """
+        return hasattr(meta, "models")
+
+    def get_template_class(cls, name, bases, dct, declarations, start):
+        """Return a Test Class comparing every Model of the Template with its
+        declarations, which are only retrieved once.
+        """
+        meta = dct["Meta"]
+        models = cls.get_models(cls, meta)
+        parents = cls.get_parents(cls, meta)
+        spec_options = cls.get_spec_options(cls, meta)
+        meta_options = get_meta_options(meta)
+
+        spec_id = get_spec_id(name, dct)
+        dependencies = (*(parents or ()), *models[1:])
+        if not cls.is_selected(
+            cls, spec_id, dct, models[0], dependencies, declarations
+        ):
+            return cls.get_deselected_class(cls, name, bases, dct)
+
+        tester_has_id = isinstance(dct.get("id", None), Field)
+        TesterObject = cls.get_tester_object(
+            cls, name, dct, models[0], parents, tester_has_id, declarations
+        )
+
+        new_dct = cls.get_cleaned_dct(cls, dct)
+        new_dct.update(cls.inject_tester_dct(cls, dct, dict(TesterObject.__dict__)))
+        new_dct["_meta"].models = models
+        new_dct.update(
+            cls.get_template_test(cls, spec_id, TesterObject, models, meta_options)
+        )
+        new_dct.update(
+            cls.get_spec_tests(
+                cls,
+                spec_options,
+                models,
+                tester_object=TesterObject,
+                meta_options=meta_options,
+            )
+        )
+
+        model_sharder.record(spec_id, perf_counter() - start)
+
+        return type.__new__(cls, name, bases, new_dct)
+
+    def get_template_test(cls, spec_id, tester_object, models, meta_options):
+        """Return a Test Function parametrized with the Models of a Template, with
+        one result per Model.
+        """
+
+        @pytest.mark.parametrize(
+            "model", models, ids=[model._meta.label for model in models]
+        )
+        def test_models(self, model):
+            # Imported here, the plugin module imports this one.
+            from .plugin import assert_msg
+
+            original_object = get_model_object(model)
+            if model_report.enabled:
+                model_report.write(
+                    spec_id, model, original_object, tester_object, meta_options
+                )
+
+            mismatches = compare_model_objects(
+                original_object, tester_object, meta_options
+            )
+            assert not mismatches, "\n".join(
+                assert_msg(original, tester) for original, tester in mismatches
+            )
+
+        return {"test_models": test_models}
+
+    def get_spec_options(cls, meta):
+        """Retrieve options of the Test Class which aren't Meta Options, remove
+        them from meta and return them as a dict.
+        """
+        spec_options = dict()
+        for option in SPEC_OPTIONS:
+            if hasattr(meta, option):
+                spec_options[option] = getattr(meta, option)
+                delattr(meta, option)
+
+        return spec_options
+
+    def get_spec_tests(
+        cls,
+        spec_options,
+        models,
+        original_object=None,
+        tester_object=None,
+        meta_options=None,
+    ):
+        """Return the Test Functions enabled by the options of the Test Class, or
+        for the whole session. tester_object and meta_options are the declarations
+        compared with the Models.
+        """
+        tests = dict()
+        if spec_options.get("lint_indexes", cls.lint_indexes):
+            tests["test_indexes"] = cls.get_spec_test(
+                cls, check_indexes, models, original_object
+            )
+
+        query_plans = spec_options.get("query_plans", False)
+        if query_plans:
+            lookups = query_plans if isinstance(query_plans, (list, tuple)) else ()
+            tests["test_query_plans"] = cls.get_spec_test(
+                cls,
+                partial(check_query_plans, lookups=lookups),
+                models,
+                original_object,
+                marks=(pytest.mark.django_db,),
+            )
+
+        storage_budgets = {
+            option: spec_options[option]
+            for option in ("max_row_width", "max_indexes")
+            if spec_options.get(option, None) is not None
+        }
+        if storage_budgets:
+            vendor = spec_options.get("storage_vendor", None)
+            tests["test_storage"] = cls.get_spec_test(
+                cls,
+                partial(check_storage, vendor=vendor, **storage_budgets),
+                models,
+                original_object,
+            )
+
+        budgets = {
+            option: spec_options[option]
+            for option in BUDGET_OPTIONS
+            if spec_options.get(option, None) is not None
+        }
+        if budgets:
+            instance_kwargs = spec_options.get("instance_kwargs", None)
+            tests["test_budgets"] = cls.get_spec_test(
+                cls,
+                partial(check_budgets, instance_kwargs=instance_kwargs, **budgets),
+                models,
+                original_object,
+                marks=(pytest.mark.django_db,),
+            )
+
+        table_rows = spec_options.get("table_rows", None)
+        if table_rows is not None and tester_object is not None:
+            tests["test_schema_changes"] = cls.get_spec_test(
+                cls,
+                partial(
+                    check_schema_changes,
+                    tester_object=tester_object,
+                    table_rows=table_rows,
+                    vendor=spec_options.get("storage_vendor", None),
+                    large_table_rows=cls.large_table_rows,
+                    meta_options=meta_options,
+                ),
+                models,
+                original_object,
+            )
+
+        return tests
+
+    def get_spec_test(cls, check, models, original_object=None, marks=()):
+        """Return a Test Function calling check with the original Model and its
+        ModelObject, or parametrized with the Models of a Template.
+        """
+        if original_object is not None:
+            (original,) = models
+
+            def test(self):
+                check(original, self._meta.model)
+
+        else:
+
+            @pytest.mark.parametrize(
+                "model", models, ids=[model._meta.label for model in models]
+            )
+            def test(self, model):
+                check(model, get_model_object(model))
+
+        for mark in marks:
+            test = mark(test)
+
+        return test
+
+    def is_selected(cls, spec_id, dct, original, parents, declarations=None):
+        """Check if the Test Class is affected by the changed files, including those
+        of the abstract specs it inherits, and belongs to the current shard.
+        """
+        spec_paths = declarations["paths"] if declarations else ()
+        return impact_index.is_selected(
+            spec_id, dct, original, parents, spec_paths
+        ) and model_sharder.is_selected(spec_id, dct)
+
+    def get_deselected_class(cls, name, bases, dct):
+        """Return a Test Class without tests, for deselected Test Classes.
+        """
+        new_dct = cls.get_cleaned_dct(cls, dct)
+        new_dct["__test__"] = False
+
+        return type.__new__(cls, name, bases, new_dct)
+
     def get_meta(cls, cls_name, dct):
         """Retrieve Meta, raise an Error if it isn't found.
         """
@@ -116,6 +500,44 @@ class PytestDjangoModel(type):
         except Exception as e:
             pytest_exit(e)
 
+    def get_models(cls, meta):
+        """Retrieve Models of a Template, given as a list of Models or as a pattern
+        matching app labels or Model labels, and return them as a tuple.
+        """
+        try:
+            models = meta.models
+            delattr(meta, "models")
+            if isinstance(models, str):
+                models = tuple(
+                    sorted(
+                        (
+                            model
+                            for model in apps.get_models()
+                            if fnmatchcase(model._meta.app_label, models)
+                            or fnmatchcase(model._meta.label, models)
+                        ),
+                        key=lambda model: model._meta.label,
+                    )
+                )
+            elif isinstance(models, (list, tuple)):
+                for model in models:
+                    if not isinstance(model, ModelBase):
+                        error_msg = get_invalid_model_msg(model)
+                        raise InvalidModelError(
+                            f"'models' contains invalid model: {error_msg}"
+                        )
+                models = tuple(models)
+            else:
+                error_msg = get_invalid_model_msg(models)
+                raise InvalidModelError(f"'models': {error_msg}")
+
+            if not models:
+                raise ModelNotFoundError(f"'models' doesn't match any model.")
+
+            return models
+        except Exception as e:
+            pytest_exit(e)
+
     def get_parents(cls, meta):
         """Retrieve Parents Models and return them as dict.
         """
@@ -155,11 +577,15 @@ class PytestDjangoModel(type):
             if is_django_model_attr(attr, value)
         }
 
-    def get_tester(cls, name, dct, original, parents):
+    def get_tester(cls, name, dct, original, parents, inherited=()):
         """Make a cleaned copy of the given class and return it.
         """
         dct = cls.get_cleaned_tester(cls, dct)
 
+        # Copy inherited Fields, they can't be contributed to several Models.
+        for attr in inherited:
+            dct[attr] = deepcopy(dct[attr])
+
         # Add Original Module
         dct["__module__"] = original.__module__
 
@@ -173,6 +599,88 @@ class PytestDjangoModel(type):
 
         return type(name, parents, dct)
 
+    def get_tester_object(cls, name, dct, original, parents, has_id, declarations):
+        """Retrieve Tester data from the declarations of the given class. The Tester
+        Model is only built when validation is enabled, or when the declarations
+        can't be retrieved without it.
+        """
+        # Inherited Fields which weren't overridden, and their deconstructions.
+        inherited = {
+            attr: attrs
+            for attr, attrs in (declarations or {"fields": {}})["fields"].items()
+            if dct.get(attr, None) is declarations["attrs"][attr]
+        }
+
+        if not cls.validation:
+            app_config = apps.get_containing_app_config(original.__module__)
+            tester_object = get_declared_model_object(
+                name,
+                cls.get_cleaned_tester(cls, dct),
+                app_label=app_config.label if app_config else None,
+                parents=parents,
+                has_id=has_id,
+                deconstructed=inherited,
+            )
+            if tester_object:
+                return tester_object
+
+        key = cls.get_tester_key(cls, dct, original, parents, declarations)
+        data = cls.tester_data.get(key, None) if key else None
+        if data is None:
+            # Remove tester, its auto created models and its pending relations
+            # from django cache.
+            with isolate_django_models(original._meta.app_label):
+                tester = cls.get_tester(cls, name, dct, original, parents, inherited)
+
+                # Validate Data
+                ###############
+                if cls.validation:
+                    original_name = original._meta.object_name
+                    cls.validate_data(cls, name, tester, name, original_name)
+
+                data = get_model_object.get_data(tester)
+
+            if key:
+                cls.tester_data[key] = data
+
+        return get_model_object.get_object(name, data, has_id)
+
+    def get_tester_key(cls, dct, original, parents, declarations):
+        """Return the key of the Tester data of a Test Class inheriting abstract
+        specs, shared with those having the same declarations, or None if they
+        can't be shared.
+        """
+        if not declarations or declarations["fingerprint"] is None:
+            return None
+
+        # Related names may be formatted with the name of the Model.
+        tester_dct = cls.get_cleaned_tester(cls, dct)
+        fields = [value for value in tester_dct.values() if isinstance(value, Field)]
+        if any(
+            "%(" in str(getattr(field.remote_field, attr, None) or "")
+            for field in fields
+            if field.remote_field
+            for attr in ("related_name", "related_query_name")
+        ):
+            return None
+
+        own = {
+            attr: value
+            for attr, value in tester_dct.items()
+            if attr != "Meta" and value is not declarations["attrs"].get(attr, None)
+        }
+        fingerprint = get_fingerprint((own, get_meta_options(dct.get("Meta", None))))
+        if fingerprint is None:
+            return None
+
+        return (
+            declarations["fingerprint"],
+            original.__module__,
+            parents,
+            cls.validation,
+            fingerprint,
+        )
+
     def filter_errors(cls, errors, tester_name, original_name):
         """Returns only Errors that have not been raised due to a clash between the 
         Tester Model and the Original Model.
@@ -256,6 +764,9 @@ class PytestDjangoModel(type):
         return dct
 
     def __repr__(cls):
+        if not hasattr(cls, "_meta"):
+            return super().__repr__()
+
         join = lambda x: ", ".join(x)
         return (
             f"<{cls.__name__}: constants({join(cls._meta.constants)}), "
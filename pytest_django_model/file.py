@@ -3,10 +3,15 @@
 import os
 from importlib import import_module, reload
 
+import pytest
+
+from .matrix import get_profile, get_profile_suffix
 from .objects import AttributeObject
 
-MODULE = "pytest_django_model_generated"
+# Workers of a settings matrix run in parallel, each one has its own module.
+MODULE = f"pytest_django_model_generated{get_profile_suffix(get_profile())}"
 FILE = f"{MODULE}.py"
+pytest.register_assert_rewrite(MODULE)
 FILE_HEADER = (
     "# coding: utf-8\n\n"
     "##############################################################\n"
@@ -23,11 +28,18 @@ FUNC_DEF_FORMAT = """
         {original}, {tester}= self._meta.model, self
         
 """
+# Failures are rendered by the pytest_assertrepr_compare hook of the plugin, or by
+# assert_msg when asserts aren't rewritten, e.g. with --assert=plain.
 FUNC_ASSERT_FORMAT = """
+        assert {original} == {tester}"""
+FUNC_ASSERT_MSG_FORMAT = """
         assert {original} == {tester}, assert_msg({original}, {tester})"""
 
 
 class FileGenerator:
+    # Assertion rewriting is enabled, so failures are rendered by the plugin hook.
+    rewrite_asserts = True
+
     def __init__(self, original, tester):
         self.original = original
         self.tester = tester
@@ -100,7 +112,10 @@ class FileGenerator:
                 instance=self.original, attr=attr_name, breadcrumb=attr.breadcrumb
             )
 
-            func += FUNC_ASSERT_FORMAT.format(
+            assert_format = (
+                FUNC_ASSERT_FORMAT if self.rewrite_asserts else FUNC_ASSERT_MSG_FORMAT
+            )
+            func += assert_format.format(
                 original=original_attr.breadcrumb, tester=attr.breadcrumb
             )
 
@@ -0,0 +1,121 @@
+# coding: utf-8
+
+import inspect
+import re
+from hashlib import blake2b
+
+from django.db.models import Index
+from django.utils.functional import Promise
+
+# Names generated by Index.set_name_with_model, from the table name, the first
+# column and a hash of the columns, ending with the suffix of the Index class.
+AUTO_INDEX_NAME = r"^.{0,11}_.{0,7}_[0-9a-f]{6}_%s$"
+
+
+class Unhashable(TypeError):
+    pass
+
+
+def is_auto_index_name(index):
+    """Verify if the name of an Index was generated by Django.
+    """
+    suffix = re.escape(getattr(index, "suffix", "idx"))
+    return bool(index.name) and bool(re.match(AUTO_INDEX_NAME % suffix, index.name))
+
+
+def get_sort_key(fingerprint):
+    return (fingerprint.__class__.__name__, repr(fingerprint))
+
+
+def get_stable_repr(fingerprint):
+    """Return the repr of a fingerprint, with classes and functions represented
+    by their import path so that it's the same in each session.
+    """
+    if isinstance(fingerprint, tuple):
+        return f"({', '.join(get_stable_repr(item) for item in fingerprint)})"
+    elif inspect.isclass(fingerprint) or inspect.isroutine(fingerprint):
+        module = getattr(fingerprint, "__module__", None)
+        name = getattr(fingerprint, "__qualname__", fingerprint.__name__)
+        return f"{module}.{name}" if module else name
+
+    return repr(fingerprint)
+
+
+def get_digest(fingerprint):
+    """Return a short hexadecimal digest of a fingerprint, or None if there's no
+    fingerprint.
+    """
+    if fingerprint is None:
+        return None
+
+    return blake2b(get_stable_repr(fingerprint).encode(), digest_size=8).hexdigest()
+
+
+class Fingerprinter:
+    """Build canonical and hashable fingerprints of values, e.g. Field attributes,
+    Meta indexes and constraints. Identical fingerprints are stored once, so
+    definitions shared across models are compared by identity.
+    """
+
+    def __init__(self):
+        self.interned = dict()
+
+    def __call__(self, value):
+        """Return the interned fingerprint of value, or None if a part of it can't
+        be hashed.
+        """
+        try:
+            fingerprint = self.get_fingerprint(value)
+        except Unhashable:
+            return None
+
+        return self.intern(fingerprint)
+
+    def intern(self, fingerprint):
+        """Return the stored fingerprint equal to fingerprint, storing it if it's
+        the first one.
+        """
+        return self.interned.setdefault(fingerprint, fingerprint)
+
+    def get_fingerprint(self, value):
+        """Return the fingerprint of value. Containers and deconstructible objects
+        are fingerprinted by their content, in an order-insensitive way for dicts
+        and sets.
+        """
+        if isinstance(value, Promise):
+            return str(value)
+        elif isinstance(value, dict):
+            items = (
+                (self.get_fingerprint(key), self.get_fingerprint(item))
+                for key, item in value.items()
+            )
+            return ("dict", tuple(sorted(items, key=get_sort_key)))
+        elif isinstance(value, (list, tuple)):
+            items = tuple(self.get_fingerprint(item) for item in value)
+            return (value.__class__.__name__, items)
+        elif isinstance(value, (set, frozenset)):
+            items = (self.get_fingerprint(item) for item in value)
+            return ("set", tuple(sorted(items, key=get_sort_key)))
+        elif not inspect.isclass(value) and hasattr(value, "deconstruct"):
+            return self.get_deconstructed_fingerprint(value)
+
+        try:
+            hash(value)
+        except TypeError:
+            raise Unhashable(value)
+
+        return value
+
+    def get_deconstructed_fingerprint(self, value):
+        """Return the fingerprint of a deconstructible object, e.g. an Index, a
+        constraint, a Q object or a validator. Names generated by Django for
+        indexes are ignored.
+        """
+        *_, path, args, kwargs = value.deconstruct()
+        if isinstance(value, Index) and is_auto_index_name(value):
+            kwargs = {key: item for key, item in kwargs.items() if key != "name"}
+
+        return (path, self.get_fingerprint(args), self.get_fingerprint(kwargs))
+
+
+get_fingerprint = Fingerprinter()
@@ -0,0 +1,627 @@
+# coding: utf-8
+
+import random
+from collections import OrderedDict
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from uuid import UUID
+
+from django.apps import apps
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import (
+    AutoField,
+    Count,
+    ForeignKey,
+    ManyToManyField,
+    Max,
+    Min,
+    OneToOneField,
+)
+from django.utils import timezone
+
+from .lint import get_meta_value, normalize_together
+from .objects import get_model_object
+
+# Number of rows built at once, and inserted by each bulk_create.
+DEFAULT_CHUNK_SIZE = 10000
+DEFAULT_BATCH_SIZE = 1000
+
+# Number of pages of ForeignKey targets kept in memory.
+RELATED_PAGES = 4
+
+# Share of None values of nullable Fields.
+NULL_RATE = 0.1
+
+# Dates and times are spread over this period before now.
+DATE_RANGE = timedelta(days=3 * 365)
+
+# fmt: off
+WORDS = (
+    "alpha", "amber", "atlas", "birch", "cedar", "coral", "delta", "ember",
+    "fable", "flint", "grove", "harbor", "indigo", "jade", "kestrel", "lumen",
+    "maple", "meadow", "nova", "onyx", "opal", "pine", "quartz", "raven",
+    "river", "sable", "sierra", "stone", "tide", "umber", "vale", "willow",
+)
+# fmt: on
+
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+URL_PREFIX = "https://example.com/"
+
+# Highest values of integer Fields.
+INTEGER_MAX = {
+    "BigIntegerField": 2 ** 63 - 1,
+    "IntegerField": 2 ** 31 - 1,
+    "PositiveIntegerField": 2 ** 31 - 1,
+    "PositiveSmallIntegerField": 2 ** 15 - 1,
+    "SmallIntegerField": 2 ** 15 - 1,
+}
+
+
+class FixtureError(Exception):
+    pass
+
+
+def encode_index(index):
+    """Return index in base 36, a short token unique for each row.
+    """
+    token = ""
+    while True:
+        index, digit = divmod(index, len(DIGITS))
+        token = DIGITS[digit] + token
+        if not index:
+            return token
+
+
+def fit_text(text, token, max_length):
+    """Return text ending with token, within max_length characters.
+    """
+    if not token:
+        return text[:max_length]
+    if len(token) + 1 >= max_length:
+        return token[max(len(token) - max_length, 0) :]
+
+    return f"{text[:max_length - len(token) - 1]}-{token}"
+
+
+def get_words(rng, count, separator=" "):
+    return separator.join(rng.choice(WORDS) for _ in range(count))
+
+
+def get_choices(choices):
+    """Return the values of choices, flattening named groups.
+    """
+    values = list()
+    for value, label in choices:
+        if isinstance(label, (list, tuple)):
+            values.extend(item for item, _ in label)
+        else:
+            values.append(value)
+
+    return values
+
+
+def get_now():
+    return timezone.now() if settings.USE_TZ else datetime.now()
+
+
+# Values of Fields
+##################
+def get_integer(high):
+    def get_value(rng, token, index, attrs):
+        if token:
+            return index
+        return rng.randint(0, min(high, 10000))
+
+    return get_value
+
+
+def get_char(rng, token, index, attrs):
+    max_length = attrs.get("max_length", None) or 255
+    text = get_words(rng, rng.randint(1, 4)).capitalize()
+    return fit_text(text, token, max_length)
+
+
+def get_text(rng, token, index, attrs):
+    text = get_words(rng, rng.randint(5, 40)).capitalize()
+    return f"{text} {token}." if token else f"{text}."
+
+
+def get_slug(rng, token, index, attrs):
+    text = get_words(rng, rng.randint(1, 3), "-")
+    return fit_text(text, token, attrs.get("max_length", None) or 50)
+
+
+def get_email(rng, token, index, attrs):
+    user = f"{rng.choice(WORDS)}.{token or rng.randrange(10000)}"
+    return f"{user}@example.com"[-(attrs.get("max_length", None) or 254) :]
+
+
+def get_url(rng, token, index, attrs):
+    max_length = (attrs.get("max_length", None) or 200) - len(URL_PREFIX)
+    path = fit_text(rng.choice(WORDS), token or str(rng.randrange(10000)), max_length)
+    return f"{URL_PREFIX}{path}"
+
+
+def get_file(rng, token, index, attrs):
+    name = f"fixtures/{rng.choice(WORDS)}_{token or rng.randrange(10000)}.txt"
+    return name[-(attrs.get("max_length", None) or 100) :]
+
+
+def get_ip_address(rng, token, index, attrs):
+    value = index if token else rng.getrandbits(24)
+    return f"10.{value >> 16 & 255}.{value >> 8 & 255}.{value & 255}"
+
+
+def get_boolean(rng, token, index, attrs):
+    return bool(index) if token else rng.random() < 0.5
+
+
+def get_decimal(rng, token, index, attrs):
+    max_digits = attrs.get("max_digits", None) or 10
+    decimal_places = attrs.get("decimal_places", None) or 0
+    value = index if token else rng.randrange(10 ** max_digits)
+    return Decimal(value).scaleb(-decimal_places)
+
+
+def get_float(rng, token, index, attrs):
+    return float(index) if token else round(rng.uniform(0, 10000), 2)
+
+
+def get_datetime(rng, token, index, attrs):
+    seconds = index if token else rng.uniform(0, DATE_RANGE.total_seconds())
+    return get_now() - timedelta(seconds=seconds)
+
+
+def get_date(rng, token, index, attrs):
+    days = index if token else rng.randrange(DATE_RANGE.days)
+    return date.today() - timedelta(days=days)
+
+
+def get_time(rng, token, index, attrs):
+    seconds = index if token else rng.randrange(86400)
+    return time(seconds // 3600, seconds // 60 % 60, seconds % 60)
+
+
+def get_duration(rng, token, index, attrs):
+    return timedelta(seconds=index if token else rng.randrange(86400))
+
+
+def get_uuid(rng, token, index, attrs):
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+def get_binary(rng, token, index, attrs):
+    return bytes(rng.getrandbits(8) for _ in range(16))
+
+
+# Value functions by Field class, looked up along the MRO of each Field.
+FIELD_VALUES = {
+    **{name: get_integer(high) for name, high in INTEGER_MAX.items()},
+    "BinaryField": get_binary,
+    "BooleanField": get_boolean,
+    "DateField": get_date,
+    "DateTimeField": get_datetime,
+    "DecimalField": get_decimal,
+    "DurationField": get_duration,
+    "EmailField": get_email,
+    "FileField": get_file,
+    "FilePathField": get_file,
+    "FloatField": get_float,
+    "GenericIPAddressField": get_ip_address,
+    "NullBooleanField": get_boolean,
+    "SlugField": get_slug,
+    "TextField": get_text,
+    "TimeField": get_time,
+    "URLField": get_url,
+    "UUIDField": get_uuid,
+    "CharField": get_char,
+}
+
+
+def get_text_capacity(default, reserved=0):
+    def get_capacity(attrs):
+        max_length = attrs.get("max_length", None) or default
+        return len(DIGITS) ** max(max_length - reserved, 0)
+
+    return get_capacity
+
+
+# Number of distinct values of unique Fields, the values of a row index, by Field
+# class. Fields missing here don't run out of values.
+FIELD_CAPACITIES = {
+    **{name: (lambda attrs, high=high: high + 1) for name, high in INTEGER_MAX.items()},
+    "BooleanField": lambda attrs: 2,
+    "DateField": lambda attrs: date.today().toordinal(),
+    "DecimalField": lambda attrs: 10 ** (attrs.get("max_digits", None) or 10),
+    "EmailField": get_text_capacity(254, len("a.@example.com")),
+    "FileField": get_text_capacity(100, len(".txt")),
+    "FilePathField": get_text_capacity(100, len(".txt")),
+    "FloatField": lambda attrs: 2 ** 53,
+    "GenericIPAddressField": lambda attrs: 2 ** 24,
+    "NullBooleanField": lambda attrs: 2,
+    "SlugField": get_text_capacity(50),
+    "TimeField": lambda attrs: 86400,
+    "URLField": get_text_capacity(200, len(URL_PREFIX)),
+    "CharField": get_text_capacity(255),
+}
+
+
+def get_field_class_value(values, cls):
+    for base in cls.__mro__:
+        if base.__name__ in values:
+            return values[base.__name__]
+
+    return None
+
+
+def get_field_value_func(cls):
+    return get_field_class_value(FIELD_VALUES, cls)
+
+
+def get_unique_capacity(cls, attrs):
+    """Return the number of distinct values of a unique Field, or None if it
+    doesn't run out of values.
+    """
+    if attrs.get("choices", None):
+        return len(get_choices(attrs["choices"]))
+
+    get_capacity = get_field_class_value(FIELD_CAPACITIES, cls)
+    return None if get_capacity is None else get_capacity(attrs)
+
+
+# Rows
+######
+def get_related_model(model, attrs):
+    to = attrs["to"]
+    if to == "self":
+        return model
+
+    return apps.get_model(to) if isinstance(to, str) else to
+
+
+class RelatedValues:
+    """The ordered values of the column a ForeignKey points to, without loading
+    them all: values of contiguous integer columns are computed from their bounds,
+    others are read by pages, the last RELATED_PAGES pages being kept.
+    """
+
+    def __init__(self, queryset, column, page_size=DEFAULT_CHUNK_SIZE):
+        queryset = queryset.filter(**{f"{column}__isnull": False})
+        bounds = queryset.aggregate(
+            count=Count(column), low=Min(column), high=Max(column)
+        )
+        self.count, low, high = bounds["count"], bounds["low"], bounds["high"]
+        self.low = (
+            low
+            if isinstance(low, int)
+            and not isinstance(low, bool)
+            and high - low + 1 == self.count
+            else None
+        )
+        self.queryset = queryset.order_by(column).values_list(column, flat=True)
+        self.page_size = page_size
+        self.pages = OrderedDict()
+        self.page = 0
+        self.draws = 0
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if self.low is not None:
+            return self.low + index
+
+        number, offset = divmod(index, self.page_size)
+        if number in self.pages:
+            self.pages.move_to_end(number)
+        else:
+            start = number * self.page_size
+            self.pages[number] = list(self.queryset[start : start + self.page_size])
+            if len(self.pages) > RELATED_PAGES:
+                self.pages.popitem(last=False)
+
+        return self.pages[number][offset]
+
+    def choice(self, rng):
+        """Return a random value. Paged values are drawn from a random page, which
+        changes every page_size draws.
+        """
+        if self.low is not None or self.count <= self.page_size:
+            return self[rng.randrange(self.count)]
+
+        if not self.draws % self.page_size:
+            self.page = rng.randrange(-(-self.count // self.page_size))
+        self.draws += 1
+
+        start = self.page * self.page_size
+        return self[start + rng.randrange(min(self.page_size, self.count - start))]
+
+
+def get_unique_groups(model_object):
+    """Return the groups of Field names which must be unique together.
+    """
+    groups = list(normalize_together(get_meta_value(model_object, "unique_together")))
+    for constraint in get_meta_value(model_object, "constraints", ()) or ():
+        fields = getattr(constraint, "fields", None)
+        if fields and getattr(constraint, "condition", None) is None:
+            groups.append(tuple(fields))
+
+    return groups
+
+
+class RowGenerator:
+    """Build the field values of rows of a Model from its extracted Fields, as a
+    spec compares them: generated values follow max_length, choices, null, unique,
+    decimal digits and ForeignKey targets.
+    """
+
+    def __init__(self, model, using=DEFAULT_DB_ALIAS, seed=None, start=None):
+        if model._meta.parents and not model._meta.proxy:
+            raise FixtureError(
+                f"{model._meta.label} inherits a concrete model, its rows can't be "
+                f"created with bulk_create."
+            )
+
+        self.model = model
+        self.using = using
+        self.rng = random.Random(
+            None if seed is None else f"{seed}:{model._meta.label}"
+        )
+        self.manager = model._default_manager.db_manager(using)
+        self.start = self.manager.count() if start is None else start
+
+        self.model_object = get_model_object(model)
+        self.fields = self.model_object._meta.fields
+        self.unique = {
+            name
+            for name, attribute_object in self.fields.items()
+            if attribute_object.value.get("unique", False)
+            or attribute_object.value.get("primary_key", False)
+            or issubclass(attribute_object.cls, OneToOneField)
+        }
+        self.related = dict()
+        self.radixes = dict()
+        self.combinations = None
+        self.plan = self.get_plan()
+        self.choices = {
+            name: get_choices(self.fields[name].value["choices"])
+            for name, _, func in self.plan
+            if func is not None and self.fields[name].value.get("choices", None)
+        }
+        self.capacities = self.get_capacities()
+
+    def get_related_values(self, name, attrs):
+        """Return the existing values of the column a ForeignKey points to, as
+        RelatedValues.
+        """
+        related_model = get_related_model(self.model, attrs)
+        values = RelatedValues(
+            related_model._default_manager.db_manager(self.using),
+            attrs.get("to_field", None) or "pk",
+        )
+        if not values and not attrs.get("null", False):
+            raise FixtureError(
+                f"{self.model._meta.label}.{name} needs rows of "
+                f"{related_model._meta.label}, create them first."
+            )
+
+        return values
+
+    def get_plan(self):
+        """Return the Fields to generate, with their attname and value function.
+        Relations of unique groups only made of ForeignKeys are combined as digits
+        of the row index, so that each row gets a distinct combination.
+        """
+        plan = list()
+        for name, attribute_object in self.fields.items():
+            cls, attrs = attribute_object.cls, attribute_object.value
+            if (
+                issubclass(cls, (AutoField, ManyToManyField))
+                or attrs.get("auto_now", False)
+                or attrs.get("auto_now_add", False)
+                or ("default" in attrs and name not in self.unique)
+            ):
+                continue
+
+            if issubclass(cls, ForeignKey):
+                self.related[name] = self.get_related_values(name, attrs)
+                plan.append((name, f"{name}_id", None))
+            else:
+                func = get_field_value_func(cls)
+                if func is None:
+                    if attrs.get("null", False):
+                        continue
+                    raise FixtureError(
+                        f"{self.model._meta.label}.{name}: values of {cls.__name__} "
+                        f"can't be generated."
+                    )
+                plan.append((name, name, func))
+
+        related = set(self.related)
+        for group in get_unique_groups(self.model_object):
+            if set(group) <= related:
+                divisor = 1
+                for name in group:
+                    self.radixes[name] = divisor
+                    divisor *= max(len(self.related[name]), 1)
+                self.combinations = min(divisor, self.combinations or divisor)
+            else:
+                self.unique.update(name for name in group if name not in related)
+
+        return plan
+
+    def get_capacities(self):
+        """Return the number of distinct values of the generated unique Fields
+        which can run out of values, by Field name.
+        """
+        capacities = dict()
+        for name, _, func in self.plan:
+            if func is not None and name in self.unique:
+                attribute_object = self.fields[name]
+                capacity = get_unique_capacity(
+                    attribute_object.cls, attribute_object.value
+                )
+                if capacity is not None:
+                    capacities[name] = capacity
+
+        return capacities
+
+    def is_null(self, attrs):
+        """Draw whether a value is None, for Fields which can be null and blank.
+        """
+        return (
+            attrs.get("null", False)
+            and attrs.get("blank", False)
+            and self.rng.random() < NULL_RATE
+        )
+
+    def get_related_value(self, name, attrs, index):
+        values = self.related[name]
+        if not values:
+            return None
+        if name in self.radixes:
+            return values[index // self.radixes[name] % len(values)]
+        if name in self.unique:
+            if index >= len(values):
+                raise FixtureError(
+                    f"{self.model._meta.label}.{name} is unique, there are only "
+                    f"{len(values)} rows to point to."
+                )
+            return values[index]
+        if self.is_null(attrs):
+            return None
+
+        return values.choice(self.rng)
+
+    def get_row(self, index):
+        """Return the field values of the row at index, counted from the rows
+        already in the table.
+        """
+        index += self.start
+        if self.combinations is not None and index >= self.combinations:
+            raise FixtureError(
+                f"{self.model._meta.label} rows are unique together, there are only "
+                f"{self.combinations} combinations of rows to point to."
+            )
+        for name, capacity in self.capacities.items():
+            if index >= capacity:
+                raise FixtureError(
+                    f"{self.model._meta.label}.{name} is unique, there are only "
+                    f"{capacity} distinct values to generate."
+                )
+
+        row = dict()
+        for name, attname, func in self.plan:
+            attrs = self.fields[name].value
+            if func is None:
+                row[attname] = self.get_related_value(name, attrs, index)
+            elif name in self.choices:
+                choices = self.choices[name]
+                row[attname] = (
+                    choices[index] if name in self.unique else self.rng.choice(choices)
+                )
+            elif name in self.unique:
+                row[attname] = func(self.rng, encode_index(index), index, attrs)
+            elif self.is_null(attrs):
+                row[attname] = None
+            else:
+                row[attname] = func(self.rng, "", index, attrs)
+
+        return row
+
+
+def generate_rows(
+    model, count, chunk_size=DEFAULT_CHUNK_SIZE, using=DEFAULT_DB_ALIAS, seed=None
+):
+    """Yield unsaved instances of model, count in total, as lists of chunk_size
+    instances.
+    """
+    generator = RowGenerator(model, using, seed)
+    for chunk_start in range(0, count, chunk_size):
+        chunk_end = min(count, chunk_start + chunk_size)
+        yield [
+            model(**generator.get_row(index)) for index in range(chunk_start, chunk_end)
+        ]
+
+
+def insert_rows(
+    model,
+    count,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    batch_size=DEFAULT_BATCH_SIZE,
+    using=DEFAULT_DB_ALIAS,
+    seed=None,
+):
+    """Insert count generated rows of model with bulk_create, one chunk at a time.
+    Return the number of inserted rows.
+    """
+    manager = model._default_manager.db_manager(using)
+    inserted = 0
+    for chunk in generate_rows(model, count, chunk_size, using, seed):
+        manager.bulk_create(chunk, batch_size=batch_size)
+        inserted += len(chunk)
+
+    return inserted
+
+
+def get_dependencies(model, required=False):
+    """Return the Models the ForeignKeys of model point to, only those of
+    non-nullable ForeignKeys if required.
+    """
+    dependencies = set()
+    for attribute_object in get_model_object(model)._meta.fields.values():
+        attrs = attribute_object.value
+        if issubclass(attribute_object.cls, ForeignKey):
+            if required and attrs.get("null", False):
+                continue
+            related_model = get_related_model(model, attrs)
+            if related_model is not model:
+                dependencies.add(related_model)
+
+    return dependencies
+
+
+def get_insert_order(models):
+    """Return models sorted so that the targets of ForeignKeys come first. Nullable
+    ForeignKeys are ignored if they make a cycle.
+    """
+    for required in (False, True):
+        dependencies = {
+            model: get_dependencies(model, required) & set(models) for model in models
+        }
+        order = list()
+        while dependencies:
+            ready = [model for model in models if dependencies.get(model) == set()]
+            if not ready:
+                break
+            for model in ready:
+                order.append(model)
+                del dependencies[model]
+            for remaining in dependencies.values():
+                remaining.difference_update(ready)
+        else:
+            return order
+
+    labels = ", ".join(model._meta.label for model in dependencies)
+    raise FixtureError(f"ForeignKeys of {labels} make a cycle which can't be null.")
+
+
+def fill_database(
+    counts,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    batch_size=DEFAULT_BATCH_SIZE,
+    using=DEFAULT_DB_ALIAS,
+    seed=None,
+):
+    """Insert generated rows for each Model of counts, a dict of row counts by
+    Model, in ForeignKey order. Return the inserted row counts by Model label.
+    """
+    inserted = dict()
+    for model in get_insert_order(list(counts)):
+        inserted[model._meta.label] = insert_rows(
+            model, counts[model], chunk_size, batch_size, using, seed
+        )
+
+    return inserted
@@ -0,0 +1,135 @@
+# coding: utf-8
+
+import os
+import sys
+from argparse import ArgumentTypeError
+from collections import defaultdict
+from functools import lru_cache
+from inspect import getsourcefile
+
+from django.db.models import Model
+from django.db.models.base import ModelBase
+
+from .utils import get_model_fields
+
+
+def normalize_path(path, rootdir=None):
+    """Return the absolute real path of path, relative paths being resolved from
+    rootdir.
+    """
+    if rootdir and not os.path.isabs(path):
+        path = os.path.join(rootdir, path)
+
+    return os.path.realpath(path)
+
+
+@lru_cache(maxsize=None)
+def read_changed_files(path):
+    """Read a list of changed files, one per line, from path or stdin if path is
+    '-', and return them as a tuple.
+
+    It's used as an option type, so stdin is read before pytest captures it.
+    """
+    try:
+        if path == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            with open(path, "r") as f:
+                lines = f.read().splitlines()
+    except OSError as e:
+        raise ArgumentTypeError(str(e))
+
+    return tuple(line.strip() for line in lines if line.strip())
+
+
+def get_source_path(obj):
+    """Return the normalized source file of obj, or None if it hasn't any.
+    """
+    try:
+        path = getsourcefile(obj)
+    except TypeError:
+        path = None
+
+    return normalize_path(path) if path else None
+
+
+def get_spec_path(dct):
+    """Return the normalized source file of the module defining a Test Class.
+    """
+    module = sys.modules.get(dct.get("__module__", None), None)
+    path = getattr(module, "__file__", None)
+
+    return normalize_path(path) if path else None
+
+
+def get_dependencies(model):
+    """Return the models the given model depends on: itself, its abstract and
+    concrete parents and the targets of its relations.
+    """
+    dependencies = [
+        base
+        for base in model.__mro__
+        if isinstance(base, ModelBase) and base is not Model
+    ]
+
+    for field in get_model_fields(model):
+        related_model = getattr(field, "related_model", None)
+        if isinstance(related_model, ModelBase):
+            dependencies.append(related_model)
+
+    return dependencies
+
+
+class ImpactIndex:
+    """Reverse index from source files to the Test Classes depending on them.
+    """
+
+    def __init__(self):
+        self.configure()
+
+    def configure(self, changed_paths=None):
+        self.changed_paths = changed_paths
+        self.specs = defaultdict(set)
+        self.selected, self.deselected = 0, 0
+
+    @property
+    def enabled(self):
+        return self.changed_paths is not None
+
+    def add(self, spec_id, spec_path, original, parents=None, spec_paths=()):
+        """Index the source files a Test Class depends on and return them, with
+        spec_paths, the files of the abstract specs it inherits.
+        """
+        models = [original, *(parents or ())]
+        paths = {spec_path, *spec_paths}
+        for model in models:
+            for dependency in get_dependencies(model):
+                paths.add(get_source_path(dependency))
+        paths.discard(None)
+
+        for path in paths:
+            self.specs[path].add(spec_id)
+
+        return paths
+
+    def get_specs(self, paths):
+        """Return the Test Classes depending on any of the given source files.
+        """
+        return {spec_id for path in paths for spec_id in self.specs.get(path, ())}
+
+    def is_selected(self, spec_id, dct, original, parents=None, spec_paths=()):
+        """Index the Test Class and return True if it's affected by the changes.
+        """
+        if not self.enabled:
+            return True
+
+        paths = self.add(spec_id, get_spec_path(dct), original, parents, spec_paths)
+        if paths & self.changed_paths:
+            self.selected += 1
+            return True
+        else:
+            self.deselected += 1
+            return False
+
+
+impact_index = ImpactIndex()
@@ -0,0 +1,152 @@
+# coding: utf-8
+
+from collections import namedtuple
+
+from django.db.models import ForeignKey
+
+
+class IndexLint(namedtuple("IndexLint", ["model", "option", "field", "message"])):
+    """A column of a model which is used by option without supporting index.
+    """
+
+    def __str__(self):
+        return self.message
+
+
+def get_meta_value(model_object, option, default=None):
+    attribute_object = model_object._meta.meta.get(option, None)
+    if attribute_object is None or attribute_object.value is NotImplemented:
+        return default
+
+    return attribute_object.value
+
+
+def normalize_together(value):
+    """Return unique_together or index_together value as a tuple of tuples.
+    """
+    if not value:
+        return ()
+    if isinstance(value[0], str):
+        return (tuple(value),)
+
+    return tuple(tuple(fields) for fields in value)
+
+
+def get_column_names(model_object):
+    """Return a dict mapping names and attnames of Fields to Field names.
+    """
+    names = dict()
+    for name, attribute_object in model_object._meta.fields.items():
+        names[name] = name
+        if issubclass(attribute_object.cls, ForeignKey):
+            names[f"{name}_id"] = name
+
+    return names
+
+
+def get_indexed_columns(model_object):
+    """Return the names of the Fields which lead an index, by Field attributes,
+    unique_together, index_together, indexes and constraints.
+    """
+    names = get_column_names(model_object)
+    indexed = {"pk"}
+
+    for name, attribute_object in model_object._meta.fields.items():
+        attrs = attribute_object.value
+        if (
+            attrs.get("primary_key", False)
+            or attrs.get("unique", False)
+            or attrs.get("db_index", issubclass(attribute_object.cls, ForeignKey))
+        ):
+            indexed.add(name)
+
+    leading_fields = list()
+    for option in ("unique_together", "index_together"):
+        for fields in normalize_together(get_meta_value(model_object, option, ())):
+            leading_fields.append(fields[0] if fields else None)
+    for option in ("indexes", "constraints"):
+        for index in get_meta_value(model_object, option, ()) or ():
+            fields = getattr(index, "fields", None)
+            leading_fields.append(fields[0].lstrip("-") if fields else None)
+
+    for field in leading_fields:
+        if field in names:
+            indexed.add(names[field])
+
+    return indexed
+
+
+def get_lookup_column(names, lookup):
+    """Return the Field name of an ordering or get_latest_by lookup, or None if it
+    isn't a column of the model itself, e.g. a random order or a related lookup.
+    """
+    if not isinstance(lookup, str):
+        return None
+
+    name = lookup.lstrip("-+")
+    if name == "pk":
+        return name
+
+    return names.get(name, None)
+
+
+def lint_indexes(model_object):
+    """Return the columns used by the default ordering, get_latest_by and
+    ForeignKeys of a ModelObject without supporting index, as IndexLint.
+    """
+    model = model_object._meta.name
+    names = get_column_names(model_object)
+    indexed = get_indexed_columns(model_object)
+
+    lints = list()
+
+    ordering = get_meta_value(model_object, "ordering", ()) or ()
+    if ordering:
+        field = get_lookup_column(names, ordering[0])
+        if field and field not in indexed:
+            lints.append(
+                IndexLint(
+                    model,
+                    "ordering",
+                    field,
+                    f"{model}.Meta.ordering: '{field}' leads the default ordering "
+                    f"but no index, queries are sorted with a full table scan.",
+                )
+            )
+
+    latest_by = get_meta_value(model_object, "get_latest_by", None)
+    if isinstance(latest_by, str):
+        latest_by = (latest_by,)
+    for lookup in latest_by or ():
+        field = get_lookup_column(names, lookup)
+        if field and field not in indexed:
+            lints.append(
+                IndexLint(
+                    model,
+                    "get_latest_by",
+                    field,
+                    f"{model}.Meta.get_latest_by: '{field}' has no index, latest() "
+                    f"and earliest() scan the whole table.",
+                )
+            )
+
+    for name, attribute_object in model_object._meta.fields.items():
+        if issubclass(attribute_object.cls, ForeignKey) and name not in indexed:
+            lints.append(
+                IndexLint(
+                    model,
+                    "db_index",
+                    name,
+                    f"{model}.{name}: ForeignKey has db_index=False and doesn't "
+                    f"lead any index, filtering on it scans the whole table.",
+                )
+            )
+
+    return lints
+
+
+def check_indexes(model, model_object):
+    """Fail if lint_indexes finds columns without supporting index.
+    """
+    lints = lint_indexes(model_object)
+    assert not lints, "\n".join(str(lint) for lint in lints)
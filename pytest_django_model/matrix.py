@@ -0,0 +1,205 @@
+# coding: utf-8
+
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from collections import Counter
+from contextlib import ExitStack
+from time import perf_counter
+
+# Environment variables given to the worker process of each settings profile.
+PROFILE_ENV = "PYTEST_DJANGO_MODEL_PROFILE"
+REPORT_ENV = "PYTEST_DJANGO_MODEL_REPORT"
+
+# Options not forwarded to workers, with whether they take a separate value.
+MATRIX_OPTIONS = {"--model-settings-matrix": True, "--ds": True}
+
+# Exit statuses of pytest from the least to the most severe: all tests passed, no
+# tests collected, tests failed, interrupted, usage error and internal error.
+# Other statuses, e.g. of a crashed worker, are the most severe.
+EXIT_SEVERITY = (0, 5, 1, 2, 4, 3)
+
+
+def parse_settings_matrix(value):
+    """Parse a comma separated list of settings modules and return it as a tuple.
+    """
+    return tuple(module.strip() for module in value.split(",") if module.strip())
+
+
+def get_profile():
+    """Return the settings profile of the current worker, or None.
+    """
+    return os.environ.get(PROFILE_ENV, None)
+
+
+def get_profile_suffix(profile):
+    """Return a suffix identifying profile in module names.
+    """
+    return "_" + re.sub(r"\W", "_", profile) if profile else ""
+
+
+def get_severity(exitstatus):
+    if exitstatus in EXIT_SEVERITY:
+        return EXIT_SEVERITY.index(exitstatus)
+
+    return len(EXIT_SEVERITY)
+
+
+def stop_process(process):
+    """Kill process if it's still running, and wait for it.
+    """
+    if process.poll() is None:
+        process.kill()
+    process.wait()
+
+
+def get_worker_args(args):
+    """Return command line args without the options of the matrix.
+    """
+    worker_args, skip = list(), False
+    for arg in args:
+        option = arg.split("=", 1)[0]
+        if skip:
+            skip = False
+        elif option in MATRIX_OPTIONS:
+            skip = MATRIX_OPTIONS[option] and "=" not in arg
+        else:
+            worker_args.append(arg)
+
+    return worker_args
+
+
+class MatrixWorker:
+    """Record test reports of a worker process and write them to its report file.
+    """
+
+    def __init__(self):
+        self.reports = list()
+
+    def add(self, report):
+        if report.when == "call" or report.outcome != "passed":
+            self.reports.append(
+                {
+                    "nodeid": report.nodeid,
+                    "when": report.when,
+                    "outcome": report.outcome,
+                    "longrepr": report.longreprtext if report.failed else "",
+                }
+            )
+
+    def write(self, exitstatus):
+        path = os.environ.get(REPORT_ENV, None)
+        if not path:
+            return
+
+        with open(path, "w") as f:
+            json.dump({"exitstatus": int(exitstatus), "reports": self.reports}, f)
+
+
+class MatrixRunner:
+    """Run the tests once per settings module, in parallel worker processes, and
+    merge their reports.
+    """
+
+    def __init__(self, profiles, args, rootdir=None):
+        self.profiles = profiles
+        self.args = get_worker_args(args)
+        self.rootdir = rootdir
+
+    def get_command(self):
+        return [sys.executable, "-m", "pytest", *self.args]
+
+    def get_env(self, profile, report_path):
+        return {
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": profile,
+            PROFILE_ENV: profile,
+            REPORT_ENV: report_path,
+        }
+
+    def run(self):
+        """Start a worker per profile, wait for all of them and return their
+        results by profile. If a worker can't be started, or waiting is
+        interrupted, the started workers are killed.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir, ExitStack() as stack:
+            workers = dict()
+            for n, profile in enumerate(self.profiles):
+                report_path = os.path.join(tmpdir, f"report{n}.json")
+                output = stack.enter_context(
+                    open(os.path.join(tmpdir, f"output{n}.txt"), "w+")
+                )
+                process = subprocess.Popen(
+                    self.get_command(),
+                    cwd=self.rootdir,
+                    env=self.get_env(profile, report_path),
+                    stdout=output,
+                    stderr=subprocess.STDOUT,
+                )
+                stack.callback(stop_process, process)
+                workers[profile] = (process, report_path, output, perf_counter())
+
+            results = dict()
+            for profile, (process, report_path, output, start) in workers.items():
+                returncode = process.wait()
+                duration = perf_counter() - start
+
+                output.seek(0)
+                results[profile] = self.read_result(report_path, returncode)
+                results[profile].update(duration=duration, output=output.read())
+
+        return results
+
+    @staticmethod
+    def read_result(report_path, returncode):
+        if not os.path.isfile(report_path):
+            return {"exitstatus": returncode, "reports": None}
+
+        with open(report_path, "r") as f:
+            return json.load(f)
+
+    @staticmethod
+    def get_summary(results):
+        """Return the lines of the merged report, labelled per profile.
+        """
+        lines, failures = list(), list()
+        for profile, result in results.items():
+            label = f"[{profile}]"
+            if result["reports"] is None:
+                lines.append(f"{label} error, exit status {result['exitstatus']}")
+                failures.append(f"ERROR {label}\n{result['output']}")
+                continue
+
+            outcomes = Counter(report["outcome"] for report in result["reports"])
+            counts = ", ".join(
+                f"{n} {outcome}" for outcome, n in sorted(outcomes.items())
+            )
+            lines.append(
+                f"{label} {counts or 'no tests ran'} in {result['duration']:.2f}s"
+            )
+
+            for report in result["reports"]:
+                if report["outcome"] == "failed":
+                    failures.append(
+                        f"FAILED {label} {report['nodeid']}\n{report['longrepr']}"
+                    )
+
+        return failures + lines
+
+    @staticmethod
+    def get_exitstatus(results):
+        """Return the most severe exit status of the workers, following
+        EXIT_SEVERITY. Workers which collected no tests don't fail the matrix if
+        other workers ran tests.
+        """
+        exitstatuses = {result["exitstatus"] for result in results.values()}
+        if exitstatuses & {0, 1}:
+            exitstatuses.discard(5)
+
+        return max(exitstatuses, key=get_severity, default=0)
+
+
+matrix_worker = MatrixWorker()
@@ -3,17 +3,27 @@
 import inspect
 from functools import partial, partialmethod
 
-from django.db.models import Field
+from django.db.models import CASCADE, Field, ManyToManyField, OneToOneField
 from django.db.models.fields import related_descriptors
-from django.db.models.options import Options
-
-from .utils import a_or_an, get_model_fields, is_dunder
+from django.db.models.options import DEFAULT_NAMES, Options
+from django.utils.functional import Promise
+
+from .fingerprints import get_fingerprint
+from .utils import (
+    a_or_an,
+    get_model_fields,
+    get_model_label,
+    is_dunder,
+    is_same_label,
+    resolve_relations,
+)
 
 DIRTY_FIELD_ATTRS = ["serialize"]
 
 META_OPTIONS = (
     "abstract",
     "base_manager_name",
+    "constraints",
     "db_table",
     "db_tablespace",
     "default_manager_name",
@@ -36,6 +46,18 @@ META_OPTIONS = (
 )
 
 
+# Meta Options changing the fields or the options themselves when the Django Model
+# is built.
+BUILT_META_OPTIONS = (
+    "abstract",
+    "apps",
+    "auto_created",
+    "default_related_name",
+    "order_with_respect_to",
+    "proxy",
+    "swappable",
+)
+
 RELATED_DESCRIPTORS = tuple(
     [
         getattr(related_descriptors, attr)
@@ -53,13 +75,79 @@ class MetaError(AttributeError, NameError):
     pass
 
 
+def get_lazy_key(value):
+    """Return the function and the arguments of a lazy object, e.g. the message id
+    and context of a lazy translation, or None if they can't be retrieved.
+    """
+    try:
+        func, args, kw, *resultclasses = value.__reduce__()[1]
+        return (func, tuple(args), tuple(sorted(kw.items())))
+    except (TypeError, ValueError):
+        return None
+
+
+def get_lazy_cls(cls):
+    """Return str for the classes of lazy strings, else cls.
+    """
+    return str if issubclass(cls, Promise) else cls
+
+
+def is_lazy_equal(value, other):
+    """Compare value and other, comparing lazy objects by their function and their
+    arguments without evaluating them. They're only evaluated if these differ.
+    """
+    if isinstance(value, Promise) or isinstance(other, Promise):
+        if isinstance(value, Promise) and isinstance(other, Promise):
+            key = get_lazy_key(value)
+            if key is not None and key == get_lazy_key(other):
+                return True
+        elif not isinstance(value, str) and not isinstance(other, str):
+            return False
+        return str(value) == str(other)
+    elif isinstance(value, dict) and isinstance(other, dict):
+        return value.keys() == other.keys() and all(
+            is_lazy_equal(value[key], other[key]) for key in value
+        )
+    elif isinstance(value, (list, tuple)) and isinstance(other, (list, tuple)):
+        return (
+            type(value) == type(other)
+            and len(value) == len(other)
+            and all(is_lazy_equal(x, y) for x, y in zip(value, other))
+        )
+    else:
+        fingerprint, other_fingerprint = get_fingerprint(value), get_fingerprint(other)
+        if fingerprint is not None and other_fingerprint is not None:
+            return fingerprint == other_fingerprint
+
+        return value == other
+
+
 class AttributeObject:
+    # Compare lazy strings by message id and context, without translating them.
+    lazy_strings = False
+
     def __init__(self, name, value, parents, cls=None):
         self.cls = cls if cls else value.__class__
         self.name = name
         self.value = value
         self.parents = self.get_parents(parents)
         self.breadcrumb = f"{self.parents}.{self.name}"
+        self._fingerprint = NotImplemented
+
+    @property
+    def fingerprint(self):
+        """Return the fingerprint of the class and the value, or None if the value
+        can't be fingerprinted. It's built on the first comparison.
+        """
+        if self._fingerprint is NotImplemented:
+            value_fingerprint = get_fingerprint(self.value)
+            self._fingerprint = (
+                None
+                if value_fingerprint is None
+                else get_fingerprint.intern((self.cls, value_fingerprint))
+            )
+
+        return self._fingerprint
 
     def get_parents(self, parents):
         if isinstance(parents, (list, tuple)):
@@ -70,6 +158,16 @@ class AttributeObject:
         return parents_str
 
     def __eq__(self, other):
+        if self.lazy_strings:
+            return self.is_lazy_equal(other)
+
+        if other.value is NotImplemented:
+            return False
+
+        fingerprint, other_fingerprint = self.fingerprint, other.fingerprint
+        if fingerprint is not None and other_fingerprint is not None:
+            return fingerprint == other_fingerprint
+
         if (
             (other.value is NotImplemented)
             or (other.cls != self.cls)
@@ -79,6 +177,16 @@ class AttributeObject:
         else:
             return True
 
+    def is_lazy_equal(self, other):
+        if (
+            (other.value is NotImplemented)
+            or (get_lazy_cls(other.cls) != get_lazy_cls(self.cls))
+            or not is_lazy_equal(other.value, self.value)
+        ):
+            return False
+        else:
+            return True
+
     def __str__(self):
         return f"{self.name}"
 
@@ -137,26 +245,85 @@ class ModelObject:
         )
 
 
+def iter_model_attributes(original, tester, meta_options=None):
+    """Yield the type, the attribute of original and the attribute of tester of each
+    Constant, Field and Meta Option of tester, only the given Meta Options if any.
+    """
+    for attr_type in ("constants", "fields", "meta"):
+        original_attrs = getattr(original._meta, attr_type)
+        parents = (
+            [original._meta.name, "Meta"]
+            if attr_type == "meta"
+            else [original._meta.name]
+        )
+
+        for attr, tester_attr in getattr(tester._meta, attr_type).items():
+            if attr_type == "meta" and meta_options is not None:
+                if attr not in meta_options:
+                    continue
+
+            original_attr = original_attrs.get(attr, None)
+            if original_attr is None:
+                original_attr = AttributeObject(attr, NotImplemented, parents)
+
+            yield attr_type, original_attr, tester_attr
+
+
+def compare_model_objects(original, tester, meta_options=None):
+    """Compare Constants, Fields and Meta Options of tester with those of original,
+    only the given Meta Options if any. Return the mismatches as a list of
+    (original attribute, tester attribute) tuples.
+    """
+    return [
+        (original_attr, tester_attr)
+        for _, original_attr, tester_attr in iter_model_attributes(
+            original, tester, meta_options
+        )
+        if not original_attr == tester_attr
+    ]
+
+
 class ModelGenerator:
+    # Snapshot of extracted Models, read instead of extracting them again.
+    snapshot = None
+
     def __call__(self, model, has_id=None):
-        """Retrieve Model Fields, Constants and Meta Options and save them as a dict.
-        Then create ModelObject and return it.
+        """Retrieve Model Fields, Constants and Meta Options and save them as a dict,
+        from the snapshot if it has the Model. Then create ModelObject and return it.
         """
-        self.model = model
-        self.constants = self.get_constants()
-        self.fields = self.get_fields(has_id)
-        self.meta_options = self.get_meta_options()
+        label = get_model_label(model._meta.app_label, model._meta.object_name)
+        data = self.snapshot.get(label) if self.snapshot else None
+        if data is None:
+            data = self.get_data(model)
 
-        model_object = ModelObject(
-            name=self.model.__name__,
-            constants=self.constants,
-            fields=self.fields,
-            meta=self.meta_options,
+        return self.get_object(model.__name__, data, has_id)
+
+    def get_object(self, name, data, has_id=None):
+        """Create the ModelObject named name from the data of a Model.
+        """
+        fields = data["fields"]
+        if has_id is False:
+            fields = {attr: field for attr, field in fields.items() if attr != "id"}
+
+        return ModelObject(
+            name=name, constants=data["constants"], fields=fields, meta=data["meta"]
         )
 
+    def get_data(self, model):
+        """Retrieve Model Fields, Constants and Meta Options and return them as a
+        dict of dicts.
+        """
+        self.model = model
+        self.label = get_model_label(model._meta.app_label, model._meta.object_name)
+        data = {
+            "constants": self.get_constants(),
+            "fields": self.get_fields(has_id=None),
+            "meta": self.get_meta_options(),
+        }
+
         self.clean_instance()
 
-        return model_object
+        return data
 
     @classmethod
     def get_default_meta_options(cls):
@@ -191,16 +358,16 @@ class ModelGenerator:
     def get_field_attrs(self, field):
         """Retrieve Attributes for given Field and return them as a dict.
         """
-        attrs = field.deconstruct()[3]
+        return self.clean_field_attrs(field.deconstruct()[3])
+
+    def clean_field_attrs(self, attrs):
+        """Clean deconstructed Attributes of a Field and return them as a dict.
+        """
         field_attrs = dict()
         for attr, value in attrs.items():
             if attr not in DIRTY_FIELD_ATTRS:
                 # Replace "to" value by 'self' if the value object is the model itself.
-                if (
-                    hasattr(self.model, "_meta")
-                    and attr == "to"
-                    and value == self.model._meta.label
-                ):
+                if attr == "to" and is_same_label(value, self.label):
                     field_attrs[attr] = "self"
                 # If the value is callable, replace it by the callable name.
                 elif callable(value):
@@ -231,10 +398,15 @@ class ModelGenerator:
         """
         return {**self.get_default_meta_options(), **self.model._meta.original_attrs}
 
+    def get_field_names(self):
+        """Retrieve names and attnames of Fields.
+        """
+        return self.model._meta._forward_fields_map.keys()
+
     def is_constant(self, attr, value):
         """Verify if given attribute is a constant.
         """
-        fields = self.model._meta._forward_fields_map.keys()
+        fields = self.get_field_names()
 
         if (
             # Ignore Exception Objects.
@@ -260,3 +432,275 @@ class ModelGenerator:
 
 
 get_model_object = ModelGenerator()
+
+
+class DeclarationGenerator(ModelGenerator):
+    def __call__(
+        self, name, dct, app_label, parents=None, has_id=None, deconstructed=None
+    ):
+        """Retrieve Fields, Constants and Meta Options from the declarations of a
+        Test Class, without building a Django Model. Then create ModelObject and
+        return it, or return None if the declarations need a Django Model.
+
+        Fields already deconstructed can be given by name in deconstructed.
+        """
+        self.name = name
+        self.dct = dct
+        self.parents = parents or ()
+        self.deconstructed = deconstructed or {}
+        self.meta = self.get_meta()
+        self.app_label = getattr(self.meta, "app_label", app_label)
+
+        if not self.is_declarative():
+            return None
+
+        self.label = get_model_label(self.app_label, self.name)
+        self.fields = self.get_fields(has_id)
+        self.constants = self.get_constants()
+        self.meta_options = self.get_meta_options()
+
+        model_object = ModelObject(
+            name=self.name,
+            constants=self.constants,
+            fields=self.fields,
+            meta=self.meta_options,
+        )
+
+        self.clean_instance()
+
+        return model_object
+
+    def get_meta(self):
+        """Retrieve Meta, inherited from Parents if it has no attributes.
+        """
+        meta = self.dct.get("Meta", None)
+        if meta is None or all(is_dunder(attr) for attr in dir(meta)):
+            meta = next(
+                (parent.Meta for parent in self.parents if hasattr(parent, "Meta")),
+                None,
+            )
+
+        return meta
+
+    def is_declarative(self):
+        """Verify if the Django Model would have the declared Fields and Meta
+        Options as they are.
+        """
+        # The Model needs an Application.
+        if self.app_label is None:
+            return False
+
+        # Invalid Meta Options are reported by the Django Model, and some others
+        # are changed when it's built.
+        meta_attrs = vars(self.meta) if self.meta else {}
+        if (
+            any(
+                attr not in DEFAULT_NAMES
+                for attr in meta_attrs
+                if not attr.startswith("_")
+            )
+            or any(getattr(self.meta, option, None) for option in BUILT_META_OPTIONS)
+            or any(not index.name for index in getattr(self.meta, "indexes", []))
+        ):
+            return False
+
+        # Managers and others objects are contributed to the Model.
+        if any(
+            not isinstance(value, (Field, type))
+            and hasattr(value, "contribute_to_class")
+            for value in self.dct.values()
+        ):
+            return False
+
+        if any(
+            not self.is_declarative_field(name, field)
+            for name, field in self.get_declared_fields().items()
+        ):
+            return False
+
+        if any(
+            parent._meta.abstract
+            and (parent._meta.parents or parent._meta.private_fields)
+            for parent in self.parents
+        ):
+            return False
+
+        return True
+
+    def is_declarative_field(self, name, field):
+        """Verify if the Field would be contributed to the Django Model as it is.
+        """
+        remote_field = getattr(field, "remote_field", None)
+
+        if (
+            # Django adds an AutoField 'id' if it isn't the Primary Key.
+            (name == "id" and not field.primary_key)
+            or (remote_field and remote_field.parent_link)
+            # Django renames related name of symmetrical and hidden relations.
+            or (
+                isinstance(field, ManyToManyField)
+                and (
+                    remote_field.symmetrical
+                    or (remote_field.related_name or "").endswith("+")
+                )
+            )
+        ):
+            return False
+        else:
+            return True
+
+    def get_constants(self):
+        """Retrieve Constants and return them as a dict.
+        """
+        constants = dict()
+        for attr, value in self.dct.items():
+            if self.is_constant(attr, value):
+                constants[attr] = value
+
+        return constants
+
+    def get_declared_fields(self):
+        """Retrieve declared Fields and Fields of abstract Parents.
+        """
+        fields = {
+            attr: value for attr, value in self.dct.items() if isinstance(value, Field)
+        }
+        for parent in self.parents:
+            if parent._meta.abstract:
+                opts = parent._meta
+                for field in opts.local_fields + opts.local_many_to_many:
+                    if field.name not in self.dct:
+                        fields.setdefault(field.name, field)
+
+        return fields
+
+    def get_related_attrs(self, field, attrs, models):
+        """Resolve related names and model of a deconstructed relation as Django
+        does when the Field is contributed to the Model, from the models of the
+        resolved relations.
+        """
+        names = {
+            "class": self.name.lower(),
+            "model_name": self.name.lower(),
+            "app_label": self.app_label.lower(),
+        }
+        for attr in ["related_name", "related_query_name"]:
+            if isinstance(attrs.get(attr, None), str):
+                attrs[attr] = attrs[attr] % names
+
+        model = models.get(attrs["to"], None)
+        if self.is_self_relation(attrs["to"]):
+            attrs["to"] = self.label
+        elif model:
+            attrs["to"] = get_model_label(
+                model._meta.app_label,
+                model._meta.object_name,
+                lower=not isinstance(field, ManyToManyField),
+            )
+
+        return attrs
+
+    def is_self_relation(self, relation):
+        """Verify if the relation is a lazy reference to the Model itself.
+        """
+        if relation == "self":
+            return True
+        elif "." in relation:
+            app_label, model_name = relation.split(".")
+        else:
+            app_label, model_name = self.app_label, relation
+
+        return (app_label, model_name.lower()) == (self.app_label, self.name.lower())
+
+    def get_fields(self, has_id):
+        """Retrieve Declared and Inherited Fields and return them as a dict.
+        """
+        declared_fields = self.get_declared_fields()
+        has_pk = any(field.primary_key for field in declared_fields.values())
+
+        fields = dict()
+        field_names = set()
+
+        # Fields inherited from concrete Parents and their links.
+        concrete_parents = [
+            parent._meta.concrete_model
+            for parent in self.parents
+            if not parent._meta.abstract
+        ]
+        for n, parent in enumerate(concrete_parents):
+            for field in get_model_fields(parent):
+                if field.name not in fields:
+                    fields[field.name] = {
+                        "class": field.__class__,
+                        "attrs": self.get_field_attrs(field),
+                    }
+                field_names.update([field.name, field.attname])
+
+            parent_link = OneToOneField(
+                parent,
+                on_delete=CASCADE,
+                auto_created=True,
+                parent_link=True,
+                primary_key=(n == 0 and not has_pk),
+            )
+            parent_link_name = f"{parent._meta.model_name}_ptr"
+            fields[parent_link_name] = {
+                "class": OneToOneField,
+                "attrs": self.get_field_attrs(parent_link),
+            }
+            field_names.update([parent_link_name, f"{parent_link_name}_id"])
+
+        # Declared Fields, with their relations resolved in one pass.
+        declared_attrs = {
+            field_name: (
+                dict(self.deconstructed[field_name])
+                if field_name in self.deconstructed
+                else field.deconstruct()[3]
+            )
+            for field_name, field in declared_fields.items()
+        }
+        relations = {
+            attrs["to"]
+            for field_name, attrs in declared_attrs.items()
+            if declared_fields[field_name].is_relation
+            and not self.is_self_relation(attrs["to"])
+        }
+        models = resolve_relations(self.app_label, relations)
+
+        for field_name, field in declared_fields.items():
+            attrs = declared_attrs[field_name]
+            if field.is_relation:
+                attrs = self.get_related_attrs(field, attrs, models)
+                field_names.add(f"{field_name}_id")
+
+            fields[field_name] = {
+                "class": field.__class__,
+                "attrs": self.clean_field_attrs(attrs),
+            }
+            field_names.add(field_name)
+
+        self.field_names = field_names
+
+        if has_id is False:
+            fields.pop("id", None)
+
+        return fields
+
+    def get_field_names(self):
+        """Retrieve names and attnames of Fields.
+        """
+        return self.field_names
+
+    def get_meta_options(self):
+        """Retrieve declared Meta Options and return them as a dict.
+        """
+        declared_meta_options = {
+            option: getattr(self.meta, option)
+            for option in DEFAULT_NAMES
+            if self.meta and hasattr(self.meta, option)
+        }
+
+        return {**self.get_default_meta_options(), **declared_meta_options}
+
+
+get_declared_model_object = DeclarationGenerator()
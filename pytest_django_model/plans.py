@@ -0,0 +1,125 @@
+# coding: utf-8
+
+import re
+
+import pytest
+from django.db import connections, transaction
+
+# Patterns of the query plan lines reading a whole table, by database vendor. Test
+# tables are empty, so a full scan is the cheapest plan: only the vendors whose
+# planners still use an index on an empty table are checked. MySQL and Oracle
+# planners don't, from their table statistics.
+FULL_SCAN_PATTERNS = {
+    "sqlite": re.compile(r"\bSCAN (?:TABLE )?(\S+)(?!\S)(?! USING)"),
+    "postgresql": re.compile(r"\bSeq Scan on (\S+)"),
+}
+
+# Patterns overriding those above for filtered querysets: walking a whole index
+# to keep the ordering is also a full scan when rows are filtered.
+FILTERED_FULL_SCAN_PATTERNS = {
+    "sqlite": re.compile(r"\bSCAN (?:TABLE )?(\S+)(?!\S)"),
+}
+
+# Statements making the planner avoid full scans when an index can be used, run
+# before explaining a query and reset after.
+PLANNER_SETTINGS = {
+    "postgresql": ("SET LOCAL enable_seqscan = off", "RESET enable_seqscan"),
+}
+
+
+class QueryPlanner:
+    """Retrieve query plans of querysets from their database, once per SQL text.
+    """
+
+    def __init__(self):
+        self.plans = dict()
+
+    def get_plan(self, queryset):
+        """Return the query plan of queryset, from the cache if its SQL text, with
+        parameters as placeholders, was already explained.
+        """
+        sql, params = queryset.query.get_compiler(queryset.db).as_sql()
+        key = (queryset.db, sql)
+        if key not in self.plans:
+            self.plans[key] = self.explain(queryset)
+
+        return self.plans[key]
+
+    def explain(self, queryset):
+        """Return the query plan of queryset, with the planner settings of its
+        database vendor.
+        """
+        connection = connections[queryset.db]
+        settings = PLANNER_SETTINGS.get(connection.vendor, None)
+        if settings is None:
+            return queryset.explain()
+
+        set_statement, reset_statement = settings
+        with transaction.atomic(using=queryset.db), connection.cursor() as cursor:
+            cursor.execute(set_statement)
+            plan = queryset.explain()
+            cursor.execute(reset_statement)
+
+        return plan
+
+    def get_full_scans(self, queryset):
+        """Return the tables read entirely by queryset, or None if full scans can't
+        be found for its database vendor.
+        """
+        vendor = connections[queryset.db].vendor
+        pattern = FULL_SCAN_PATTERNS.get(vendor, None)
+        if queryset.query.has_filters():
+            pattern = FILTERED_FULL_SCAN_PATTERNS.get(vendor, pattern)
+        if pattern is None:
+            return None
+
+        plan = self.get_plan(queryset)
+        return [
+            match.group(1)
+            for line in plan.splitlines()
+            for match in [pattern.search(line)]
+            if match
+        ]
+
+
+query_planner = QueryPlanner()
+
+
+def get_querysets(model, lookups=()):
+    """Return the default queryset of model and the querysets filtered by each
+    lookup, with their description.
+    """
+    manager = model._default_manager
+    querysets = [(f"{model.__name__}.{manager.name}.all()", manager.all())]
+    for lookup in lookups:
+        kwargs = ", ".join(f"{key}={value!r}" for key, value in lookup.items())
+        querysets.append(
+            (
+                f"{model.__name__}.{manager.name}.filter({kwargs})",
+                manager.filter(**lookup),
+            )
+        )
+
+    return querysets
+
+
+def check_query_plans(model, model_object, lookups=()):
+    """Fail if the default queryset of model, with its default ordering, or its
+    querysets filtered by lookups read a whole table.
+    """
+    msgs = list()
+    for description, queryset in get_querysets(model, lookups):
+        tables = query_planner.get_full_scans(queryset)
+        if tables is None:
+            vendor = connections[queryset.db].vendor
+            pytest.skip(
+                f"Full scans can't be found in {vendor} query plans of empty tables."
+            )
+        elif tables:
+            plan = query_planner.get_plan(queryset).splitlines()
+            msgs.append(
+                f"{description} reads the whole table {', '.join(tables)}:\n"
+                + "\n".join(f"  {line}" for line in plan)
+            )
+
+    assert not msgs, "\n".join(msgs)
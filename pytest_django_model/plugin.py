@@ -1,44 +1,281 @@
 # coding: utf-8
 
 import os
+import sys
+from time import perf_counter
 
-from .file import FILE
-from .utils import a_or_an
+import pytest
 
-def assert_msg(left, right):
-    """Return Custom Assertion Message if Objects are equals else return None.
+from .assertrepr import assert_repr, get_mismatch_lines
+from .core import PytestDjangoModel
+from .file import FILE, FileGenerator
+from .impact import impact_index, normalize_path, read_changed_files
+from .matrix import MatrixRunner, get_profile, matrix_worker, parse_settings_matrix
+from .objects import AttributeObject, ModelGenerator
+from .report import get_report_path, model_report
+from .shard import ShardError, model_sharder, parse_shard
+from .snapshot import ModelSnapshot, snapshot_writer
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("django-model")
+    group.addoption(
+        "--model-shard",
+        action="store",
+        dest="model_shard",
+        default=None,
+        metavar="i/n",
+        help="only build and run the model specs of shard i out of n, "
+        "assigned by estimated cost.",
+    )
+    group.addoption(
+        "--model-shard-timings",
+        action="store",
+        dest="model_shard_timings",
+        default=None,
+        metavar="path",
+        help="JSON file of recorded model spec timings, used to assign specs "
+        "to shards and updated at the end of the session.",
+    )
+    group.addoption(
+        "--model-changed",
+        action="store",
+        dest="model_changed",
+        default=None,
+        type=read_changed_files,
+        metavar="path",
+        help="only build and run the model specs affected by the files listed "
+        "in path ('-' for stdin), e.g. the output of 'git diff --name-only'.",
+    )
+    group.addoption(
+        "--model-no-validation",
+        action="store_false",
+        dest="model_validation",
+        default=True,
+        help="don't build and check a Django model from each model spec, read "
+        "its declarations directly instead.",
+    )
+    group.addoption(
+        "--model-lazy-strings",
+        action="store_true",
+        dest="model_lazy_strings",
+        default=False,
+        help="compare lazy translations by message id and context, only "
+        "translating them when these differ.",
+    )
+    group.addoption(
+        "--model-lint-indexes",
+        action="store_true",
+        dest="model_lint_indexes",
+        default=False,
+        help="check that the default ordering, get_latest_by and foreign keys "
+        "of every model spec are supported by an index.",
+    )
+    group.addoption(
+        "--model-large-table-rows",
+        action="store",
+        dest="model_large_table_rows",
+        default=None,
+        type=int,
+        metavar="rows",
+        help="number of rows from which the migrations of model specs declaring "
+        "table_rows must not rewrite or scan their table.",
+    )
+    group.addoption(
+        "--model-settings-matrix",
+        action="store",
+        dest="model_settings_matrix",
+        default=None,
+        type=parse_settings_matrix,
+        metavar="modules",
+        help="run the tests once per settings module of the comma separated "
+        "list, in parallel processes, and merge their reports.",
+    )
+    group.addoption(
+        "--model-report",
+        action="store",
+        dest="model_report",
+        default=None,
+        metavar="path",
+        help="write a JSON Lines record of each attribute compared by the model "
+        "specs to path, as their tests run.",
+    )
+    group.addoption(
+        "--model-report-compact",
+        action="store_true",
+        dest="model_report_compact",
+        default=False,
+        help="only write the mismatches to the --model-report file.",
+    )
+    group.addoption(
+        "--model-snapshot",
+        action="store_true",
+        dest="model_snapshot",
+        default=False,
+        help="with pytest-xdist, extract the installed models once in the "
+        "controller and share them with the workers through a snapshot file.",
+    )
+
+
+def pytest_cmdline_main(config):
+    profiles = config.getoption("model_settings_matrix", None)
+    if not profiles or get_profile():
+        return None
+
+    invocation_params = getattr(config, "invocation_params", None)
+    args = invocation_params.args if invocation_params else sys.argv[1:]
+    rootdir = str(invocation_params.dir) if invocation_params else None
+
+    runner = MatrixRunner(profiles, args, rootdir)
+    results = runner.run()
+
+    sys.stdout.write(f"model-settings-matrix: {len(profiles)} settings modules\n")
+    for line in runner.get_summary(results):
+        sys.stdout.write(f"{line}\n")
+
+    return runner.get_exitstatus(results)
+
+
+def pytest_configure(config):
+    PytestDjangoModel.validation = config.getoption("model_validation", True)
+    FileGenerator.rewrite_asserts = config.getoption("assertmode", None) != "plain"
+    AttributeObject.lazy_strings = config.getoption("model_lazy_strings", False)
+    PytestDjangoModel.lint_indexes = config.getoption("model_lint_indexes", False)
+    large_table_rows = config.getoption("model_large_table_rows", None)
+    if large_table_rows is not None:
+        PytestDjangoModel.large_table_rows = large_table_rows
+
+    changed = config.getoption("model_changed", None)
+    if changed is not None:
+        rootdir = str(config.rootdir)
+        impact_index.configure({normalize_path(path, rootdir) for path in changed})
+
+    shard = config.getoption("model_shard", None)
+    if shard:
+        try:
+            index, total = parse_shard(shard)
+        except ShardError as e:
+            raise pytest.UsageError(f"--model-shard: {e}")
+
+        timings_path = config.getoption("model_shard_timings", None)
+        model_sharder.configure(index, total, timings_path)
+
+    workerinput = getattr(config, "workerinput", {})
+    report_path = config.getoption("model_report", None)
+    if report_path:
+        path = get_report_path(
+            report_path, get_profile(), workerinput.get("workerid", None)
+        )
+        model_report.open(path, config.getoption("model_report_compact", False))
+
+    if workerinput.get("model_snapshot", None):
+        ModelGenerator.snapshot = ModelSnapshot(workerinput["model_snapshot"])
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    if node.config.getoption("model_snapshot", False):
+        path = snapshot_writer.write()
+        if path:
+            node.workerinput["model_snapshot"] = path
+
+
+def get_item_spec_id(item):
+    """Return the spec id of the Test Class of the item, if it has one.
     """
-    get_msg = lambda x: f"assert {left.value} == {right.value}\n" + x
-    value_str = lambda x, y="": f" {x}" if len(str(x)) < 80 else f"{y}\n    {x}"
+    cls = getattr(item, "cls", None)
+    if isinstance(cls, PytestDjangoModel):
+        return f"{cls.__module__}.{cls.__qualname__}"
+    else:
+        return None
 
-    if left.value is NotImplemented:
-        msg = get_msg(
-            f"{left.breadcrumb} doesn't exist, the expected value is:\n"
-            f"  - {right.cls.__name__}: {value_str(right.value)}"
+
+def pytest_runtest_logreport(report):
+    if get_profile():
+        matrix_worker.add(report)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    spec_id = get_item_spec_id(item) if model_sharder.enabled else None
+    start = perf_counter()
+    assert_repr.item = item
+    yield
+    assert_repr.item = None
+    if model_report.enabled and get_item_spec_id(item):
+        model_report.write_spec(item.cls)
+    if spec_id:
+        model_sharder.record(spec_id, perf_counter() - start)
+
+
+def pytest_assertrepr_compare(config, op, left, right):
+    if op == "==":
+        return assert_repr(left, right, config.getoption("verbose", 0))
+
+
+def pytest_terminal_summary(terminalreporter):
+    if impact_index.enabled:
+        terminalreporter.write_line(
+            f"model-changed: {impact_index.selected} model specs affected, "
+            f"{impact_index.deselected} deselected."
         )
-    elif right.value is NotImplemented:
-        msg = get_msg(
-            f"The '{right.parents}' class shouldn't have a '{right.name}' attribute."
+    if model_sharder.enabled:
+        terminalreporter.write_line(
+            f"model-shard {model_sharder.index}/{model_sharder.total}: "
+            f"{model_sharder.selected} model specs selected, "
+            f"{model_sharder.deselected} deselected."
         )
-
-    elif left.cls != right.cls:
-        msg = get_msg(
-            f"{left.breadcrumb} and {right.breadcrumb} are not the same type:\n"
-            f"  - {left.breadcrumb} is {a_or_an(left.cls.__name__)} {left.cls}\n"
-            f"  - {right.breadcrumb} is {a_or_an(right.cls.__name__)} {right.cls}"
+    if model_report.enabled:
+        terminalreporter.write_line(
+            f"model-report: {model_report.records} attributes compared, "
+            f"{model_report.mismatches} mismatches, written to {model_report.path}."
         )
-    elif left.value != right.value:
-        msg = get_msg(
-            f"{left.breadcrumb} and {right.breadcrumb} don't have the same value.\n"
-            f"  - {left.breadcrumb} value is{value_str(left.value, ':')}\n"
-            f"  - {right.breadcrumb} value is{value_str(right.value, ':')}"
+    if snapshot_writer.path:
+        terminalreporter.write_line(
+            f"model-snapshot: {snapshot_writer.count} models extracted once, "
+            f"{len(snapshot_writer.skipped)} left to the workers."
         )
-    else:
-        msg = None
 
-    return msg
+
+def assert_msg(left, right):
+    """Return Custom Assertion Message if Objects are equals else return None.
+    """
+    lines = get_mismatch_lines(left, right)
+    if not lines:
+        return None
+
+    return "\n".join([f"assert {left.value} == {right.value}", *lines])
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    workeroutput = getattr(node, "workeroutput", {})
+    model_sharder.merge(workeroutput.get("model_shard_timings", {}))
+
+
+def write_shard_timings(config):
+    """Write the recorded timings, or send them to the xdist controller, the only
+    one writing the timings file.
+    """
+    workeroutput = getattr(config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["model_shard_timings"] = model_sharder.recorded
+    else:
+        model_sharder.write_timings()
 
 
 def pytest_sessionfinish(session, exitstatus):
+    write_shard_timings(session.config)
+    if get_profile():
+        matrix_worker.write(exitstatus)
+
     if os.path.isfile(FILE):
         os.remove(FILE)
+
+
+def pytest_unconfigure(config):
+    model_report.close()
+    if ModelGenerator.snapshot:
+        ModelGenerator.snapshot.close()
+        ModelGenerator.snapshot = None
+    snapshot_writer.remove()
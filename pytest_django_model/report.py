@@ -0,0 +1,107 @@
+# coding: utf-8
+
+import json
+import os
+
+from .assertrepr import get_cls
+from .fingerprints import get_digest
+from .matrix import get_profile_suffix
+from .objects import iter_model_attributes
+
+
+def get_status(original, tester):
+    """Return 'match' if the attributes are equal, else the kind of mismatch:
+    'missing', 'type' or 'value'.
+    """
+    if original == tester:
+        return "match"
+    elif original.value is NotImplemented:
+        return "missing"
+    elif get_cls(original) != get_cls(tester):
+        return "type"
+    else:
+        return "value"
+
+
+def get_report_path(path, profile=None, worker=None):
+    """Return the path of the report of a settings profile and an xdist worker,
+    which can't share a file.
+    """
+    root, ext = os.path.splitext(path)
+    worker_suffix = f"_{worker}" if worker else ""
+
+    return f"{root}{get_profile_suffix(profile)}{worker_suffix}{ext}"
+
+
+class ModelReport:
+    """Write one JSON record per compared attribute to a JSON Lines file, as each
+    spec is compared. Records aren't kept in memory.
+    """
+
+    def __init__(self):
+        self.file = None
+        self.path = None
+        self.compact = False
+        self.records = 0
+        self.mismatches = 0
+
+    @property
+    def enabled(self):
+        return self.file is not None
+
+    def open(self, path, compact=False):
+        """Start a report at path, only writing mismatches if compact.
+        """
+        self.path = path
+        self.compact = compact
+        self.records = self.mismatches = 0
+        self.file = open(path, "w", encoding="utf-8")
+
+    def write(self, spec, model, original_object, tester_object, meta_options=None):
+        """Compare the attributes of original_object and tester_object and write
+        their records.
+        """
+        for scope, original, tester in iter_model_attributes(
+            original_object, tester_object, meta_options
+        ):
+            status = get_status(original, tester)
+            self.records += 1
+            if status != "match":
+                self.mismatches += 1
+            elif self.compact:
+                continue
+
+            record = {
+                "spec": spec,
+                "model": model._meta.label,
+                "scope": scope,
+                "attribute": tester.name,
+                "status": status,
+                "expected": get_digest(tester.fingerprint),
+                "actual": (
+                    None
+                    if original.value is NotImplemented
+                    else get_digest(original.fingerprint)
+                ),
+            }
+            self.file.write(f"{json.dumps(record)}\n")
+
+        self.file.flush()
+
+    def write_spec(self, spec):
+        """Write the records of a Test Class, spec, when one of its tests runs, so
+        that they're only written by the process running it. Each Test Class is
+        only written once.
+        """
+        pending = vars(spec).get("_report", None)
+        if pending is not None:
+            spec._report = None
+            self.write(*pending)
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+model_report = ModelReport()
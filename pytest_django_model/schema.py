@@ -0,0 +1,368 @@
+# coding: utf-8
+
+from collections import namedtuple
+from itertools import chain
+
+from django.db.models import Field, ForeignKey, ManyToManyField, OneToOneField
+
+from .fingerprints import get_fingerprint
+from .lint import normalize_together
+from .objects import AttributeObject, is_lazy_equal, iter_model_attributes
+from .storage import get_default_vendor
+
+# Costs of a schema change, from the cheapest: only the catalog is updated, an
+# index is built or the whole table is read, or the whole table is rewritten.
+METADATA, INDEX, REWRITE = "metadata", "index", "rewrite"
+COSTS = (METADATA, INDEX, REWRITE)
+COST_LABELS = {
+    METADATA: "metadata-only",
+    INDEX: "an index build or a full scan",
+    REWRITE: "a table rewrite",
+}
+
+VENDORS = ("mysql", "oracle", "postgresql", "sqlite")
+
+# Rows from which a table is large, and expensive changes fail the specs.
+LARGE_TABLE_ROWS = 1000000
+
+# Field attributes only used in Python, which don't change the column.
+PYTHON_FIELD_ATTRS = (
+    "auto_now",
+    "auto_now_add",
+    "blank",
+    "choices",
+    "editable",
+    "error_messages",
+    "help_text",
+    "limit_choices_to",
+    "on_delete",
+    "related_name",
+    "related_query_name",
+    "storage",
+    "unique_for_date",
+    "unique_for_month",
+    "unique_for_year",
+    "upload_to",
+    "validators",
+    "verbose_name",
+)
+
+# Values of Field attributes which aren't deconstructed when they're the default.
+FIELD_DEFAULTS = {
+    "db_constraint": True,
+    "db_index": False,
+    "null": False,
+    "primary_key": False,
+    "unique": False,
+}
+
+# Field classes sharing the column type of their first parent in this list.
+COLUMN_TYPES = (
+    "AutoField",
+    "BigAutoField",
+    "BigIntegerField",
+    "BinaryField",
+    "BooleanField",
+    "CharField",
+    "DateTimeField",
+    "DateField",
+    "DecimalField",
+    "DurationField",
+    "FileField",
+    "FloatField",
+    "ForeignKey",
+    "GenericIPAddressField",
+    "NullBooleanField",
+    "PositiveIntegerField",
+    "PositiveSmallIntegerField",
+    "SmallIntegerField",
+    "IntegerField",
+    "TextField",
+    "TimeField",
+    "UUIDField",
+)
+
+# Meta Options only used in Python, which don't change the table.
+PYTHON_META_OPTIONS = (
+    "base_manager_name",
+    "default_manager_name",
+    "default_permissions",
+    "default_related_name",
+    "get_latest_by",
+    "ordering",
+    "permissions",
+    "required_db_features",
+    "required_db_vendor",
+    "select_on_save",
+    "verbose_name",
+    "verbose_name_plural",
+)
+
+# Meta Options stored as indexes or constraints.
+INDEX_META_OPTIONS = ("constraints", "index_together", "indexes", "unique_together")
+
+
+def get_costs(default, **vendors):
+    return {vendor: vendors.get(vendor, default) for vendor in VENDORS}
+
+
+class SchemaChange(
+    namedtuple("SchemaChange", ["breadcrumb", "change", "vendor", "cost"])
+):
+    """A change of a Field or a Meta Option of a model, with the cost of its
+    migration on a database vendor.
+    """
+
+    def __str__(self):
+        return (
+            f"{self.breadcrumb}: {self.change} is {COST_LABELS[self.cost]} on "
+            f"{self.vendor}"
+        )
+
+
+def get_column_type(cls):
+    for base in cls.__mro__:
+        if base.__name__ in COLUMN_TYPES:
+            return base.__name__
+
+    return cls.__name__
+
+
+def get_max_length_costs(old, new):
+    """Return the costs of changing max_length from old to new. MySQL stores the
+    length of varchar in 1 byte up to 255 bytes, 63 characters in utf8mb4.
+    """
+    if new < old:
+        return get_costs(REWRITE)
+
+    mysql = METADATA if (old <= 63) == (new <= 63) else REWRITE
+    return get_costs(METADATA, mysql=mysql, sqlite=REWRITE)
+
+
+def get_type_costs(old_cls, new_cls):
+    """Return the costs of changing the class of a Field from old_cls to new_cls.
+    """
+    old_type, new_type = get_column_type(old_cls), get_column_type(new_cls)
+    if old_type != new_type:
+        # PostgreSQL varchar and text are binary compatible.
+        if (old_type, new_type) == ("CharField", "TextField"):
+            return get_costs(REWRITE, postgresql=METADATA)
+        return get_costs(REWRITE)
+    elif issubclass(old_cls, OneToOneField) != issubclass(new_cls, OneToOneField):
+        unique = issubclass(new_cls, OneToOneField)
+        return get_costs(INDEX if unique else METADATA, sqlite=REWRITE)
+
+    return get_costs(METADATA)
+
+
+def get_attr_costs(attr, old, new):
+    """Return the costs of changing the attribute attr of a Field from old to new.
+    """
+    if attr == "max_length":
+        return get_max_length_costs(old, new)
+    elif attr == "null":
+        if new:
+            return get_costs(REWRITE, oracle=METADATA, postgresql=METADATA)
+        return get_costs(REWRITE, oracle=INDEX, postgresql=INDEX)
+    elif attr == "default":
+        return get_costs(METADATA, sqlite=REWRITE)
+    elif attr in ("unique", "db_index", "db_constraint"):
+        return get_costs(INDEX if new else METADATA, sqlite=REWRITE)
+    elif attr == "db_column":
+        return get_costs(METADATA, sqlite=REWRITE)
+    elif attr == "max_digits" and old is not None and new is not None:
+        return get_costs(REWRITE, postgresql=METADATA if new > old else REWRITE)
+    else:
+        return get_costs(REWRITE)
+
+
+def get_added_field_changes(field):
+    """Return the changes adding the Field of a model, field, missing from its
+    spec, as (description, costs by vendor) tuples. Existing rows are filled with
+    NULL or the default, and a NOT NULL column without default is backfilled.
+    """
+    cls, attrs = field.cls, field.value
+    if issubclass(cls, ManyToManyField):
+        return [("adding the table", get_costs(METADATA))]
+
+    if attrs.get("null", False):
+        costs = get_costs(METADATA, sqlite=REWRITE)
+    elif "default" in attrs:
+        costs = get_costs(METADATA, mysql=REWRITE, sqlite=REWRITE)
+    else:
+        costs = get_costs(REWRITE)
+
+    if (
+        attrs.get("unique", False)
+        or attrs.get("primary_key", False)
+        or attrs.get("db_index", issubclass(cls, ForeignKey))
+        or issubclass(cls, OneToOneField)
+    ):
+        costs = {
+            vendor: max(cost, INDEX, key=COSTS.index) for vendor, cost in costs.items()
+        }
+
+    return [("adding the column", costs)]
+
+
+def get_field_changes(original, tester):
+    """Return the changes migrating a Field from its spec, tester, to its model,
+    original, as (description, costs by vendor) tuples.
+    """
+    if original.value is NotImplemented:
+        return [("dropping the column", get_costs(REWRITE, postgresql=METADATA))]
+
+    changes = list()
+    if original.cls != tester.cls:
+        change = f"{tester.cls.__name__} -> {original.cls.__name__}"
+        changes.append((change, get_type_costs(tester.cls, original.cls)))
+
+    same_type = get_column_type(tester.cls) == get_column_type(original.cls)
+    for attr in sorted(set(tester.value) | set(original.value)):
+        if attr in PYTHON_FIELD_ATTRS:
+            continue
+
+        old = tester.value.get(attr, FIELD_DEFAULTS.get(attr, None))
+        new = original.value.get(attr, FIELD_DEFAULTS.get(attr, None))
+        # The length is part of the column type, changed along with it.
+        if attr == "max_length" and (not same_type or old is None or new is None):
+            continue
+        if not is_lazy_equal(old, new):
+            changes.append(
+                (f"{attr} {old!r} -> {new!r}", get_attr_costs(attr, old, new))
+            )
+
+    return changes
+
+
+def get_meta_items(option, value):
+    if option in ("index_together", "unique_together"):
+        value = normalize_together(value)
+
+    return {get_fingerprint(item) for item in value or ()}
+
+
+def get_meta_changes(original, tester):
+    """Return the changes migrating a Meta Option from its spec, tester, to its
+    model, original, as (description, costs by vendor) tuples.
+    """
+    option = tester.name
+    if original.value is NotImplemented or option in PYTHON_META_OPTIONS:
+        return []
+
+    if option in INDEX_META_OPTIONS:
+        old = get_meta_items(option, tester.value)
+        new = get_meta_items(option, original.value)
+        if new <= old:
+            return [(f"removing {option}", get_costs(METADATA))]
+
+        sqlite = REWRITE if option == "constraints" else INDEX
+        return [(f"adding {option}", get_costs(INDEX, sqlite=sqlite))]
+    elif option == "order_with_respect_to":
+        return [(f"changing {option}", get_costs(REWRITE, postgresql=METADATA))]
+
+    return [(f"changing {option}", get_costs(METADATA))]
+
+
+def get_attribute_changes(original, tester):
+    """Return the schema changes between the attributes of a model and of its spec,
+    for Fields and Meta Options. Fields missing from the spec are added.
+    """
+    if tester.value is NotImplemented:
+        if original.value is not NotImplemented and issubclass(original.cls, Field):
+            return get_added_field_changes(original)
+        return []
+    elif issubclass(tester.cls, Field):
+        return get_field_changes(original, tester)
+    elif tester.parents.endswith(".Meta"):
+        return get_meta_changes(original, tester)
+
+    return []
+
+
+def get_vendor_cost(costs, vendor):
+    """Return the cost for vendor, the highest one for unknown vendors.
+    """
+    if vendor in costs:
+        return costs[vendor]
+
+    return max(costs.values(), key=COSTS.index)
+
+
+def analyze_schema_changes(original_object, tester_object, vendor, meta_options=None):
+    """Return the SchemaChange of each difference between Fields and Meta Options
+    of a model and of its spec, on a database vendor, including the Fields of the
+    model missing from the spec.
+    """
+    name = tester_object._meta.name
+    added = (
+        ("fields", original, AttributeObject(attr, NotImplemented, name))
+        for attr, original in original_object._meta.fields.items()
+        if attr not in tester_object._meta.fields
+    )
+
+    changes = list()
+    for scope, original, tester in chain(
+        iter_model_attributes(original_object, tester_object, meta_options), added
+    ):
+        if scope == "constants" or original == tester:
+            continue
+
+        for change, costs in get_attribute_changes(original, tester):
+            changes.append(
+                SchemaChange(
+                    tester.breadcrumb, change, vendor, get_vendor_cost(costs, vendor)
+                )
+            )
+
+    return changes
+
+
+def get_schema_lines(original, tester):
+    """Return lines describing the migration costs of an attribute mismatch on
+    each vendor, for assertion reports.
+    """
+    lines = list()
+    for change, costs in get_attribute_changes(original, tester):
+        by_cost = [
+            f"{COST_LABELS[cost]} on {', '.join(v for v in VENDORS if costs[v] == cost)}"
+            for cost in COSTS
+            if cost in costs.values()
+        ]
+        lines.append(f"  - {change}: {'; '.join(by_cost)}")
+
+    if lines:
+        lines.insert(0, "Migrating the spec to the model:")
+
+    return lines
+
+
+def check_schema_changes(
+    model,
+    model_object,
+    tester_object,
+    table_rows,
+    vendor=None,
+    large_table_rows=LARGE_TABLE_ROWS,
+    meta_options=None,
+):
+    """Fail if the table of model is large and migrating it from its spec to the
+    model builds an index, reads or rewrites the whole table.
+    """
+    if table_rows < large_table_rows:
+        return
+
+    vendor = vendor or get_default_vendor()
+    changes = [
+        change
+        for change in analyze_schema_changes(
+            model_object, tester_object, vendor, meta_options
+        )
+        if change.cost != METADATA
+    ]
+
+    assert not changes, (
+        f"{model.__name__} is declared with {table_rows} rows, a large table from "
+        f"{large_table_rows} rows, and its migration from the spec would need:\n"
+        + "\n".join(f"  - {change}" for change in changes)
+    )
@@ -0,0 +1,152 @@
+# coding: utf-8
+
+import json
+import os
+
+from .utils import is_dunder
+
+# Fixed cost of a spec (tester build, validation, generated file round trip),
+# expressed in the same unit as one field, constant or Meta option.
+SPEC_COST = 4
+
+
+class ShardError(ValueError):
+    pass
+
+
+def parse_shard(value):
+    """Parse a 'i/n' string and return it as a (index, total) tuple.
+    """
+    try:
+        index, total = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ShardError(f"'{value}' isn't a valid shard, expected 'i/n'.")
+
+    if not 1 <= index <= total:
+        raise ShardError(f"'{value}' isn't a valid shard, expected 1 <= i <= n.")
+
+    return index, total
+
+
+def get_spec_id(name, dct):
+    """Return a stable identifier for the Test Class defined by name and dct.
+    """
+    module = dct.get("__module__", "")
+    qualname = dct.get("__qualname__", name)
+
+    return f"{module}.{qualname}" if module else qualname
+
+
+def estimate_cost(dct):
+    """Estimate the cost of a Test Class from its declarations, without building
+    anything.
+    """
+    meta = dct.get("Meta", None)
+    meta_options = [
+        option for option in (dir(meta) if meta else []) if not is_dunder(option)
+    ]
+    attrs = [attr for attr in dct if not is_dunder(attr) and attr != "Meta"]
+
+    return SPEC_COST + len(attrs) + len(meta_options)
+
+
+class ModelSharder:
+    """Assign Test Classes to shards by estimated cost.
+
+    Every node imports the same Test Classes in the same order, so a greedy
+    assignment to the least loaded shard gives the same result on all of them
+    without any communication.
+    """
+
+    def __init__(self):
+        self.configure()
+
+    def configure(self, index=None, total=None, timings_path=None):
+        self.index = index
+        self.total = total
+        self.timings_path = timings_path
+
+        self.loads = [0.0] * (total or 0)
+        self.timings = self.read_timings(timings_path)
+        self.ratio = self.get_ratio(self.timings)
+        self.recorded = dict()
+        self.selected, self.deselected = 0, 0
+
+    @property
+    def enabled(self):
+        return bool(self.total)
+
+    @staticmethod
+    def read_timings(path):
+        """Return recorded timings as a dict, or an empty dict if there are none.
+        """
+        if not path or not os.path.isfile(path):
+            return dict()
+
+        with open(path, "r") as f:
+            return json.load(f)
+
+    @staticmethod
+    def get_ratio(timings):
+        """Return the number of cost units per recorded second.
+        """
+        cost = sum(timing["cost"] for timing in timings.values())
+        duration = sum(timing["duration"] for timing in timings.values())
+
+        return cost / duration if cost and duration else None
+
+    def get_cost(self, spec_id, dct):
+        """Return recorded cost of a Test Class if any, else its estimated cost.
+        """
+        timing = self.timings.get(spec_id, None)
+        if timing and self.ratio:
+            return timing["duration"] * self.ratio
+        else:
+            return estimate_cost(dct)
+
+    def is_selected(self, spec_id, dct):
+        """Assign the Test Class to a shard and return True if it's this node's one.
+        """
+        if not self.enabled:
+            return True
+
+        cost = self.get_cost(spec_id, dct)
+        shard = min(range(self.total), key=lambda i: (self.loads[i], i))
+        self.loads[shard] += cost
+
+        if shard == self.index - 1:
+            self.selected += 1
+            self.recorded[spec_id] = {"cost": estimate_cost(dct), "duration": 0.0}
+            return True
+        else:
+            self.deselected += 1
+            return False
+
+    def record(self, spec_id, duration):
+        """Add duration to the recorded time of a selected Test Class.
+        """
+        if spec_id in self.recorded:
+            self.recorded[spec_id]["duration"] += duration
+
+    def merge(self, recorded):
+        """Merge the timings recorded by an xdist worker. Every worker builds the
+        specs of the shard but only one runs the tests of each, so the longest
+        duration is kept.
+        """
+        for spec_id, timing in recorded.items():
+            current = self.recorded.get(spec_id, None)
+            if current is None or timing["duration"] > current["duration"]:
+                self.recorded[spec_id] = timing
+
+    def write_timings(self):
+        """Merge recorded timings of this node into the timings file.
+        """
+        if not self.enabled or not self.timings_path:
+            return
+
+        timings = {**self.read_timings(self.timings_path), **self.recorded}
+        with open(self.timings_path, "w") as f:
+            json.dump(timings, f, indent=2, sort_keys=True)
+
+
+model_sharder = ModelSharder()
@@ -0,0 +1,128 @@
+# coding: utf-8
+
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+
+from django.apps import apps
+
+from .objects import get_model_object
+from .utils import get_model_label
+
+# Header of snapshot files: a magic number and the offset of the index of records.
+SNAPSHOT_MAGIC = b"PDMSNAP1"
+SNAPSHOT_HEADER = struct.Struct(f"<{len(SNAPSHOT_MAGIC)}sQ")
+
+
+class SnapshotError(Exception):
+    pass
+
+
+def write_snapshot(path, records):
+    """Write records, a dict of picklable values by label, to a snapshot file at
+    path. Each value is pickled on its own, so it can be read without the others.
+    Return the labels of the values which couldn't be pickled.
+    """
+    index, skipped = dict(), list()
+    with open(path, "wb") as f:
+        f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, 0))
+        for label, value in records.items():
+            try:
+                data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, TypeError, AttributeError):
+                skipped.append(label)
+                continue
+            index[label] = (f.tell(), len(data))
+            f.write(data)
+
+        index_offset = f.tell()
+        f.write(pickle.dumps(index, protocol=pickle.HIGHEST_PROTOCOL))
+        f.seek(0)
+        f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, index_offset))
+
+    return skipped
+
+
+class ModelSnapshot:
+    """Read Models extracted by ModelGenerator from a snapshot file, mapped in
+    memory and unpickled on demand.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.cache = dict()
+
+        with open(path, "rb") as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, index_offset = SNAPSHOT_HEADER.unpack_from(self.buffer)
+        if magic != SNAPSHOT_MAGIC:
+            self.close()
+            raise SnapshotError(f"'{path}' isn't a model snapshot.")
+        self.index = pickle.loads(self.buffer[index_offset:])
+
+    def __contains__(self, label):
+        return label in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def get(self, label):
+        """Return the extracted data of the Model with the given label, or None if
+        it isn't in the snapshot.
+        """
+        if label not in self.index:
+            return None
+        if label not in self.cache:
+            offset, size = self.index[label]
+            self.cache[label] = pickle.loads(self.buffer[offset : offset + size])
+
+        return self.cache[label]
+
+    def close(self):
+        self.buffer.close()
+
+
+class SnapshotWriter:
+    """Extract the installed Models once and write them to a temporary snapshot
+    file, shared with the xdist workers.
+    """
+
+    def __init__(self):
+        self.path = None
+        self.count = 0
+        self.skipped = list()
+
+    def write(self):
+        """Write the snapshot on the first call and return its path, or None if the
+        Django applications aren't loaded.
+        """
+        if self.path is None and apps.ready:
+            records, skipped = dict(), list()
+            for model in apps.get_models(include_auto_created=True):
+                label = get_model_label(model._meta.app_label, model._meta.object_name)
+                try:
+                    records[label] = get_model_object.get_data(model)
+                except Exception:
+                    # Workers extract it themselves, reporting the error if a spec
+                    # references it.
+                    skipped.append(label)
+
+            fd, self.path = tempfile.mkstemp(
+                prefix="pytest_django_model_", suffix=".snapshot"
+            )
+            os.close(fd)
+            self.skipped = skipped + write_snapshot(self.path, records)
+            self.count = len(records) + len(skipped) - len(self.skipped)
+
+        return self.path
+
+    def remove(self):
+        if self.path and os.path.isfile(self.path):
+            os.remove(self.path)
+        self.path = None
+
+
+snapshot_writer = SnapshotWriter()
@@ -0,0 +1,228 @@
+# coding: utf-8
+
+from collections import namedtuple
+from math import ceil
+
+from django.apps import apps
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import ForeignKey, ManyToManyField
+
+from .lint import get_meta_value, normalize_together
+
+# Estimated widths in bytes of the column of each field class, by database vendor.
+# Variable-length fields are estimated at their maximum in-row width.
+DEFAULT_WIDTHS = {
+    "AutoField": 4,
+    "BigAutoField": 8,
+    "BigIntegerField": 8,
+    "BinaryField": 2048,
+    "BooleanField": 1,
+    "DateField": 4,
+    "DateTimeField": 8,
+    "DecimalField": 8,
+    "DurationField": 8,
+    "FloatField": 8,
+    "GenericIPAddressField": 39,
+    "IntegerField": 4,
+    "NullBooleanField": 1,
+    "PositiveIntegerField": 4,
+    "PositiveSmallIntegerField": 2,
+    "SmallIntegerField": 2,
+    "TextField": 2048,
+    "TimeField": 8,
+    "UUIDField": 16,
+}
+VENDOR_WIDTHS = {
+    "mysql": {
+        "BinaryField": 768,
+        "DateField": 3,
+        "DateTimeField": 8,
+        "TextField": 768,
+        "TimeField": 3,
+        "UUIDField": 32,
+    },
+    "oracle": {"BinaryField": 4000, "TextField": 4000, "UUIDField": 32},
+    "postgresql": {"BinaryField": 2032, "GenericIPAddressField": 19, "TextField": 2032},
+    "sqlite": {
+        "DateField": 10,
+        "DateTimeField": 26,
+        "TextField": 1024,
+        "BinaryField": 1024,
+        "TimeField": 15,
+        "UUIDField": 32,
+    },
+}
+
+# Width of DecimalField by max_digits, on vendors storing them as packed digits.
+DECIMAL_WIDTHS = {
+    "mysql": lambda digits: ceil(digits / 9) * 4 + 4,
+    "postgresql": lambda digits: ceil(digits / 4) * 2 + 8,
+}
+
+# Maximum bytes per character of CharField, and length header of variable-length
+# columns, by database vendor.
+CHAR_BYTES = {"mysql": 4, "oracle": 4, "postgresql": 4, "sqlite": 4}
+VARLEN_HEADER = {"mysql": 2, "oracle": 2, "postgresql": 4, "sqlite": 2}
+
+# Fixed overhead in bytes of a row and of an index entry, by database vendor.
+ROW_HEADER = {"mysql": 18, "oracle": 3, "postgresql": 24, "sqlite": 4}
+INDEX_ENTRY_HEADER = {"mysql": 5, "oracle": 10, "postgresql": 16, "sqlite": 8}
+
+# Default max_length of field classes which don't require it.
+DEFAULT_MAX_LENGTHS = {"FileField": 100, "ImageField": 100, "FilePathField": 100}
+
+
+class StorageEstimate(
+    namedtuple("StorageEstimate", ["vendor", "columns", "row_width", "indexes"])
+):
+    """Estimated width of the columns and of a row of a model, and the columns of
+    its indexes.
+    """
+
+    @property
+    def index_count(self):
+        return len(self.indexes)
+
+    @property
+    def index_width(self):
+        """Return the estimated bytes added to all indexes by a row.
+        """
+        header = INDEX_ENTRY_HEADER.get(self.vendor, 8)
+        return sum(
+            header + sum(self.columns.get(column, 0) for column in index)
+            for index in self.indexes
+        )
+
+
+def get_default_vendor():
+    return connections[DEFAULT_DB_ALIAS].vendor
+
+
+def get_field_width(cls, attrs, vendor, pk_width=None):
+    """Return the estimated width of the column of a field, or 0 if it has none.
+    pk_width is the width of the primary key of the model of the field, for
+    relations to 'self'.
+    """
+    if issubclass(cls, ManyToManyField):
+        return 0
+    elif issubclass(cls, ForeignKey):
+        if attrs.get("to", None) == "self" and pk_width:
+            return pk_width
+        return get_related_width(attrs.get("to", None), vendor)
+
+    widths = {**DEFAULT_WIDTHS, **VENDOR_WIDTHS.get(vendor, {})}
+    for base in cls.__mro__:
+        name = base.__name__
+        if name == "DecimalField" and vendor in DECIMAL_WIDTHS:
+            return DECIMAL_WIDTHS[vendor](attrs.get("max_digits", None) or 0)
+        elif name in widths:
+            return widths[name]
+        elif name in DEFAULT_MAX_LENGTHS or name == "CharField":
+            max_length = attrs.get("max_length", DEFAULT_MAX_LENGTHS.get(name, 0))
+            header = VARLEN_HEADER.get(vendor, 2)
+            return (max_length or 0) * CHAR_BYTES.get(vendor, 4) + header
+
+    return 0
+
+
+def get_related_width(to, vendor):
+    """Return the width of the primary key of the model a relation points to, or
+    the width of an integer if it can't be found.
+    """
+    try:
+        model = apps.get_model(to) if isinstance(to, str) else to
+        pk = model._meta.pk
+    except (AttributeError, LookupError, ValueError):
+        return DEFAULT_WIDTHS["IntegerField"]
+
+    if isinstance(pk, ForeignKey):
+        return get_related_width(pk.related_model, vendor)
+
+    return get_field_width(pk.__class__, pk.deconstruct()[3], vendor)
+
+
+def get_index_columns(model_object):
+    """Return the columns of each index of a ModelObject as a list of tuples.
+    """
+    indexes = list()
+    for name, attribute_object in model_object._meta.fields.items():
+        attrs = attribute_object.value
+        if issubclass(attribute_object.cls, ManyToManyField):
+            continue
+        if (
+            attrs.get("primary_key", False)
+            or attrs.get("unique", False)
+            or attrs.get("db_index", issubclass(attribute_object.cls, ForeignKey))
+        ):
+            indexes.append((name,))
+
+    for option in ("unique_together", "index_together"):
+        for fields in normalize_together(get_meta_value(model_object, option, ())):
+            indexes.append(tuple(fields))
+    for option in ("indexes", "constraints"):
+        for index in get_meta_value(model_object, option, ()) or ():
+            fields = getattr(index, "fields", None)
+            if fields:
+                indexes.append(tuple(field.lstrip("-") for field in fields))
+
+    return indexes
+
+
+def estimate_storage(model_object, vendor=None):
+    """Estimate the row width and the indexes of a ModelObject for a database
+    vendor, the one of the default database if it isn't given.
+    """
+    vendor = vendor or get_default_vendor()
+
+    fields = model_object._meta.fields
+    pk_width = next(
+        (
+            get_field_width(attribute_object.cls, attribute_object.value, vendor)
+            for attribute_object in fields.values()
+            if attribute_object.value.get("primary_key", False)
+        ),
+        None,
+    )
+
+    columns = dict()
+    nullable = 0
+    for name, attribute_object in fields.items():
+        width = get_field_width(
+            attribute_object.cls, attribute_object.value, vendor, pk_width
+        )
+        if width:
+            columns[name] = width
+            nullable += bool(attribute_object.value.get("null", False))
+
+    # PostgreSQL and MySQL keep a bitmap of null columns in each row.
+    null_bitmap = ceil(nullable / 8) if vendor in ("mysql", "postgresql") else 0
+    row_width = ROW_HEADER.get(vendor, 0) + null_bitmap + sum(columns.values())
+
+    return StorageEstimate(vendor, columns, row_width, get_index_columns(model_object))
+
+
+def check_storage(
+    model, model_object, max_row_width=None, max_indexes=None, vendor=None
+):
+    """Fail if the estimated storage of a model exceeds the given budgets.
+    """
+    estimate = estimate_storage(model_object, vendor)
+    name = model_object._meta.name
+
+    msgs = list()
+    if max_row_width is not None and estimate.row_width > max_row_width:
+        widest = sorted(estimate.columns.items(), key=lambda item: -item[1])[:3]
+        msgs.append(
+            f"{name} rows are estimated at {estimate.row_width} bytes on "
+            f"{estimate.vendor}, over the budget of {max_row_width} bytes. Widest "
+            f"columns: {', '.join(f'{column} ({width})' for column, width in widest)}."
+        )
+    if max_indexes is not None and estimate.index_count > max_indexes:
+        indexes = ", ".join(f"({', '.join(index)})" for index in estimate.indexes)
+        msgs.append(
+            f"{name} has {estimate.index_count} indexes, over the budget of "
+            f"{max_indexes}: {indexes}, adding about {estimate.index_width} bytes "
+            f"per row."
+        )
+
+    assert not msgs, "\n".join(msgs)
@@ -1,6 +1,7 @@
 # coding: utf-8
 
 import os
+from contextlib import contextmanager
 
 import pytest
 from django import get_version
@@ -14,19 +15,29 @@ DEBUG = True if os.environ.get("DEBUG", None) else False
 
 # DJANGO UTILS
 ##############
-def get_django_all_models():
+def get_django_apps():
     if version.parse(DJANGO_VERSION) < version.parse("1.7.0"):
         from django.db.models.loading import cache
 
-        all_models = cache.app_models
+        django_apps = cache
     else:
         from django.apps import apps
 
-        all_models = apps.all_models
+        django_apps = apps
+
+    return django_apps
+
+
+def get_django_all_models():
+    if version.parse(DJANGO_VERSION) < version.parse("1.7.0"):
+        all_models = django_apps.app_models
+    else:
+        all_models = django_apps.all_models
 
     return all_models
 
 
+django_apps = get_django_apps()
 django_all_models = get_django_all_models()
 
 
@@ -37,6 +48,122 @@ def delete_django_model(app, model):
         pass
 
 
+def expire_model_caches(models):
+    """Expire the Options caches of models and of the models they're related to,
+    e.g. their reverse relations, leaving the caches of the other models.
+    """
+    related = set(models)
+    for model in models:
+        opts = model._meta
+        related.update(opts.parents)
+        for field in opts.local_fields + opts.local_many_to_many:
+            remote_model = getattr(field.remote_field, "model", None)
+            if isinstance(remote_model, type):
+                related.add(remote_model)
+
+    if hasattr(django_apps.get_models, "cache_clear"):
+        django_apps.get_models.cache_clear()
+    for model in related:
+        if hasattr(model._meta, "_expire_cache"):
+            model._meta._expire_cache()
+
+
+@contextmanager
+def isolate_django_models(app):
+    """Remove the models registered in app and the lazy relation operations left
+    pending inside the block.
+    """
+    pending_operations = getattr(django_apps, "_pending_operations", {})
+    pending = {key: len(operations) for key, operations in pending_operations.items()}
+    models = set(django_all_models[app])
+
+    try:
+        yield
+    finally:
+        for key in list(pending_operations):
+            if key in pending:
+                del pending_operations[key][pending[key] :]
+            else:
+                del pending_operations[key]
+
+        removed = [
+            django_all_models[app][model]
+            for model in set(django_all_models[app]) - models
+        ]
+        for model in removed:
+            delete_django_model(app, model._meta.model_name)
+
+        expire_model_caches(removed)
+
+
+class RelationResolver:
+    """Resolve lazy relation references in batch, from an index of the registered
+    models which is only rebuilt when the registry changes.
+    """
+
+    def __init__(self):
+        self.index = dict()
+        self.key = None
+
+    def get_index(self):
+        """Return registered models by (app_label, model_name), rebuilt if models
+        were added, deleted or replaced since the last call.
+        """
+        # The index keeps the models alive, so their ids aren't reused.
+        key = tuple(
+            (app_label, model_name, id(model))
+            for app_label, models in django_all_models.items()
+            for model_name, model in models.items()
+        )
+        if key != self.key:
+            self.index = {
+                (app_label, model_name): model
+                for app_label, models in django_all_models.items()
+                for model_name, model in models.items()
+            }
+            self.key = key
+
+        return self.index
+
+    def __call__(self, app_label, relations):
+        """Return a dict of each relation and the model it resolves to, or None if
+        the model isn't registered.
+        """
+        index = self.get_index()
+
+        models = dict()
+        for relation in relations:
+            if "." in relation:
+                relation_app_label, model_name = relation.split(".")
+            else:
+                relation_app_label, model_name = app_label, relation
+
+            models[relation] = index.get((relation_app_label, model_name.lower()))
+
+        return models
+
+
+resolve_relations = RelationResolver()
+
+
+def get_model_label(app_label, object_name, lower=True):
+    """Return the label of a model as it appears in deconstructed relations. Since
+    Django 3.0, ForeignKey lower-cases it but ManyToManyField doesn't.
+    """
+    if lower and version.parse(DJANGO_VERSION) >= version.parse("3.0.0"):
+        label = f"{app_label}.{object_name.lower()}"
+    else:
+        label = f"{app_label}.{object_name}"
+
+    return label
+
+
+def is_same_label(value, label):
+    """Verify if value is the label of a model, whatever its case.
+    """
+    return isinstance(value, str) and value.lower() == label.lower()
+
+
 def get_model_fields(model):
     if version.parse(DJANGO_VERSION) < version.parse("1.8.0"):
         fields = model._meta.fields + model._meta.local_many_to_many
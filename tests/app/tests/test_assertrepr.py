@@ -0,0 +1,111 @@
+# coding: utf-8
+
+import sys
+
+import pytest
+
+from pytest_django_model.assertrepr import (
+    REPR_MAXSIZE,
+    AssertRepr,
+    get_repr_maxsize,
+)
+from pytest_django_model.file import FileGenerator
+from pytest_django_model.objects import AttributeObject, ModelObject
+from pytest_django_model.plugin import assert_msg
+
+
+def test_get_repr_maxsize():
+    assert get_repr_maxsize(0) == REPR_MAXSIZE
+    assert get_repr_maxsize(1) == REPR_MAXSIZE * 4
+    assert get_repr_maxsize(2) == sys.maxsize
+    assert get_repr_maxsize(-1) == REPR_MAXSIZE
+
+
+def test_assert_repr():
+    assert_repr = AssertRepr()
+
+    choices = [(str(i), "choice" * 10) for i in range(100)]
+    original = AttributeObject("kind", {"choices": choices}, "Book")
+    tester = AttributeObject("kind", {"choices": choices[:-1]}, "TestBook")
+
+    lines = assert_repr(original, tester)
+    assert lines[0] == "Book.kind == TestBook.kind"
+    assert lines[1] == "Book.kind and TestBook.kind don't have the same value."
+    assert all(len(line) <= REPR_MAXSIZE + 32 for line in lines)
+
+    verbose_lines = assert_repr(original, tester, verbosity=1)
+    assert len(verbose_lines[2]) > len(lines[2])
+    assert all(len(line) <= REPR_MAXSIZE * 4 + 32 for line in verbose_lines)
+
+    full_lines = assert_repr(original, tester, verbosity=2)
+    assert full_lines[2] == f"  - Book.kind value is: {original.value!r}"
+
+    missing = AttributeObject("kind", NotImplemented, "Book")
+    assert assert_repr(missing, tester)[1] == (
+        "Book.kind doesn't exist, the expected value is:"
+    )
+    assert assert_repr(original, AttributeObject("kind", 1, "TestBook"))[1] == (
+        "Book.kind and TestBook.kind are not the same type:"
+    )
+
+    assert assert_repr(original, tester.value) is None
+    assert assert_repr(1, 2) is None
+
+
+@pytest.mark.xfail(strict=True)
+def test_assert_repr__xfail(request):
+    assert_repr = AssertRepr()
+    assert_repr.item = request.node
+
+    original = AttributeObject("kind", {"max_length": 1}, "Book")
+    tester = AttributeObject("kind", {"max_length": 2}, "TestBook")
+    lines = assert_repr(original, tester)
+    assert lines == ["Book.kind == TestBook.kind"]
+
+    assert original == tester
+
+
+@pytest.mark.xfail(False, reason="The condition is false.")
+def test_assert_repr__xfail_condition(request):
+    assert_repr = AssertRepr()
+    assert_repr.item = request.node
+    assert not assert_repr.is_xfail()
+
+    original = AttributeObject("kind", {"max_length": 1}, "Book")
+    tester = AttributeObject("kind", {"max_length": 2}, "TestBook")
+    assert len(assert_repr(original, tester)) > 1
+
+
+@pytest.mark.xfail(raises=TypeError, strict=True)
+def test_assert_repr__xfail_raises(request):
+    assert_repr = AssertRepr()
+    assert_repr.item = request.node
+
+    # An AssertionError isn't the expected failure.
+    assert not assert_repr.is_xfail()
+    raise TypeError()
+
+
+def test_assert_msg(monkeypatch):
+    original = AttributeObject("kind", {"max_length": 1}, "Book")
+    tester = AttributeObject("kind", {"max_length": 2}, "TestBook")
+
+    msg = assert_msg(original, tester)
+    assert msg.splitlines() == [
+        "assert {'max_length': 1} == {'max_length': 2}",
+        *AssertRepr()(original, tester, verbosity=2)[1:],
+    ]
+    assert assert_msg(original, original) is None
+
+    # Without assertion rewriting, generated asserts give assert_msg.
+    monkeypatch.setattr(FileGenerator, "rewrite_asserts", False)
+    fields = {"kind": {"class": str, "attrs": {"max_length": 1}}}
+    original_object = ModelObject("AssertPlain", {}, fields, {})
+    fields = {"kind": {"class": str, "attrs": {"max_length": 2}}}
+    tester_object = ModelObject("TestAssertPlain", {}, fields, {})
+    tester_object._meta.model = original_object
+
+    functions = FileGenerator(original_object, tester_object).get_functions()
+    with pytest.raises(AssertionError) as excinfo:
+        functions["test_fields"](tester_object)
+    assert "AssertPlain.kind and TestAssertPlain.kind don't have" in str(excinfo.value)
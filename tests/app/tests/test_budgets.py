@@ -0,0 +1,78 @@
+# coding: utf-8
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.db.models import CharField
+
+from pytest_django_model.budgets import check_budgets
+from pytest_django_model.core import PytestDjangoModel
+
+from .utils import django_tables, get_django_model, get_meta_class
+
+
+def clean(self):
+    if type(self).objects.filter(title=self.title).exists():
+        raise ValidationError("Duplicated title.")
+
+
+@pytest.fixture
+def budget_model():
+    model = get_django_model(
+        "BudgetModel",
+        constants={"clean": clean},
+        fields={"title": {"class": CharField, "attrs": {"max_length": 8}}},
+        meta={},
+    )
+    with django_tables(model):
+        yield model
+
+
+@pytest.mark.django_db(transaction=True)
+def test_check_budgets(budget_model):
+    kwargs = {"title": "title"}
+    check_budgets(
+        budget_model,
+        None,
+        max_init_time=1,
+        max_full_clean_queries=1,
+        max_save_queries=1,
+        instance_kwargs=kwargs,
+    )
+
+    # Specs check the behaviour of their Model against their budgets.
+    Spec = PytestDjangoModel(
+        "TestBudgetModel",
+        (),
+        {
+            "Meta": get_meta_class(
+                model=budget_model,
+                max_init_time=0,
+                max_full_clean_queries=0,
+                max_save_queries=1,
+                instance_kwargs=lambda: {"title": "other"},
+            )
+        },
+    )
+    (mark,) = Spec.test_budgets.pytestmark
+    assert mark.name == "django_db"
+
+    with pytest.raises(AssertionError) as excinfo:
+        Spec.test_budgets(Spec)
+    msg = str(excinfo.value)
+    assert "BudgetModel() takes" in msg and "over the budget of 0.0us" in msg
+    assert "BudgetModel.full_clean() runs 1 queries, over the budget of 0" in msg
+    assert "BudgetModel.save()" not in msg
+
+
+@pytest.mark.django_db(transaction=True)
+def test_check_budgets__invalid_instance(budget_model):
+    budget_model.objects.create(title="title")
+
+    # Invalid instances fail the budgets instead of erroring.
+    with pytest.raises(AssertionError, match="isn't valid: Duplicated title."):
+        check_budgets(
+            budget_model,
+            None,
+            max_full_clean_queries=1,
+            instance_kwargs={"title": "title"},
+        )
@@ -0,0 +1,98 @@
+# coding: utf-8
+
+import subprocess
+import sys
+
+import pytest
+from django.db.models import CASCADE, CharField, ForeignKey, IntegerField
+
+from pytest_django_model import compare, compare_many
+from pytest_django_model.compare import ModelComparator
+from pytest_django_model.core import InvalidModelError
+from pytest_django_model.utils import delete_django_model
+
+from .conftest import APP_LABEL
+from .utils import get_django_model, get_meta_class, model_exists
+
+
+def test_compare():
+    fields = {
+        "title": {"class": CharField, "attrs": {"max_length": 8}},
+        "rank": {"class": IntegerField, "attrs": {"default": 0}},
+    }
+    original = get_django_model(
+        "CompareOriginal",
+        constants={"COLOR": "blue"},
+        fields=fields,
+        meta={"ordering": ("title",)},
+    )
+
+    class Spec:
+        class Meta:
+            model = original
+            ordering = ("title",)
+
+        COLOR = "blue"
+        title = CharField(max_length=8)
+        rank = IntegerField(default=0)
+
+    try:
+        comparison = compare(original, Spec)
+        assert comparison and comparison.mismatches == []
+        # Spec Data is cached by class.
+        assert compare(original, Spec).mismatches == []
+        assert len(compare.spec_objects) == 1
+
+        (mismatches, missing, relation) = [
+            comparison.mismatches
+            for comparison in compare_many(
+                [
+                    (
+                        original,
+                        {
+                            "Meta": get_meta_class(ordering=("-title",)),
+                            "COLOR": "red",
+                            "title": IntegerField(),
+                        },
+                    ),
+                    (original, {"slug": CharField(max_length=8)}),
+                    # Built as a Django Model, then removed.
+                    (
+                        original,
+                        {
+                            "Meta": get_meta_class(order_with_respect_to="parent"),
+                            "parent": ForeignKey(original, on_delete=CASCADE),
+                        },
+                    ),
+                ]
+            )
+        ]
+    finally:
+        delete_django_model(APP_LABEL, original.__name__)
+
+    assert {mismatch.breadcrumb: mismatch.kind for mismatch in mismatches} == {
+        "CompareOriginalSpec.COLOR": "value",
+        "CompareOriginalSpec.title": "type",
+        "CompareOriginalSpec.Meta.ordering": "value",
+    }
+    # All Meta Options are compared, as in Test Classes.
+    assert [mismatch.kind for mismatch in missing] == ["missing", "type"]
+    assert "CompareOriginal.slug doesn't exist" in missing[0].message
+    assert "CompareOriginalSpec.parent" in [
+        mismatch.breadcrumb for mismatch in relation
+    ]
+    assert not model_exists("CompareOriginalSpec")
+
+
+def test_compare__invalid_model():
+    with pytest.raises(InvalidModelError):
+        ModelComparator()("CompareOriginal", {})
+
+
+def test_compare__without_plugin():
+    # The comparison API doesn't import the pytest plugin.
+    code = (
+        "import sys, pytest_django_model.compare; "
+        "sys.exit('pytest_django_model.plugin' in sys.modules)"
+    )
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
@@ -1,7 +1,7 @@
 # coding: utf-8
 
 import pytest
-from django.db.models import CharField
+from django.db.models import CASCADE, CharField, ForeignKey, ManyToManyField
 from hypothesis import assume, event
 from hypothesis import strategies as st
 from hypothesis.stateful import Bundle, RuleBasedStateMachine, consumes, rule
@@ -12,8 +12,14 @@ from pytest_django_model.core import (
     PytestDjangoModel,
     get_invalid_model_msg,
 )
-from pytest_django_model.objects import get_model_object
-from pytest_django_model.utils import delete_django_model, get_model_fields
+from pytest_django_model.objects import get_declared_model_object, get_model_object
+from pytest_django_model.utils import (
+    delete_django_model,
+    django_all_models,
+    django_apps,
+    get_model_fields,
+    is_dunder,
+)
 
 from .conftest import APP_LABEL
 from .factories import (
@@ -175,6 +181,46 @@ class StatefulTestPytestDjangoModel(RuleBasedStateMachine):
 
         assert not model_exists(name)
 
+    @rule(data=consumes(data))
+    def assert_declarations(self, data):
+        original, tester, parents = data.original, data.tester, data.parents
+        name, dct = data.tester.name, data.dct
+
+        # Remove PytestDjangoModel Meta attributes.
+        meta_attrs = {
+            attr: value
+            for attr, value in vars(dct["Meta"]).items()
+            if not is_dunder(attr) and attr not in ("model", "parents")
+        }
+        dct = {**dct, "Meta": get_meta_class(**meta_attrs)}
+        cleaned_dct = PytestDjangoModel.get_cleaned_tester(PytestDjangoModel, dct)
+
+        try:
+            django_model = PytestDjangoModel.get_tester(
+                PytestDjangoModel, name, dct, original.django_model, tuple(parents)
+            )
+            model_object = get_model_object(django_model, has_id=False)
+        except Exception as e:
+            pytest.fail(e)
+        finally:
+            delete_django_model(APP_LABEL, name)
+
+        declared_model_object = get_declared_model_object(
+            name, cleaned_dct, APP_LABEL, tuple(parents), has_id=False
+        )
+
+        # Declarations give the same data as the Django Model.
+        for attr_type in ["constants", "fields", "meta"]:
+            attrs = getattr(model_object._meta, attr_type)
+            declared_attrs = getattr(declared_model_object._meta, attr_type)
+
+            assert attrs.keys() == declared_attrs.keys()
+            for attr, attribute_object in attrs.items():
+                assert attribute_object == declared_attrs[attr]
+                assert declared_attrs[attr] == attribute_object
+
+        assert not model_exists(name)
+
     @rule(data=consumes(data))
     def assert_no_meta(self, data):
         original, tester, parents = data.original, data.tester, data.parents
@@ -275,3 +321,183 @@ class StatefulTestPytestDjangoModel(RuleBasedStateMachine):
 
 
 TestPytestDjangoModel = StatefulTestPytestDjangoModel.TestCase
+
+
+def test_pytest_django_model__isolation():
+    original = get_django_model(
+        "IsolationOriginal",
+        constants={},
+        fields={"title": {"class": CharField, "attrs": {"max_length": 8}}},
+        meta={},
+    )
+    pending_operations = {
+        key: list(operations)
+        for key, operations in django_apps._pending_operations.items()
+    }
+    models = set(django_all_models[APP_LABEL])
+
+    dct = {
+        "Meta": get_meta_class(model=original),
+        "title": CharField(max_length=8),
+        "original": ForeignKey(
+            f"{APP_LABEL}.IsolationOriginal", on_delete=CASCADE, related_name="+"
+        ),
+        "tags": ManyToManyField(original, related_name="+"),
+    }
+    try:
+        PytestDjangoModel("TestIsolation", (), dct)
+    except Exception as e:
+        pytest.fail(e)
+    finally:
+        delete_django_model(APP_LABEL, original.__name__)
+
+    # Tester, its auto created models and its pending relations are removed.
+    assert set(django_all_models[APP_LABEL]) == models - {"isolationoriginal"}
+    assert dict(django_apps._pending_operations) == pending_operations
+
+
+@pytest.mark.parametrize("validation", [True, False])
+def test_pytest_django_model__inheritance(monkeypatch, validation):
+    monkeypatch.setattr(PytestDjangoModel, "validation", validation)
+    monkeypatch.setattr(PytestDjangoModel, "tester_data", {})
+    testers = list()
+    get_tester = PytestDjangoModel.get_tester
+    monkeypatch.setattr(
+        PytestDjangoModel,
+        "get_tester",
+        lambda cls, name, *args: testers.append(name) or get_tester(cls, name, *args),
+    )
+
+    fields = {
+        "title": {"class": CharField, "attrs": {"max_length": 8}},
+        "slug": {"class": CharField, "attrs": {"max_length": 16}},
+    }
+    first = get_django_model(
+        "InheritanceFirst",
+        constants={"COLOR": "blue"},
+        fields=fields,
+        meta={"ordering": ("title",)},
+    )
+    second = get_django_model(
+        "InheritanceSecond",
+        constants={"COLOR": "blue"},
+        fields={**fields, "slug": {"class": CharField, "attrs": {"max_length": 32}}},
+        meta={"ordering": ("slug",)},
+    )
+    third = get_django_model(
+        "InheritanceThird",
+        constants={"COLOR": "blue"},
+        fields=fields,
+        meta={"ordering": ("title",)},
+    )
+
+    AbstractSpec = PytestDjangoModel(
+        "TestAbstractSpec",
+        (),
+        {
+            "Meta": get_meta_class(abstract_spec=True, ordering=("title",)),
+            "COLOR": "blue",
+            "title": CharField(max_length=8),
+            "slug": CharField(max_length=16),
+        },
+    )
+    try:
+        # Abstract Test Classes only hold their declarations, and aren't collected.
+        assert not hasattr(AbstractSpec, "_meta")
+        assert AbstractSpec.__test__ is False
+        assert set(AbstractSpec._declarations["fields"]) == {"title", "slug"}
+        assert AbstractSpec._declarations["meta"] == {"ordering": ("title",)}
+
+        FirstSpec = PytestDjangoModel(
+            "TestFirst", (AbstractSpec,), {"Meta": get_meta_class(model=first)}
+        )
+        # Own declarations take precedence over inherited ones.
+        SecondSpec = PytestDjangoModel(
+            "TestSecond",
+            (AbstractSpec,),
+            {
+                "Meta": get_meta_class(model=second, ordering=("slug",)),
+                "slug": CharField(max_length=32),
+            },
+        )
+        ThirdSpec = PytestDjangoModel(
+            "TestThird", (AbstractSpec,), {"Meta": get_meta_class(model=third)}
+        )
+    except Exception as e:
+        pytest.fail(e)
+    finally:
+        for model in [first, second, third]:
+            delete_django_model(APP_LABEL, model.__name__)
+
+    # Tester Models are only built for validation, once for the same declarations.
+    assert testers == (["TestFirst", "TestSecond"] if validation else [])
+    assert ThirdSpec._meta.name == "TestThird"
+
+    specs = [(FirstSpec, first), (SecondSpec, second), (ThirdSpec, third)]
+    for spec, original in specs:
+        assert spec.__test__ is True
+        original_object = spec._meta.model
+        for attr_type in ["constants", "fields"]:
+            attrs = getattr(original_object._meta, attr_type)
+            for attr, attribute_object in getattr(spec._meta, attr_type).items():
+                assert attribute_object == attrs[attr]
+        assert spec._meta.meta["ordering"] == original_object._meta.meta["ordering"]
+
+    # Inherited Fields aren't shared with the built Django Models.
+    assert not hasattr(AbstractSpec._declarations["attrs"]["title"], "model")
+    assert not model_exists("TestFirst") and not model_exists("TestSecond")
+    assert not model_exists("TestThird")
+
+
+def test_pytest_django_model__template():
+    fields = {"title": {"class": CharField, "attrs": {"max_length": 8}}}
+    meta = {"ordering": ("title",)}
+    first = get_django_model("TemplateFirst", constants={}, fields=fields, meta=meta)
+    second = get_django_model("TemplateSecond", constants={}, fields=fields, meta={})
+    other = get_django_model("OtherTemplate", constants={}, fields={}, meta=meta)
+
+    try:
+        Template = PytestDjangoModel(
+            "TestTemplate",
+            (),
+            {
+                "Meta": get_meta_class(models=f"{APP_LABEL}.Template*", **meta),
+                "title": CharField(max_length=8),
+            },
+        )
+    except Exception as e:
+        pytest.fail(e)
+
+    try:
+        # Models are matched by label, with one result per Model.
+        assert Template._meta.models == (first, second)
+        (parametrize,) = Template.test_models.pytestmark
+        assert parametrize.args == ("model", (first, second))
+        assert parametrize.kwargs["ids"] == [
+            f"{APP_LABEL}.TemplateFirst",
+            f"{APP_LABEL}.TemplateSecond",
+        ]
+
+        Template.test_models(Template, first)
+        with pytest.raises(AssertionError, match="Meta.ordering"):
+            Template.test_models(Template, second)
+        with pytest.raises(AssertionError, match="title doesn't exist"):
+            Template.test_models(Template, other)
+
+        # Only declared Meta Options are compared.
+        Fields = PytestDjangoModel(
+            "TestTemplateFields",
+            (),
+            {
+                "Meta": get_meta_class(models=[second, first]),
+                "title": CharField(max_length=8),
+            },
+        )
+        assert Fields._meta.models == (second, first)
+        for model in Fields._meta.models:
+            Fields.test_models(Fields, model)
+    finally:
+        for model in [first, second, other]:
+            delete_django_model(APP_LABEL, model.__name__)
+
+    assert not model_exists("TestTemplate")
@@ -103,7 +103,7 @@ class StatefulTestFileGenerator(RuleBasedStateMachine):
 
         # Test names are corrects and attributes exists.
         appended_data = modified_file[len(initial_file) :]
-        pattern = r"assert (?P<original>\S+) == (?P<tester>\S+), assert_msg(.+)"
+        pattern = r"assert (?P<original>\S+) == (?P<tester>\S+)$"
         for line in appended_data:
             assert_line = re.search(pattern, line)
             if assert_line:
@@ -0,0 +1,90 @@
+# coding: utf-8
+
+from django.core.validators import MaxValueValidator
+from django.db.models import CharField, CheckConstraint, Index, IntegerField, Q
+
+from pytest_django_model.fingerprints import get_fingerprint, is_auto_index_name
+from pytest_django_model.objects import AttributeObject
+from pytest_django_model.utils import delete_django_model
+
+from .conftest import APP_LABEL
+from .utils import get_django_model
+
+
+def test_get_fingerprint():
+    validators = [MaxValueValidator(5)]
+    fingerprint = get_fingerprint({"max_length": 8, "validators": validators})
+
+    assert hash(fingerprint)
+    assert fingerprint is get_fingerprint(
+        {"validators": [MaxValueValidator(5)], "max_length": 8}
+    )
+    assert fingerprint != get_fingerprint({"max_length": 8, "validators": []})
+    assert get_fingerprint([1, 2]) != get_fingerprint((1, 2))
+    assert get_fingerprint({1, 2}) == get_fingerprint({2, 1})
+    assert get_fingerprint([{1: []}]) is not None
+    assert get_fingerprint([{}, object.__new__(Unhashable)]) is None
+
+    check = CheckConstraint(check=Q(rank__gte=0), name="rank_gte_0")
+    assert get_fingerprint(check) == get_fingerprint(
+        CheckConstraint(check=Q(rank__gte=0), name="rank_gte_0")
+    )
+    assert get_fingerprint(check) != get_fingerprint(
+        CheckConstraint(check=Q(rank__gte=1), name="rank_gte_0")
+    )
+
+
+class Unhashable:
+    __hash__ = None
+
+
+def test_get_fingerprint__indexes():
+    fields = {
+        "title": {"class": CharField, "attrs": {"max_length": 8}},
+        "rank": {"class": IntegerField, "attrs": {}},
+    }
+    models = [
+        get_django_model(name, constants={}, fields=fields, meta={})
+        for name in ("FingerprintBook", "TestFingerprintBook")
+    ]
+    try:
+        indexes = list()
+        for model in models:
+            index = Index(fields=["title", "-rank"])
+            index.set_name_with_model(model)
+            indexes.append(index)
+
+        assert indexes[0].name != indexes[1].name
+        assert all(is_auto_index_name(index) for index in indexes)
+        assert get_fingerprint(indexes[0]) == get_fingerprint(indexes[1])
+
+        original = AttributeObject("indexes", [indexes[0]], ["Book", "Meta"])
+        tester = AttributeObject("indexes", [indexes[1]], ["TestBook", "Meta"])
+        assert original == tester
+
+        named = Index(fields=["title", "-rank"], name="book_title_idx")
+        assert not is_auto_index_name(named)
+        assert get_fingerprint(named) != get_fingerprint(indexes[0])
+        assert get_fingerprint(named) != get_fingerprint(
+            Index(fields=["title", "-rank"], name="book_other_idx")
+        )
+        assert not original == AttributeObject("indexes", [named], "TestBook")
+    finally:
+        for model in models:
+            delete_django_model(APP_LABEL, model.__name__)
+
+
+def test_attribute_object__fingerprint():
+    value = {"max_length": 8, "validators": [MaxValueValidator(5)]}
+    original = AttributeObject("title", value, "Book", cls=CharField)
+    same = AttributeObject("title", dict(value), "TestBook", cls=CharField)
+    other_cls = AttributeObject("title", dict(value), "TestBook", cls=IntegerField)
+
+    assert original.fingerprint is same.fingerprint
+    assert original == same
+    assert not original == other_cls
+
+    unhashable = AttributeObject("CONSTANT", [Unhashable()], "Book")
+    assert unhashable.fingerprint is None
+    assert unhashable == AttributeObject("CONSTANT", unhashable.value, "TestBook")
+    assert not unhashable == AttributeObject("CONSTANT", [1], "TestBook")
@@ -0,0 +1,181 @@
+# coding: utf-8
+
+import random
+
+import pytest
+from django.db.models import (
+    CASCADE,
+    SET_NULL,
+    CharField,
+    DateField,
+    DecimalField,
+    EmailField,
+    ForeignKey,
+    PositiveSmallIntegerField,
+)
+
+from pytest_django_model.fixtures import (
+    FixtureError,
+    RelatedValues,
+    RowGenerator,
+    fill_database,
+    generate_rows,
+    get_insert_order,
+)
+
+from .conftest import APP_LABEL
+from .utils import django_tables, get_django_model
+
+
+@pytest.fixture
+def fixture_models():
+    author = get_django_model(
+        "FixtureAuthor",
+        constants={},
+        fields={
+            "name": {"class": CharField, "attrs": {"max_length": 6, "unique": True}},
+            "email": {"class": EmailField, "attrs": {}},
+            "kind": {
+                "class": CharField,
+                "attrs": {"max_length": 1, "choices": [("a", "A"), ("b", "B")]},
+            },
+            "rating": {
+                "class": DecimalField,
+                "attrs": {"max_digits": 4, "decimal_places": 2},
+            },
+            "born": {"class": DateField, "attrs": {"null": True, "blank": True}},
+        },
+        meta={},
+    )
+    book = get_django_model(
+        "FixtureBook",
+        constants={},
+        fields={
+            "title": {"class": CharField, "attrs": {"max_length": 32}},
+            "pages": {"class": PositiveSmallIntegerField, "attrs": {}},
+            "author": {
+                "class": ForeignKey,
+                "attrs": {"to": author, "on_delete": CASCADE},
+            },
+            "editor": {
+                "class": ForeignKey,
+                "attrs": {
+                    "to": author,
+                    "on_delete": SET_NULL,
+                    "null": True,
+                    "blank": True,
+                    "related_name": "+",
+                },
+            },
+        },
+        meta={},
+    )
+    review = get_django_model(
+        "FixtureReview",
+        constants={},
+        fields={
+            "book": {"class": ForeignKey, "attrs": {"to": book, "on_delete": CASCADE}},
+            "reviewer": {
+                "class": ForeignKey,
+                "attrs": {"to": author, "on_delete": CASCADE},
+            },
+        },
+        meta={"unique_together": ("book", "reviewer")},
+    )
+
+    with django_tables(author, book, review) as models:
+        yield models
+
+
+@pytest.mark.django_db(transaction=True)
+def test_fill_database(fixture_models):
+    author, book, review = fixture_models
+
+    assert get_insert_order([review, book, author]) == [author, book, review]
+    with pytest.raises(FixtureError, match="needs rows of app.FixtureAuthor"):
+        next(generate_rows(book, 1))
+
+    inserted = fill_database({review: 6, book: 3, author: 2}, batch_size=2, seed=1)
+    assert inserted == {
+        f"{APP_LABEL}.FixtureAuthor": 2,
+        f"{APP_LABEL}.FixtureBook": 3,
+        f"{APP_LABEL}.FixtureReview": 6,
+    }
+
+    # Rows are valid for their Fields, and unique together.
+    for model in fixture_models:
+        for instance in model.objects.all():
+            instance.full_clean()
+    pairs = review.objects.values_list("book_id", "reviewer_id")
+    assert len(set(pairs)) == 6
+
+    # Unique values follow the rows already in the table.
+    chunks = list(generate_rows(author, 5, chunk_size=2, seed=1))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    author.objects.bulk_create(instance for chunk in chunks for instance in chunk)
+    assert author.objects.values("name").distinct().count() == 7
+
+    # Same seed, same rows.
+    get_values = lambda rows: [
+        {attr: value for attr, value in vars(row).items() if attr != "_state"}
+        for row in rows
+    ]
+    assert get_values(next(generate_rows(book, 3, seed=2))) == get_values(
+        next(generate_rows(book, 3, seed=2))
+    )
+
+    fill_database({review: 15})
+    with pytest.raises(FixtureError, match="only 21 combinations"):
+        fill_database({review: 1})
+
+
+@pytest.mark.parametrize(
+    "field_class,attrs,capacity",
+    [
+        (CharField, {"max_length": 2}, 36 ** 2),
+        (CharField, {"max_length": 8, "choices": [("a", "A"), ("b", "B")]}, 2),
+        (DecimalField, {"max_digits": 3, "decimal_places": 1}, 1000),
+        (EmailField, {"max_length": 16}, 36 ** 2),
+        (PositiveSmallIntegerField, {}, 2 ** 15),
+    ],
+)
+@pytest.mark.django_db(transaction=True)
+def test_generate_rows__unique_values(field_class, attrs, capacity):
+    model = get_django_model(
+        "FixtureUnique",
+        constants={},
+        fields={"value": {"class": field_class, "attrs": {"unique": True, **attrs}}},
+        meta={},
+    )
+
+    with django_tables(model):
+        starts = {0, 1, capacity - 1}
+        rows = [
+            model(**RowGenerator(model, start=start).get_row(0)) for start in starts
+        ]
+        for row in rows:
+            row.clean_fields()
+        assert len({row.value for row in rows}) == len(starts)
+
+        with pytest.raises(FixtureError, match=f"only {capacity} distinct values"):
+            RowGenerator(model, start=capacity).get_row(0)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_related_values(fixture_models):
+    author, book, review = fixture_models
+    fill_database({author: 5}, seed=1)
+    pks = list(author.objects.order_by("pk").values_list("pk", flat=True))
+
+    # Contiguous keys are computed from their bounds.
+    values = RelatedValues(author.objects, "pk", page_size=2)
+    assert values.low == pks[0]
+    assert len(values) == 5 and [values[index] for index in range(5)] == pks
+
+    # Others are read by pages.
+    author.objects.filter(pk=pks[1]).delete()
+    values = RelatedValues(author.objects, "pk", page_size=2)
+    assert values.low is None
+    assert [values[index] for index in range(4)] == pks[:1] + pks[2:]
+    assert list(values.pages) == [0, 1]
+    assert {values.choice(random.Random(seed)) for seed in range(20)} <= set(pks)
@@ -0,0 +1,119 @@
+# coding: utf-8
+
+import os
+
+from django.db import models
+
+from pytest_django_model.core import PytestDjangoModel
+from pytest_django_model.impact import (
+    ImpactIndex,
+    get_dependencies,
+    get_source_path,
+    impact_index,
+    normalize_path,
+    read_changed_files,
+)
+from pytest_django_model.utils import delete_django_model
+
+from . import factories, utils
+from .conftest import APP_LABEL
+from .utils import get_django_model, get_meta_class
+
+
+def get_model(name, module, bases=(models.Model,), abstract=False, **attrs):
+    meta = type("Meta", (), {"app_label": APP_LABEL, "abstract": abstract})
+    return type(name, bases, {"__module__": module.__name__, "Meta": meta, **attrs})
+
+
+def test_impact_index():
+    abstract_parent = get_model(
+        "ImpactAbstract",
+        factories,
+        abstract=True,
+        title=models.CharField(max_length=8),
+    )
+    target = get_model("ImpactTarget", utils)
+    original = get_model(
+        "ImpactOriginal",
+        factories,
+        bases=(abstract_parent,),
+        target=models.ForeignKey(target, on_delete=models.CASCADE),
+    )
+    other = get_model("ImpactOther", utils)
+
+    try:
+        assert get_dependencies(original) == [original, abstract_parent, target]
+        assert get_dependencies(other) == [other]
+
+        factories_path, utils_path = get_source_path(factories), get_source_path(utils)
+        spec_path = normalize_path(__file__)
+
+        # Disabled Index selects everything.
+        index = ImpactIndex()
+        assert not index.enabled
+        assert index.is_selected("TestOriginal", {}, original)
+
+        # Source files are indexed.
+        index.configure(set())
+        paths = index.add("TestOriginal", spec_path, original, (abstract_parent,))
+        assert paths == {factories_path, utils_path, spec_path}
+        index.add("TestOther", spec_path, other)
+        assert index.get_specs([factories_path]) == {"TestOriginal"}
+        assert index.get_specs([utils_path]) == {"TestOriginal", "TestOther"}
+        assert index.get_specs([normalize_path("unknown.py")]) == set()
+
+        # Only affected Test Classes are selected.
+        index.configure({factories_path})
+        assert index.is_selected("TestOriginal", {}, original)
+        assert not index.is_selected("TestOther", {}, other)
+        assert (index.selected, index.deselected) == (1, 1)
+    finally:
+        for model in [original, target, other]:
+            delete_django_model(APP_LABEL, model.__name__)
+
+
+def test_impact_index__abstract_spec():
+    original = get_django_model(
+        "ImpactInherited",
+        constants={},
+        fields={"title": {"class": models.CharField, "attrs": {"max_length": 8}}},
+        meta={},
+    )
+    # The abstract spec is defined in another file than the Test Class.
+    AbstractSpec = PytestDjangoModel(
+        "TestImpactAbstract",
+        (),
+        {
+            "__module__": factories.__name__,
+            "Meta": get_meta_class(abstract_spec=True),
+            "title": models.CharField(max_length=8),
+        },
+    )
+    get_spec = lambda: PytestDjangoModel(
+        "TestImpactInherited",
+        (AbstractSpec,),
+        {"__module__": __name__, "Meta": get_meta_class(model=original)},
+    )
+
+    try:
+        assert AbstractSpec._declarations["paths"] == {get_source_path(factories)}
+
+        # Changing only the file of the abstract spec selects the Test Class.
+        impact_index.configure({get_source_path(factories)})
+        assert get_spec().__test__ is True
+        impact_index.configure({normalize_path("unknown.py")})
+        assert get_spec().__test__ is False
+    finally:
+        impact_index.configure()
+        delete_django_model(APP_LABEL, original.__name__)
+
+
+def test_read_changed_files(tmpdir):
+    path = tmpdir.join("changed.txt")
+    path.write("app/models.py\n\n  app/tests/test_models.py  \n")
+
+    changed = read_changed_files(str(path))
+    assert changed == ("app/models.py", "app/tests/test_models.py")
+    assert normalize_path(changed[0], str(tmpdir)) == os.path.join(
+        os.path.realpath(str(tmpdir)), "app", "models.py"
+    )
@@ -0,0 +1,103 @@
+# coding: utf-8
+
+import pytest
+from django.db.models import (
+    CASCADE,
+    CharField,
+    DateTimeField,
+    ForeignKey,
+    Index,
+    IntegerField,
+)
+
+from pytest_django_model.core import PytestDjangoModel
+from pytest_django_model.lint import lint_indexes
+from pytest_django_model.objects import get_model_object
+from pytest_django_model.utils import delete_django_model
+
+from .conftest import APP_LABEL
+from .utils import get_django_model, get_meta_class
+
+
+def get_lints(model):
+    return [(lint.option, lint.field) for lint in lint_indexes(get_model_object(model))]
+
+
+def test_lint_indexes():
+    target = get_django_model("LintTarget", constants={}, fields={}, meta={})
+    fields = {
+        "title": {"class": CharField, "attrs": {"max_length": 8}},
+        "rank": {"class": IntegerField, "attrs": {}},
+        "created": {"class": DateTimeField, "attrs": {}},
+        "target": {
+            "class": ForeignKey,
+            "attrs": {"to": target, "on_delete": CASCADE, "db_index": False},
+        },
+        "other": {"class": ForeignKey, "attrs": {"to": target, "on_delete": CASCADE}},
+    }
+    unindexed = get_django_model(
+        "LintUnindexed",
+        constants={},
+        fields=fields,
+        meta={"ordering": ("-title", "rank"), "get_latest_by": "created"},
+    )
+    indexed = get_django_model(
+        "LintIndexed",
+        constants={},
+        fields={
+            **fields,
+            "title": {"class": CharField, "attrs": {"max_length": 8, "unique": True}},
+            "target": {
+                "class": ForeignKey,
+                "attrs": {
+                    "to": target,
+                    "on_delete": CASCADE,
+                    "db_index": False,
+                    "related_name": "+",
+                },
+            },
+            "other": {
+                "class": ForeignKey,
+                "attrs": {"to": target, "on_delete": CASCADE, "related_name": "+"},
+            },
+        },
+        meta={
+            "ordering": ("-title", "rank"),
+            "get_latest_by": ("-created", "target_id"),
+            "index_together": [("target", "rank")],
+            "indexes": [Index(fields=["-created"], name="lint_created_idx")],
+        },
+    )
+    related = get_django_model(
+        "LintRelated",
+        constants={},
+        fields={},
+        meta={"ordering": ("?",), "get_latest_by": "pk"},
+    )
+
+    try:
+        assert get_lints(unindexed) == [
+            ("ordering", "title"),
+            ("get_latest_by", "created"),
+            ("db_index", "target"),
+        ]
+        assert get_lints(indexed) == []
+        assert get_lints(related) == []
+
+        # Specs lint their Model if asked to, or if it's enabled for the session.
+        Spec = PytestDjangoModel(
+            "TestLintUnindexed",
+            (),
+            {"Meta": get_meta_class(model=unindexed, lint_indexes=True)},
+        )
+        with pytest.raises(AssertionError, match="LintUnindexed.target"):
+            Spec.test_indexes(Spec)
+        assert not hasattr(Spec.Meta, "lint_indexes")
+
+        Spec = PytestDjangoModel(
+            "TestLintUnindexed", (), {"Meta": get_meta_class(model=unindexed)}
+        )
+        assert not hasattr(Spec, "test_indexes")
+    finally:
+        for model in [target, unindexed, indexed, related]:
+            delete_django_model(APP_LABEL, model.__name__)
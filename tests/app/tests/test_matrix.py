@@ -0,0 +1,119 @@
+# coding: utf-8
+
+import json
+from collections import namedtuple
+
+import pytest
+
+from pytest_django_model import matrix
+from pytest_django_model.matrix import (
+    PROFILE_ENV,
+    REPORT_ENV,
+    MatrixRunner,
+    MatrixWorker,
+    get_profile_suffix,
+    get_worker_args,
+    parse_settings_matrix,
+)
+
+Report = namedtuple("Report", ["nodeid", "when", "outcome", "longreprtext", "failed"])
+
+
+def test_worker_args():
+    assert parse_settings_matrix("settings.a, settings.b,") == (
+        "settings.a",
+        "settings.b",
+    )
+    assert get_profile_suffix("settings.a") == "_settings_a"
+    assert get_profile_suffix(None) == ""
+
+    args = [
+        "-q",
+        "--model-settings-matrix",
+        "settings.a,settings.b",
+        "--ds=settings.a",
+        "--model-settings-matrix=settings.a",
+        "tests/",
+    ]
+    assert get_worker_args(args) == ["-q", "tests/"]
+
+    runner = MatrixRunner(("settings.a",), args)
+    env = runner.get_env("settings.a", "report.json")
+    assert env["DJANGO_SETTINGS_MODULE"] == env[PROFILE_ENV] == "settings.a"
+    assert env[REPORT_ENV] == "report.json"
+
+
+def test_matrix_report(tmpdir, monkeypatch):
+    path = tmpdir.join("report.json")
+    monkeypatch.setenv(REPORT_ENV, str(path))
+
+    worker = MatrixWorker()
+    worker.add(Report("test_a.py::TestA::test_fields", "setup", "passed", "", False))
+    worker.add(Report("test_a.py::TestA::test_fields", "call", "passed", "", False))
+    worker.add(Report("test_a.py::TestA::test_meta", "call", "failed", "E msg", True))
+    worker.write(1)
+
+    results = {
+        "settings.a": {**json.loads(path.read()), "duration": 1.0, "output": ""},
+        "settings.b": {"exitstatus": 0, "reports": [], "duration": 1.0, "output": ""},
+        "settings.c": {"exitstatus": 4, "reports": None, "duration": 0, "output": "!"},
+    }
+    assert MatrixRunner.get_summary(results) == [
+        "FAILED [settings.a] test_a.py::TestA::test_meta\nE msg",
+        "ERROR [settings.c]\n!",
+        "[settings.a] 1 failed, 1 passed in 1.00s",
+        "[settings.b] no tests ran in 1.00s",
+        "[settings.c] error, exit status 4",
+    ]
+    assert MatrixRunner.get_exitstatus(results) == 4
+    assert MatrixRunner.get_exitstatus({"settings.b": results["settings.b"]}) == 0
+
+
+@pytest.mark.parametrize(
+    "exitstatuses,exitstatus",
+    [
+        ((0, 1), 1),
+        ((1, 3), 3),
+        ((4, 1, 0), 4),
+        ((2, 4), 4),
+        ((1, -9), -9),
+        ((0, 5), 0),
+        ((1, 5), 1),
+        ((5, 5), 5),
+        ((), 0),
+    ],
+)
+def test_get_exitstatus(exitstatuses, exitstatus):
+    results = {f"settings.{n}": {"exitstatus": s} for n, s in enumerate(exitstatuses)}
+    assert MatrixRunner.get_exitstatus(results) == exitstatus
+
+
+def test_matrix_runner__startup_error(monkeypatch):
+    class Process:
+        def __init__(self, args, stdout, **kwargs):
+            if processes:
+                raise OSError("can't start")
+            self.stdout, self.returncode, self.killed = stdout, None, False
+            processes.append(self)
+
+        def poll(self):
+            return self.returncode
+
+        def kill(self):
+            self.killed = True
+
+        def wait(self):
+            self.returncode = -9 if self.killed else 0
+            return self.returncode
+
+    processes = []
+    monkeypatch.setattr(matrix.subprocess, "Popen", Process)
+
+    runner = MatrixRunner(("settings.a", "settings.b"), [])
+    with pytest.raises(OSError, match="can't start"):
+        runner.run()
+
+    # The started worker is killed and waited for, and outputs are closed.
+    (process,) = processes
+    assert process.killed and process.returncode == -9
+    assert process.stdout.closed
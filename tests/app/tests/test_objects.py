@@ -1,6 +1,8 @@
 # coding: utf-8
 
 import pytest
+from django.db import models
+from django.utils.functional import lazy
 from hypothesis import assume, event
 from hypothesis import strategies as st
 from hypothesis.stateful import Bundle, RuleBasedStateMachine, consumes, rule
@@ -10,9 +12,12 @@ from pytest_django_model.objects import (
     AttributeObject,
     ModelGenerator,
     ModelObject,
+    get_declared_model_object,
     get_model_object,
 )
+from pytest_django_model.utils import delete_django_model
 
+from .conftest import APP_LABEL
 from .factories import (
     TYPES,
     default_meta,
@@ -256,3 +261,124 @@ class StatefulPytestDjangoModelGenerator(RuleBasedStateMachine):
 
 
 PytestDjangoModelGenerator = StatefulPytestDjangoModelGenerator.TestCase
+
+
+def test_declaration_generator__relations():
+    abstract_parent = get_django_model(
+        "DeclarationAbstract",
+        constants={},
+        fields={"created": {"class": models.DateTimeField, "attrs": {"null": True}}},
+        meta={"abstract": True, "ordering": ("-created",)},
+    )
+    target = get_django_model("DeclarationTarget", constants={}, fields={}, meta={})
+    parent = get_django_model(
+        "DeclarationParent",
+        constants={},
+        fields={"title": {"class": models.CharField, "attrs": {"max_length": 8}}},
+        meta={},
+    )
+    get_dct = lambda: {
+        "KINDS": (("a", "A"), ("b", "B")),
+        "parent": models.ForeignKey(
+            "self", null=True, on_delete=models.CASCADE, related_name="%(class)s_set"
+        ),
+        "target": models.ForeignKey("DeclarationTarget", on_delete=models.CASCADE),
+        "missing": models.ForeignKey(f"{APP_LABEL}.Missing", on_delete=models.CASCADE),
+        "targets": models.ManyToManyField(target, related_name="declarations"),
+        "peers": models.ManyToManyField(
+            "self", symmetrical=False, related_name="followers"
+        ),
+    }
+
+    try:
+        for parents in [(), (abstract_parent,), (parent,)]:
+            name = "Declaration"
+            dct = get_dct()
+            bases = parents or (models.Model,)
+            django_model = type(name, bases, {"__module__": APP_LABEL, **dct})
+            model_object = get_model_object(django_model, has_id=False)
+            delete_django_model(APP_LABEL, name)
+            delete_django_model(APP_LABEL, f"{name}_targets")
+            delete_django_model(APP_LABEL, f"{name}_peers")
+            # Relations to the Model itself are written 'self'.
+            assert model_object._meta.fields["parent"].value["to"] == "self"
+            assert model_object._meta.fields["peers"].value["to"] == "self"
+
+            declared_model_object = get_declared_model_object(
+                name, {**get_dct(), "Meta": type("Meta", (), {})}, APP_LABEL, parents
+            )
+            declared_model_object._meta.fields.pop("id", None)
+
+            for attr_type in ["constants", "fields", "meta"]:
+                attrs = getattr(model_object._meta, attr_type)
+                declared_attrs = getattr(declared_model_object._meta, attr_type)
+
+                assert attrs.keys() == declared_attrs.keys()
+                for attr, attribute_object in attrs.items():
+                    assert attribute_object == declared_attrs[attr]
+
+            assert declared_model_object.parent.value["to"] == "self"
+            assert declared_model_object.parent.value["related_name"] == (
+                "declaration_set"
+            )
+    finally:
+        for model in [target, parent]:
+            delete_django_model(APP_LABEL, model.__name__)
+
+    # Declarations changed by Django need a Django Model.
+    for dct in [
+        {"id": models.IntegerField()},
+        {"friends": models.ManyToManyField("self")},
+        {"Meta": type("Meta", (), {"order_with_respect_to": "parent"})},
+        {"Meta": type("Meta", (), {"indexes": [models.Index(fields=["id"])]})},
+        {"objects": models.Manager()},
+    ]:
+        assert get_declared_model_object("Declaration", dct, APP_LABEL) is None
+
+
+def test_attribute_object__lazy_strings(monkeypatch):
+    translated = []
+
+    def translate(message, context=None):
+        translated.append(message)
+        return message.upper()
+
+    lazy_translate = lazy(translate, str)
+    parents = "Model"
+
+    first = AttributeObject("verbose_name", lazy_translate("book"), parents)
+    same = AttributeObject("verbose_name", lazy_translate("book"), parents)
+    other = AttributeObject("verbose_name", lazy_translate("Book"), parents)
+    plain = AttributeObject("verbose_name", "BOOK", parents)
+    field = AttributeObject(
+        "title",
+        cls=models.CharField,
+        value={
+            "help_text": lazy_translate("title"),
+            "choices": [("a", lazy_translate("a"))],
+        },
+        parents=parents,
+    )
+    same_field = AttributeObject(
+        "title",
+        cls=models.CharField,
+        value={
+            "help_text": lazy_translate("title"),
+            "choices": [("a", lazy_translate("a"))],
+        },
+        parents=parents,
+    )
+
+    monkeypatch.setattr(AttributeObject, "lazy_strings", True)
+
+    # Same message ids are equal without translation.
+    assert first == same and field == same_field
+    assert translated == []
+
+    # Translations are only compared when message ids differ.
+    assert first == other and first == plain
+    assert sorted(translated) == ["Book", "book", "book"]
+    assert not first == AttributeObject(
+        "verbose_name", lazy_translate("author"), parents
+    )
+    assert not first == AttributeObject("verbose_name", None, parents)
@@ -0,0 +1,71 @@
+# coding: utf-8
+
+import pytest
+from django.db import connection
+from django.db.models import CharField, DateTimeField, Index, IntegerField
+
+from pytest_django_model.core import PytestDjangoModel
+from pytest_django_model.plans import check_query_plans, query_planner
+
+from .utils import django_tables, get_django_model, get_meta_class
+
+
+@pytest.fixture
+def plan_models():
+    fields = {
+        "title": {"class": CharField, "attrs": {"max_length": 8, "db_index": True}},
+        "rank": {"class": IntegerField, "attrs": {}},
+        "created": {"class": DateTimeField, "attrs": {}},
+    }
+    unindexed = get_django_model(
+        "PlanUnindexed", constants={}, fields=fields, meta={"ordering": ("-created",)}
+    )
+    indexed = get_django_model(
+        "PlanIndexed",
+        constants={},
+        fields=fields,
+        meta={
+            "ordering": ("-created",),
+            "indexes": [Index(fields=["-created"], name="plan_created_idx")],
+        },
+    )
+
+    with django_tables(unindexed, indexed) as models:
+        yield models
+
+
+@pytest.mark.django_db(transaction=True)
+def test_check_query_plans(plan_models):
+    unindexed, indexed = plan_models
+
+    with pytest.raises(AssertionError, match=r"PlanUnindexed.objects.all\(\) reads"):
+        check_query_plans(unindexed, None)
+
+    check_query_plans(indexed, None, lookups=[{"title": "a"}])
+    with pytest.raises(AssertionError, match=r"filter\(rank=1\) reads"):
+        check_query_plans(indexed, None, lookups=[{"title": "a"}, {"rank": 1}])
+
+    # Plans are cached by SQL text, whatever the parameters.
+    plans = len(query_planner.plans)
+    check_query_plans(indexed, None, lookups=[{"title": "b"}])
+    assert len(query_planner.plans) == plans
+
+    # Specs check query plans of their Model if asked to.
+    Spec = PytestDjangoModel(
+        "TestPlanIndexed",
+        (),
+        {"Meta": get_meta_class(model=indexed, query_plans=[{"title": "a"}])},
+    )
+    (mark,) = Spec.test_query_plans.pytestmark
+    assert mark.name == "django_db"
+    Spec.test_query_plans(Spec)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_check_query_plans__vendors(monkeypatch, plan_models):
+    _, indexed = plan_models
+
+    # Planners reading empty tables entirely whatever their indexes are skipped.
+    monkeypatch.setattr(connection, "vendor", "mysql")
+    with pytest.raises(pytest.skip.Exception, match="mysql query plans"):
+        check_query_plans(indexed, None)
@@ -0,0 +1,83 @@
+# coding: utf-8
+
+import json
+
+from django.db.models import CharField, IntegerField
+
+from pytest_django_model.core import PytestDjangoModel
+from pytest_django_model.report import get_report_path, model_report
+from pytest_django_model.utils import delete_django_model
+
+from .conftest import APP_LABEL
+from .utils import get_django_model, get_meta_class
+
+
+def read_records(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_get_report_path():
+    assert get_report_path("report.jsonl") == "report.jsonl"
+    assert get_report_path("out/report.jsonl", "settings.pg", "gw1") == (
+        "out/report_settings_pg_gw1.jsonl"
+    )
+
+
+def test_model_report(tmp_path):
+    original = get_django_model(
+        "ReportOriginal",
+        constants={"COLOR": "blue"},
+        fields={
+            "title": {"class": CharField, "attrs": {"max_length": 8}},
+            "rank": {"class": IntegerField, "attrs": {}},
+        },
+        meta={"ordering": ("title",)},
+    )
+    get_dct = lambda: {
+        "Meta": get_meta_class(model=original, ordering=("-title",)),
+        "COLOR": "blue",
+        "title": CharField(max_length=8),
+        "rank": CharField(max_length=8),
+        "slug": CharField(max_length=8),
+    }
+    path = str(tmp_path / "report.jsonl")
+    try:
+        model_report.open(path)
+        Spec = PytestDjangoModel("TestReportOriginal", (), get_dct())
+        # Records are written when the tests run, not when the spec is built.
+        assert read_records(path) == []
+        model_report.write_spec(Spec)
+        model_report.write_spec(Spec)
+        records = read_records(path)
+
+        assert model_report.records == len(records)
+        assert model_report.mismatches == 3
+        statuses = {
+            (record["scope"], record["attribute"]): record["status"]
+            for record in records
+        }
+        assert statuses[("constants", "COLOR")] == "match"
+        assert statuses[("fields", "title")] == "match"
+        assert statuses[("fields", "rank")] == "type"
+        assert statuses[("fields", "slug")] == "missing"
+        assert statuses[("meta", "ordering")] == "value"
+
+        record = next(record for record in records if record["attribute"] == "title")
+        assert record["spec"].endswith("TestReportOriginal")
+        assert record["model"] == f"{APP_LABEL}.ReportOriginal"
+        assert record["expected"] == record["actual"]
+        slug = next(record for record in records if record["attribute"] == "slug")
+        assert slug["expected"] and slug["actual"] is None
+
+        model_report.close()
+        model_report.open(path, compact=True)
+        model_report.write_spec(PytestDjangoModel("TestReportOriginal", (), get_dct()))
+        records = read_records(path)
+        assert len(records) == 3
+        assert all(record["status"] != "match" for record in records)
+    finally:
+        model_report.close()
+        delete_django_model(APP_LABEL, original.__name__)
+
+    assert not model_report.enabled
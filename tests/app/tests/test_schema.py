@@ -0,0 +1,171 @@
+# coding: utf-8
+
+import pytest
+from django.db.models import (
+    CASCADE,
+    CharField,
+    ForeignKey,
+    Index,
+    IntegerField,
+    OneToOneField,
+    TextField,
+)
+
+from pytest_django_model.core import PytestDjangoModel
+from pytest_django_model.objects import AttributeObject
+from pytest_django_model.schema import (
+    INDEX,
+    METADATA,
+    REWRITE,
+    get_attribute_changes,
+    get_schema_lines,
+)
+from pytest_django_model.utils import delete_django_model
+
+from .conftest import APP_LABEL
+from .utils import get_django_model, get_meta_class
+
+
+def get_changes(original_cls, original_attrs, tester_cls, tester_attrs):
+    original = AttributeObject("title", original_attrs, "Book", cls=original_cls)
+    tester = AttributeObject("title", tester_attrs, "TestBook", cls=tester_cls)
+    return {
+        change: (costs["postgresql"], costs["mysql"], costs["sqlite"])
+        for change, costs in get_attribute_changes(original, tester)
+    }
+
+
+def test_get_attribute_changes():
+    # Migrations go from the spec, the tester, to the model, the original.
+    assert get_changes(
+        CharField, {"max_length": 32}, CharField, {"max_length": 16}
+    ) == {"max_length 16 -> 32": (METADATA, METADATA, REWRITE)}
+    assert get_changes(
+        CharField, {"max_length": 128}, CharField, {"max_length": 32}
+    ) == {"max_length 32 -> 128": (METADATA, REWRITE, REWRITE)}
+    assert get_changes(CharField, {"max_length": 8}, CharField, {"max_length": 32}) == {
+        "max_length 32 -> 8": (REWRITE, REWRITE, REWRITE)
+    }
+    assert get_changes(
+        CharField, {"max_length": 8}, CharField, {"max_length": 8, "null": True}
+    ) == {"null True -> False": (INDEX, REWRITE, REWRITE)}
+    assert get_changes(
+        CharField,
+        {"max_length": 8, "unique": True, "verbose_name": "Title"},
+        CharField,
+        {"max_length": 8, "help_text": "Title"},
+    ) == {"unique False -> True": (INDEX, INDEX, REWRITE)}
+    assert get_changes(TextField, {}, CharField, {"max_length": 8}) == {
+        "CharField -> TextField": (METADATA, REWRITE, REWRITE)
+    }
+    assert get_changes(IntegerField, {}, CharField, {}) == {
+        "CharField -> IntegerField": (REWRITE, REWRITE, REWRITE)
+    }
+    fk_attrs = {"to": "app.Author", "on_delete": CASCADE}
+    assert get_changes(OneToOneField, fk_attrs, ForeignKey, fk_attrs) == {
+        "ForeignKey -> OneToOneField": (INDEX, INDEX, REWRITE)
+    }
+
+    # Columns missing from the spec are added.
+    for cls, attrs, costs in (
+        (CharField, {"max_length": 8, "null": True}, (METADATA, METADATA, REWRITE)),
+        (CharField, {"max_length": 8, "default": ""}, (METADATA, REWRITE, REWRITE)),
+        (CharField, {"max_length": 8}, (REWRITE, REWRITE, REWRITE)),
+        (ForeignKey, {**fk_attrs, "null": True}, (INDEX, INDEX, REWRITE)),
+    ):
+        assert get_changes(cls, attrs, None, NotImplemented) == {
+            "adding the column": costs
+        }
+
+    dropped = AttributeObject("title", NotImplemented, "Book")
+    tester = AttributeObject("title", {}, "TestBook", cls=CharField)
+    assert [change for change, _ in get_attribute_changes(dropped, tester)] == [
+        "dropping the column"
+    ]
+
+    index = Index(fields=["title"], name="title_idx")
+    original = AttributeObject("indexes", [index], ["Book", "Meta"])
+    tester = AttributeObject("indexes", [], ["TestBook", "Meta"])
+    ((change, costs),) = get_attribute_changes(original, tester)
+    assert (change, costs["postgresql"]) == ("adding indexes", INDEX)
+    ((change, costs),) = get_attribute_changes(tester, original)
+    assert (change, costs["postgresql"]) == ("removing indexes", METADATA)
+
+    # Python-only Meta Options don't change the table.
+    original = AttributeObject("ordering", ["title"], ["Book", "Meta"])
+    tester = AttributeObject("ordering", [], ["TestBook", "Meta"])
+    assert get_attribute_changes(original, tester) == []
+
+    assert (
+        get_attribute_changes(
+            AttributeObject("COLOR", "red", "Book"),
+            AttributeObject("COLOR", "blue", "TestBook"),
+        )
+        == []
+    )
+
+
+def test_get_schema_lines():
+    original = AttributeObject("title", {"max_length": 32}, "Book", cls=CharField)
+    tester = AttributeObject("title", {"max_length": 16}, "TestBook", cls=CharField)
+
+    assert get_schema_lines(original, tester) == [
+        "Migrating the spec to the model:",
+        "  - max_length 16 -> 32: metadata-only on mysql, oracle, postgresql; "
+        "a table rewrite on sqlite",
+    ]
+    assert get_schema_lines(original, original) == []
+
+
+def test_check_schema_changes():
+    original = get_django_model(
+        "SchemaOriginal",
+        constants={},
+        fields={
+            "title": {"class": CharField, "attrs": {"max_length": 8}},
+            "rank": {"class": IntegerField, "attrs": {"null": True}},
+            "summary": {"class": TextField, "attrs": {}},
+            "pages": {"class": IntegerField, "attrs": {"default": 0}},
+            "note": {"class": CharField, "attrs": {"max_length": 8, "null": True}},
+        },
+        meta={"ordering": ["title"]},
+    )
+    get_dct = lambda vendor="postgresql", **meta: {
+        "Meta": get_meta_class(
+            model=original, storage_vendor=vendor, ordering=[], **meta
+        ),
+        "title": CharField(max_length=16),
+        "rank": IntegerField(),
+        "summary": CharField(max_length=8),
+    }
+    try:
+        Spec = PytestDjangoModel("TestSchemaOriginal", (), get_dct(table_rows=10 ** 7))
+        assert not hasattr(Spec.Meta, "table_rows")
+
+        with pytest.raises(AssertionError) as excinfo:
+            Spec.test_schema_changes(Spec)
+        msg = str(excinfo.value)
+        assert "declared with 10000000 rows" in msg
+        assert "TestSchemaOriginal.title: max_length 16 -> 8 is a table rewrite" in msg
+        # Dropping NOT NULL, varchar to text and adding a column which is null or
+        # has a default only change the catalog on PostgreSQL.
+        assert "rank" not in msg and "summary" not in msg
+        assert "pages" not in msg and "note" not in msg
+        assert "ordering" not in msg
+
+        Spec = PytestDjangoModel(
+            "TestSchemaOriginal", (), get_dct("mysql", table_rows=10 ** 7)
+        )
+        with pytest.raises(AssertionError) as excinfo:
+            Spec.test_schema_changes(Spec)
+        msg = str(excinfo.value)
+        assert "TestSchemaOriginal.pages: adding the column is a table rewrite" in msg
+        assert "note" not in msg
+
+        Spec = PytestDjangoModel("TestSchemaOriginal", (), get_dct(table_rows=1000))
+        Spec.test_schema_changes(Spec)
+
+        Spec = PytestDjangoModel("TestSchemaOriginal", (), get_dct())
+        assert not hasattr(Spec, "test_schema_changes")
+    finally:
+        delete_django_model(APP_LABEL, original.__name__)
@@ -0,0 +1,127 @@
+# coding: utf-8
+
+import json
+
+import pytest
+from django.db.models import CharField, IntegerField
+from hypothesis import given
+from hypothesis import strategies as st
+
+from pytest_django_model.shard import (
+    SPEC_COST,
+    ModelSharder,
+    ShardError,
+    estimate_cost,
+    get_spec_id,
+    model_sharder,
+    parse_shard,
+)
+from pytest_django_model.plugin import pytest_testnodedown, write_shard_timings
+
+from .utils import Kwargs, get_meta_class
+
+
+@given(total=st.integers(min_value=1, max_value=5))
+def test_parse_shard(total):
+    for index in range(1, total + 1):
+        assert parse_shard(f"{index}/{total}") == (index, total)
+
+    for value in [f"0/{total}", f"{total + 1}/{total}", f"{total}", "a/b"]:
+        with pytest.raises(ShardError):
+            parse_shard(value)
+
+
+def test_estimate_cost():
+    # One unit per Field, Constant or Meta Option.
+    assert estimate_cost({}) == SPEC_COST
+    assert estimate_cost({"__module__": "app", "Meta": get_meta_class()}) == SPEC_COST
+    fields = {"title": CharField(max_length=8), "rank": IntegerField()}
+    assert estimate_cost(fields) == SPEC_COST + 2
+    assert estimate_cost({**fields, "COLOR": "blue"}) == SPEC_COST + 3
+    dct = {**fields, "Meta": get_meta_class(ordering=("pk",), db_table="books")}
+    assert estimate_cost(dct) == SPEC_COST + 4
+
+
+@given(
+    sizes=st.lists(st.integers(min_value=0, max_value=200), min_size=1, max_size=30),
+    total=st.integers(min_value=1, max_value=4),
+)
+def test_model_sharder(sizes, total):
+    specs = [
+        (
+            get_spec_id(f"Test{n}", {"__module__": "app"}),
+            {f"attr{i}": i for i in range(size)},
+        )
+        for n, size in enumerate(sizes)
+    ]
+
+    selections = []
+    for index in range(1, total + 1):
+        sharder = ModelSharder()
+        sharder.configure(index, total)
+        selections.append(
+            [spec_id for spec_id, dct in specs if sharder.is_selected(spec_id, dct)]
+        )
+        assert sharder.selected + sharder.deselected == len(specs)
+
+    # Every spec is selected by exactly one shard.
+    selected = [spec_id for selection in selections for spec_id in selection]
+    assert sorted(selected) == sorted(spec_id for spec_id, dct in specs)
+
+    # Shards loads differ by at most the most expensive spec.
+    costs = dict((spec_id, estimate_cost(dct)) for spec_id, dct in specs)
+    loads = [sum(costs[spec_id] for spec_id in selection) for selection in selections]
+    assert max(loads) - min(loads) <= max(costs.values())
+
+
+def test_model_sharder_timings(tmpdir):
+    path = str(tmpdir.join("timings.json"))
+    dct = {"Meta": get_meta_class()}
+
+    sharder = ModelSharder()
+    sharder.configure(1, 1, path)
+    assert sharder.is_selected("app.Slow", dct)
+    assert sharder.is_selected("app.Fast", dct)
+    sharder.record("app.Slow", 3.0)
+    sharder.record("app.Fast", 1.0)
+    sharder.write_timings()
+
+    with open(path, "r") as f:
+        timings = json.load(f)
+    assert timings["app.Slow"]["duration"] == 3.0
+    assert timings["app.Fast"]["duration"] == 1.0
+
+    # Recorded durations take precedence over estimations.
+    sharder.configure(1, 2, path)
+    assert sharder.get_cost("app.Slow", dct) == 3 * sharder.get_cost("app.Fast", dct)
+
+    # A disabled sharder selects everything.
+    sharder.configure()
+    assert not sharder.enabled
+    assert sharder.is_selected("app.Slow", dct)
+
+
+def test_model_sharder_timings__xdist(tmpdir):
+    path = str(tmpdir.join("timings.json"))
+    dct = {"Meta": get_meta_class()}
+    workers = []
+    for duration in (1.0, 4.0):
+        model_sharder.configure(1, 1, path)
+        assert model_sharder.is_selected("app.Spec", dct)
+        model_sharder.record("app.Spec", duration)
+        config = Kwargs(workeroutput={})
+        write_shard_timings(config)
+        workers.append(Kwargs(workeroutput=config.workeroutput))
+
+    try:
+        # Workers don't write the timings file, the controller merges them.
+        assert not tmpdir.join("timings.json").check()
+        model_sharder.configure(1, 1, path)
+        for worker in workers:
+            pytest_testnodedown(worker, None)
+        write_shard_timings(Kwargs())
+
+        with open(path, "r") as f:
+            assert json.load(f)["app.Spec"]["duration"] == 4.0
+    finally:
+        model_sharder.configure()
@@ -0,0 +1,115 @@
+# coding: utf-8
+
+from types import SimpleNamespace
+
+import pytest
+from django.db.models import CharField, Index
+from django.utils.translation import gettext_lazy
+
+from pytest_django_model.objects import ModelGenerator, get_model_object
+from pytest_django_model.plugin import pytest_configure_node
+from pytest_django_model.snapshot import (
+    ModelSnapshot,
+    SnapshotError,
+    snapshot_writer,
+    write_snapshot,
+)
+from pytest_django_model.utils import delete_django_model, get_model_label
+
+from .conftest import APP_LABEL
+from .utils import get_django_model
+
+
+def test_write_snapshot(tmp_path):
+    path = str(tmp_path / "models.snapshot")
+    records = {
+        "app.Book": {"meta": {"indexes": [Index(fields=["title"], name="title")]}},
+        "app.Author": {"constants": {"NAME": gettext_lazy("name")}},
+        "app.Local": {"constants": {"func": lambda: None}},
+    }
+
+    assert write_snapshot(path, records) == ["app.Local"]
+
+    snapshot = ModelSnapshot(path)
+    try:
+        assert len(snapshot) == 2
+        assert "app.Book" in snapshot and "app.Local" not in snapshot
+        assert not snapshot.cache
+
+        assert snapshot.get("app.Book") == records["app.Book"]
+        assert list(snapshot.cache) == ["app.Book"]
+        assert snapshot.get("app.Book") is snapshot.get("app.Book")
+        assert str(snapshot.get("app.Author")["constants"]["NAME"]) == "name"
+        assert snapshot.get("app.Local") is None
+    finally:
+        snapshot.close()
+
+    with open(path, "wb") as f:
+        f.write(b"\0" * 32)
+    with pytest.raises(SnapshotError):
+        ModelSnapshot(path)
+
+
+def test_model_generator__snapshot(tmp_path, monkeypatch):
+    model = get_django_model(
+        "SnapshotBook",
+        constants={"KIND": "novel"},
+        fields={"title": {"class": CharField, "attrs": {"max_length": 8}}},
+        meta={"ordering": ["title"]},
+    )
+    other = get_django_model("SnapshotOther", constants={}, fields={}, meta={})
+    try:
+        model_object = get_model_object(model)
+        path = str(tmp_path / "models.snapshot")
+        label = get_model_label(APP_LABEL, "SnapshotBook")
+        write_snapshot(path, {label: get_model_object.get_data(model)})
+
+        extracted = list()
+        get_data = ModelGenerator.get_data
+        monkeypatch.setattr(ModelGenerator, "snapshot", ModelSnapshot(path))
+        monkeypatch.setattr(
+            ModelGenerator,
+            "get_data",
+            lambda self, model: extracted.append(model) or get_data(self, model),
+        )
+
+        # Models in the snapshot aren't extracted again.
+        snapshot_object = get_model_object(model)
+        assert extracted == []
+        assert repr(snapshot_object) == repr(model_object)
+        for attr_type in ("constants", "fields", "meta"):
+            attrs = getattr(model_object._meta, attr_type)
+            snapshot_attrs = getattr(snapshot_object._meta, attr_type)
+            assert all(attrs[name] == snapshot_attrs[name] for name in attrs)
+
+        assert "id" not in get_model_object(model, has_id=False)._meta.fields
+
+        # The others are.
+        assert "SnapshotOther" in repr(get_model_object(other))
+        assert extracted == [other]
+        ModelGenerator.snapshot.close()
+    finally:
+        for django_model in [model, other]:
+            delete_django_model(APP_LABEL, django_model.__name__)
+
+
+def test_snapshot_writer():
+    model = get_django_model("SnapshotAuthor", constants={}, fields={}, meta={})
+    config = SimpleNamespace(getoption=lambda name, default=None: True)
+    nodes = [SimpleNamespace(config=config, workerinput={}) for _ in range(2)]
+    try:
+        for node in nodes:
+            pytest_configure_node(node)
+
+        path = nodes[0].workerinput["model_snapshot"]
+        assert nodes[1].workerinput["model_snapshot"] == path
+
+        snapshot = ModelSnapshot(path)
+        assert snapshot_writer.count == len(snapshot) > 0
+        assert get_model_label(APP_LABEL, "SnapshotAuthor") in snapshot
+        snapshot.close()
+    finally:
+        snapshot_writer.remove()
+        delete_django_model(APP_LABEL, model.__name__)
+
+    assert snapshot_writer.path is None
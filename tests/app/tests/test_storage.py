@@ -0,0 +1,98 @@
+# coding: utf-8
+
+import pytest
+from django.db.models import (
+    CASCADE,
+    BigAutoField,
+    CharField,
+    DecimalField,
+    ForeignKey,
+    IntegerField,
+    TextField,
+)
+
+from pytest_django_model.core import PytestDjangoModel
+from pytest_django_model.objects import get_model_object
+from pytest_django_model.storage import ROW_HEADER, estimate_storage
+from pytest_django_model.utils import delete_django_model
+
+from .conftest import APP_LABEL
+from .utils import get_django_model, get_meta_class
+
+
+def test_estimate_storage():
+    target = get_django_model(
+        "StorageTarget",
+        constants={},
+        fields={"id": {"class": BigAutoField, "attrs": {"primary_key": True}}},
+        meta={},
+    )
+    fields = {
+        "title": {"class": CharField, "attrs": {"max_length": 10, "unique": True}},
+        "rank": {"class": IntegerField, "attrs": {"null": True}},
+        "price": {
+            "class": DecimalField,
+            "attrs": {"max_digits": 8, "decimal_places": 2},
+        },
+        "target": {"class": ForeignKey, "attrs": {"to": target, "on_delete": CASCADE}},
+        "parent": {
+            "class": ForeignKey,
+            "attrs": {"to": "self", "on_delete": CASCADE, "db_index": False},
+        },
+    }
+    model = get_django_model(
+        "StorageModel",
+        constants={},
+        fields=fields,
+        meta={"index_together": [("rank", "price")]},
+    )
+    wide = get_django_model(
+        "StorageWide",
+        constants={},
+        fields={**fields, "body": {"class": TextField, "attrs": {}}},
+        meta={"index_together": [("rank", "price")]},
+    )
+
+    try:
+        estimate = estimate_storage(get_model_object(model), "postgresql")
+        assert estimate.columns == {
+            "id": 4,
+            "title": 44,
+            "rank": 4,
+            "price": 12,
+            "target": 8,
+            "parent": 4,
+        }
+        assert estimate.row_width == ROW_HEADER["postgresql"] + 1 + 76
+        assert estimate.indexes == [
+            ("id",),
+            ("title",),
+            ("target",),
+            ("rank", "price"),
+        ]
+        assert estimate.index_width == 4 * 16 + 4 + 44 + 8 + 16
+
+        # Estimations depend on the vendor, the default database one by default.
+        assert estimate_storage(get_model_object(model)).vendor == "sqlite"
+        assert estimate_storage(get_model_object(model), "mysql").columns["price"] == 8
+
+        # Specs check their Model against their budgets.
+        Spec = PytestDjangoModel(
+            "TestStorageWide",
+            (),
+            {
+                "Meta": get_meta_class(
+                    model=wide,
+                    max_row_width=estimate.row_width + 100,
+                    max_indexes=3,
+                    storage_vendor="postgresql",
+                )
+            },
+        )
+        with pytest.raises(AssertionError) as excinfo:
+            Spec.test_storage(Spec)
+        assert "Widest columns: body (2032)" in str(excinfo.value)
+        assert "StorageWide has 4 indexes, over the budget of 3" in str(excinfo.value)
+    finally:
+        for model in [target, model, wide]:
+            delete_django_model(APP_LABEL, model.__name__)
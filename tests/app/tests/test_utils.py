@@ -0,0 +1,115 @@
+# coding: utf-8
+
+from django.db.models import CASCADE, ForeignKey
+
+from pytest_django_model.utils import (
+    delete_django_model,
+    django_all_models,
+    django_apps,
+    get_model_label,
+    is_same_label,
+    isolate_django_models,
+    resolve_relations,
+)
+
+from .conftest import APP_LABEL
+from .utils import get_django_model
+
+
+def test_isolate_django_models():
+    pending_operations = {
+        key: list(operations)
+        for key, operations in django_apps._pending_operations.items()
+    }
+    models = set(django_all_models[APP_LABEL])
+
+    with isolate_django_models(APP_LABEL):
+        get_django_model("IsolatedTarget", constants={}, fields={}, meta={})
+        get_django_model(
+            "Isolated",
+            constants={},
+            fields={
+                "target": {
+                    "class": ForeignKey,
+                    "attrs": {"to": "IsolatedTarget", "on_delete": CASCADE},
+                },
+                "missing": {
+                    "class": ForeignKey,
+                    "attrs": {"to": "IsolatedMissing", "on_delete": CASCADE},
+                },
+            },
+            meta={},
+        )
+        assert {"isolated", "isolatedtarget"} <= set(django_all_models[APP_LABEL])
+        assert (APP_LABEL, "isolatedmissing") in django_apps._pending_operations
+
+    assert set(django_all_models[APP_LABEL]) == models
+    assert dict(django_apps._pending_operations) == pending_operations
+
+
+def test_isolate_django_models__caches():
+    target = get_django_model("IsolatedCacheTarget", constants={}, fields={}, meta={})
+    other = get_django_model("IsolatedCacheOther", constants={}, fields={}, meta={})
+
+    try:
+        with isolate_django_models(APP_LABEL):
+            get_django_model(
+                "IsolatedCache",
+                constants={},
+                fields={
+                    "target": {
+                        "class": ForeignKey,
+                        "attrs": {"to": target, "on_delete": CASCADE},
+                    }
+                },
+                meta={},
+            )
+            assert len(target._meta.related_objects) == 1
+            other._meta.fields
+
+        # Only the caches of the related models are expired.
+        assert "fields" in other._meta.__dict__
+        assert "related_objects" not in target._meta.__dict__
+        assert target._meta.related_objects == ()
+    finally:
+        for model in [target, other]:
+            delete_django_model(APP_LABEL, model.__name__)
+
+
+def test_resolve_relations():
+    target = get_django_model("ResolvedTarget", constants={}, fields={}, meta={})
+
+    try:
+        models = resolve_relations(
+            APP_LABEL,
+            [
+                "ResolvedTarget",
+                "resolvedtarget",
+                f"{APP_LABEL}.ResolvedTarget",
+                f"{APP_LABEL}.Missing",
+                "other.ResolvedTarget",
+            ],
+        )
+        assert models == {
+            "ResolvedTarget": target,
+            "resolvedtarget": target,
+            f"{APP_LABEL}.ResolvedTarget": target,
+            f"{APP_LABEL}.Missing": None,
+            "other.ResolvedTarget": None,
+        }
+    finally:
+        delete_django_model(APP_LABEL, target.__name__)
+
+    # Deleted models aren't resolved anymore.
+    assert resolve_relations(APP_LABEL, ["ResolvedTarget"]) == {"ResolvedTarget": None}
+
+
+def test_get_model_label():
+    label = get_model_label(APP_LABEL, "Book")
+    assert get_model_label(APP_LABEL, "Book", lower=False) == f"{APP_LABEL}.Book"
+    assert label in (f"{APP_LABEL}.Book", f"{APP_LABEL}.book")
+
+    assert is_same_label(f"{APP_LABEL}.Book", label)
+    assert is_same_label(f"{APP_LABEL}.book", label)
+    assert not is_same_label(f"{APP_LABEL}.Books", label)
+    assert not is_same_label(None, label)
@@ -1,11 +1,13 @@
 # coding: utf-8
 
 from collections import Counter
+from contextlib import contextmanager
 from operator import attrgetter
 
+from django.db import connection
 from django.db.models import Model
 
-from pytest_django_model.utils import django_all_models
+from pytest_django_model.utils import delete_django_model, django_all_models
 
 from .conftest import APP_LABEL
 
@@ -74,3 +76,22 @@ def get_django_model(name, constants, fields, meta, parents=None):
     bases = parents if parents else (Model,)
 
     return type(name, bases, dct)
+
+
+@contextmanager
+def django_tables(*models):
+    """Create the tables of models on the test database, then delete them and
+    unregister models.
+    """
+    with connection.schema_editor() as editor:
+        for model in models:
+            editor.create_model(model)
+
+    try:
+        yield models
+    finally:
+        with connection.schema_editor() as editor:
+            for model in reversed(models):
+                editor.delete_model(model)
+        for model in models:
+            delete_django_model(APP_LABEL, model.__name__)
@@ -1,3 +1,5 @@
 # coding: utf-8
 
 DEBUG, SECRET_KEY, INSTALLED_APPS = True, " ", ["app.AppConfig"]
+DATABASES = {"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}}
+DEFAULT_AUTO_FIELD = "django.db.models.AutoField"